@@ -25,9 +25,10 @@ except ImportError:
 class AdvancedPayslipExtractor:
     """Extracteur complet pour toutes les données possibles des bulletins"""
     
-    def __init__(self, use_learning=True):
+    def __init__(self, use_learning=True, model=None):
         print("🔍 Initialisation de l'extracteur avancé...")
-        self.model = ocr_predictor(pretrained=True)
+        # Un prédicteur déjà chargé (ex: celui de l'API) peut être réutilisé
+        self.model = model if model is not None else ocr_predictor(pretrained=True)
         print("✅ Modèle OCR chargé avec succès!")
         
         # Initialiser le système d'apprentissage si disponible
@@ -51,16 +52,40 @@ class AdvancedPayslipExtractor:
         doc = DocumentFile.from_pdf(pdf_path)
         result = self.model(doc)
         
-        full_text = ""
-        for page in result.pages:
-            for block in page.blocks:
-                for line in block.lines:
-                    line_text = " ".join([word.value for word in line.words])
-                    full_text += line_text + "\n"
+        return self.extract_from_result(result, self._extract_file_info(pdf_path))
+    
+    def extract_from_bytes(self, data, file_name: str) -> Dict[str, Any]:
+        """Extraire TOUTES les données d'un PDF déjà en mémoire (bytes, bytearray ou memoryview)
+        
+        Le contenu est passé tel quel à pypdfium2 : pas de fichier temporaire ni de copie.
+        """
+        print(f"📄 Extraction complète de: {file_name}")
+        
+        return self.extract_from_result(self.ocr_from_bytes(data), self.bytes_file_info(data, file_name))
+    
+    def ocr_from_bytes(self, data):
+        """OCR d'un PDF en mémoire : le résultat docTR ne dépend pas de l'apprentissage"""
+        doc = DocumentFile.from_pdf(data)
+        return self.model(doc)
+    
+    def bytes_file_info(self, data, file_name: str) -> Dict[str, str]:
+        """Informations sur un fichier en mémoire"""
+        return {
+            'file_name': file_name,
+            'file_size': f"{memoryview(data).nbytes / 1024:.1f} KB",
+            'extraction_date': datetime.now().isoformat(),
+            'file_path': ''
+        }
+    
+    def extract_from_result(self, result, file_info: Dict[str, str]) -> Dict[str, Any]:
+        """Extraire TOUTES les données d'un résultat OCR docTR déjà calculé"""
+        # Une ligne de texte par ligne OCR
+        full_text = result.render(page_break="\n", block_break="\n")
+        full_text = full_text + "\n" if full_text else ""
         
         # Structure complète des données
         payslip_data = {
-            'file_info': self._extract_file_info(pdf_path),
+            'file_info': file_info,
             'employer_info': self._extract_employer_info(full_text),
             'employee_info': self._extract_employee_info(full_text),
             'employment_details': self._extract_employment_details(full_text),
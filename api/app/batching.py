@@ -0,0 +1,122 @@
+# Copyright (C) 2021-2025, Mindee.
+
+# This program is licensed under the Apache License 2.0.
+# See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
+
+
+import asyncio
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import numpy as np
+
+from doctr.io import Document
+
+from . import config as cfg
+from .schemas import DetectionIn, KIEIn, OCRIn, RecognitionIn
+from .utils import BoundedExecutor, executor
+from .vision import predict
+
+__all__ = ["RequestBatcher", "batcher"]
+
+
+def _split_output(out: Any, start: int, end: int) -> Any:
+    """Extract the predictions of a range of inputs from the output of a predictor"""
+    if isinstance(out, Document):
+        pages = out.pages[start:end]
+        for idx, page in enumerate(pages):
+            page.page_idx = idx
+        # KIEDocument shares the same constructor
+        return type(out)(pages=pages)
+    return out[start:end]
+
+
+class RequestBatcher:
+    """Gathers the inputs of concurrent requests sharing the same configuration, to run them in a single pass
+
+    Inputs are accumulated until the oldest pending one has waited `max_wait` seconds, or until `max_batch_size`
+    inputs are pending, whichever comes first.
+
+    Args:
+        executor: the executor running the inference
+        max_batch_size: maximum number of inputs (pages or crops) processed in a single pass
+        max_wait: maximum time in seconds spent waiting for other requests
+        predict_fn: function running the predictor of a request on a list of inputs
+    """
+
+    def __init__(
+        self,
+        executor: BoundedExecutor,
+        max_batch_size: int,
+        max_wait: float,
+        predict_fn: Callable[[Any, list[np.ndarray]], Any] = predict,
+    ) -> None:
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.predict_fn = predict_fn
+        # Only accessed from the event loop, so they don't need a lock
+        self._pending: dict[Hashable, list[tuple[list[np.ndarray], asyncio.Future]]] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        # The event loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    async def run(self, request: KIEIn | OCRIn | RecognitionIn | DetectionIn, inputs: list[np.ndarray]) -> Any:
+        """Run the predictor of the request on the inputs, along with the ones of concurrent requests
+
+        Args:
+            request: input request
+            inputs: list of images or pages
+
+        Returns:
+            the output of the predictor for these inputs only
+        """
+        if self.max_batch_size <= 1 or self.max_wait <= 0 or len(inputs) >= self.max_batch_size:
+            return await self.executor.run(self.predict_fn, request, inputs)
+
+        loop = asyncio.get_running_loop()
+        # Thresholds are part of the key, since a batch is processed with a single configuration
+        key = (type(request).__name__, *sorted(request.model_dump().items()))
+        future = loop.create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((inputs, future))
+        if sum(len(item[0]) for item in pending) >= self.max_batch_size:
+            self._flush(key, request)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.max_wait, self._flush, key, request)
+
+        return await future
+
+    def _flush(self, key: Hashable, request: KIEIn | OCRIn | RecognitionIn | DetectionIn) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._pending.pop(key, [])
+        if len(items) > 0:
+            task = asyncio.ensure_future(self._run_batch(request, items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self,
+        request: KIEIn | OCRIn | RecognitionIn | DetectionIn,
+        items: list[tuple[list[np.ndarray], asyncio.Future]],
+    ) -> None:
+        samples = [sample for inputs, _ in items for sample in inputs]
+        try:
+            out = await self.executor.run(self.predict_fn, request, samples)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        start = 0
+        for inputs, future in items:
+            # The request may have been cancelled meanwhile (e.g. client disconnection)
+            if not future.done():
+                future.set_result(_split_output(out, start, start + len(inputs)))
+            start += len(inputs)
+
+
+batcher = RequestBatcher(executor, cfg.MAX_BATCH_SIZE, cfg.BATCH_WAIT_MS / 1000)
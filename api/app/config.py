@@ -11,3 +11,25 @@ PROJECT_NAME: str = "docTR API template"
 PROJECT_DESCRIPTION: str = "Template API for Optical Character Recognition"
 VERSION: str = doctr.__version__
 DEBUG: bool = os.environ.get("DEBUG", "") != "False"
+# Maximum number of predictors (one per architecture & configuration) kept in memory
+PREDICTOR_CACHE_SIZE: int = int(os.environ.get("PREDICTOR_CACHE_SIZE", 4))
+# Directory of the predictor snapshots: built predictors are saved there, and loaded from there by the next processes
+PREDICTOR_SNAPSHOT_DIR: str | None = os.environ.get("PREDICTOR_SNAPSHOT_DIR") or None
+# Comma-separated tasks whose default predictor is loaded at startup (among ocr, kie, detection, recognition)
+WARMUP_TASKS: list[str] = [task for task in os.environ.get("WARMUP_TASKS", "ocr").split(",") if task]
+# Number of threads running inference & PDF decoding out of the event loop
+INFERENCE_WORKERS: int = int(os.environ.get("INFERENCE_WORKERS", 1))
+# Maximum number of running & waiting jobs before answering with a 503
+MAX_PENDING_JOBS: int = int(os.environ.get("MAX_PENDING_JOBS", 16))
+# Inputs of concurrent requests sharing a configuration are processed together, up to this number of pages (or crops)
+MAX_BATCH_SIZE: int = int(os.environ.get("MAX_BATCH_SIZE", 16))
+# Maximum time spent waiting for concurrent requests to fill a batch (0 disables batching)
+BATCH_WAIT_MS: float = float(os.environ.get("BATCH_WAIT_MS", 10))
+# Directory holding the persistent job queue (database & uploaded files)
+JOBS_DIR: str = os.environ.get("JOBS_DIR", "jobs")
+# Number of processes running the queued jobs (0 disables job processing)
+JOB_WORKERS: int = int(os.environ.get("JOB_WORKERS", 1))
+# Time in seconds between two checks of an empty queue
+JOB_POLL_INTERVAL: float = float(os.environ.get("JOB_POLL_INTERVAL", 1))
+# Maximum number of OCR results of payslips kept in memory, so that re-submitted files are not processed again
+OCR_CACHE_SIZE: int = int(os.environ.get("OCR_CACHE_SIZE", 128))
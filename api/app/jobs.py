@@ -0,0 +1,229 @@
+# Copyright (C) 2021-2025, Mindee.
+
+# This program is licensed under the Apache License 2.0.
+# See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
+
+
+import json
+import multiprocessing as mp
+import sqlite3
+import time
+import uuid
+from collections.abc import Callable
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from .payslip import extract_payslip
+from .schemas import OCRIn
+from .utils import read_document
+from .vision import init_predictor, predict
+
+__all__ = ["JobStore", "JobWorkers"]
+
+
+class JobStore:
+    """Persistent job queue: jobs are tracked in a SQLite database, uploaded files are kept next to it
+
+    The store can be shared by several processes, it survives restarts.
+
+    Args:
+        root: the directory holding the database and the uploaded files
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.files_dir = self.root / "files"
+        self.files_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.root / "jobs.db"
+        with closing(self._connect()) as conn:
+            # Readers don't block the writer, which matters with several worker processes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    content_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL,
+                    result TEXT,
+                    error TEXT
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode, transactions are opened explicitly when needed
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def file_path(self, job_id: str) -> Path:
+        return self.files_dir / job_id
+
+    def submit(self, filename: str, content_type: str, data: bytes) -> str:
+        """Queue a new job
+
+        Args:
+            filename: the name of the uploaded file
+            content_type: the MIME type of the uploaded file
+            data: the content of the uploaded file
+
+        Returns:
+            str: the identifier of the job
+        """
+        job_id = uuid.uuid4().hex
+        self.file_path(job_id).write_bytes(data)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, filename, content_type, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, filename, content_type, time.time()),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """Retrieve a job
+
+        Args:
+            job_id: the identifier of the job
+
+        Returns:
+            dict[str, Any] | None: the job, or None if it doesn't exist
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+        return job
+
+    def claim(self) -> dict[str, Any] | None:
+        """Atomically mark the oldest queued job as running
+
+        Returns:
+            dict[str, Any] | None: the claimed job, or None if the queue is empty
+        """
+        with closing(self._connect()) as conn:
+            # Take the write lock upfront, so that two workers can't claim the same job
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1",
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute("UPDATE jobs SET status = 'running', started_at = ? WHERE id = ?", (time.time(), row["id"]))
+            conn.execute("COMMIT")
+        return self.get(row["id"])
+
+    def complete(self, job_id: str, result: dict[str, Any]) -> None:
+        self._finish(job_id, "done", result=json.dumps(result, ensure_ascii=False))
+
+    def fail(self, job_id: str, error: str) -> None:
+        self._finish(job_id, "failed", error=error)
+
+    def _finish(self, job_id: str, status: str, result: str | None = None, error: str | None = None) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, result = ?, error = ? WHERE id = ?",
+                (status, time.time(), result, error, job_id),
+            )
+        # The uploaded file isn't needed anymore
+        self.file_path(job_id).unlink(missing_ok=True)
+
+    def requeue_running(self) -> int:
+        """Put back in the queue the jobs that were interrupted (e.g. by a restart)
+
+        Returns:
+            int: the number of requeued jobs
+        """
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL WHERE status = 'running'"
+            ).rowcount
+
+
+def _process_job(store: JobStore, job: dict[str, Any]) -> dict[str, Any]:
+    """Run the OCR & the payslip extraction of a job, with the predictor of the worker"""
+    data = store.file_path(job["id"]).read_bytes()
+    pages = read_document(data, job["content_type"])
+    return extract_payslip(predict(OCRIn(), pages), job["filename"], len(data))
+
+
+def _worker_loop(
+    root: str | Path,
+    stop_event: Any,
+    poll_interval: float,
+    process_fn: Callable[[JobStore, dict[str, Any]], dict[str, Any]] = _process_job,
+) -> None:
+    """Process the queued jobs until the stop event is set"""
+    store = JobStore(root)
+    while not stop_event.is_set():
+        job = store.claim()
+        if job is None:
+            stop_event.wait(poll_interval)
+            continue
+        try:
+            store.complete(job["id"], process_fn(store, job))
+        except Exception as e:
+            store.fail(job["id"], f"{type(e).__name__}: {e}")
+
+
+def _warm_worker_loop(root: str | Path, stop_event: Any, poll_interval: float) -> None:
+    # Each worker holds its own predictor, loaded once before processing any job
+    init_predictor(OCRIn())
+    _worker_loop(root, stop_event, poll_interval)
+
+
+class JobWorkers:
+    """Pool of processes consuming the jobs of a store
+
+    Args:
+        store: the job store to consume
+        num_workers: the number of worker processes
+        poll_interval: time in seconds between two checks of an empty queue
+        target: the main function of each worker process
+    """
+
+    def __init__(
+        self,
+        store: JobStore,
+        num_workers: int,
+        poll_interval: float = 1.0,
+        target: Callable = _warm_worker_loop,
+    ) -> None:
+        self.store = store
+        self.num_workers = num_workers
+        self.poll_interval = poll_interval
+        self.target = target
+        # Spawn rather than fork: torch & the event loop of the server don't survive a fork well
+        self._ctx = mp.get_context("spawn")
+        self._stop_event = self._ctx.Event()
+        self._processes: list[mp.process.BaseProcess] = []
+
+    def start(self) -> None:
+        # Jobs which were running when the service stopped are processed again
+        self.store.requeue_running()
+        self._stop_event.clear()
+        self._processes = [
+            self._ctx.Process(
+                target=self.target,
+                args=(str(self.store.root), self._stop_event, self.poll_interval),
+                daemon=True,
+                name=f"job-worker-{idx}",
+            )
+            for idx in range(self.num_workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
@@ -4,14 +4,37 @@
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
 import time
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.openapi.utils import get_openapi
 
 from app import config as cfg
-from app.routes import detection, kie, ocr, recognition
+from app.jobs import JobStore, JobWorkers
+from app.routes import detection, jobs, kie, ocr, payslip, recognition
+from app.schemas import ErrorOut, OCRStreamOut
+from app.vision import warm_up
 
-app = FastAPI(title=cfg.PROJECT_NAME, description=cfg.PROJECT_DESCRIPTION, debug=cfg.DEBUG, version=cfg.VERSION)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the most used predictors once, before serving any request
+    warm_up(cfg.WARMUP_TASKS)
+    # The job queue is only created when the service starts, not when the app is imported
+    app.state.job_store = JobStore(cfg.JOBS_DIR)
+    app.state.job_workers = JobWorkers(app.state.job_store, cfg.JOB_WORKERS, cfg.JOB_POLL_INTERVAL)
+    app.state.job_workers.start()
+    yield
+    app.state.job_workers.stop(timeout=30)
+
+
+app = FastAPI(
+    title=cfg.PROJECT_NAME,
+    description=cfg.PROJECT_DESCRIPTION,
+    debug=cfg.DEBUG,
+    version=cfg.VERSION,
+    lifespan=lifespan,
+)
 
 
 # Routing
@@ -19,6 +42,8 @@ app.include_router(recognition.router, prefix="/recognition", tags=["recognition
 app.include_router(detection.router, prefix="/detection", tags=["detection"])
 app.include_router(ocr.router, prefix="/ocr", tags=["ocr"])
 app.include_router(kie.router, prefix="/kie", tags=["kie"])
+app.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+app.include_router(payslip.router, prefix="/payslip", tags=["payslip"])
 
 
 # Middleware
@@ -41,6 +66,13 @@ def custom_openapi():
         description=cfg.PROJECT_DESCRIPTION,
         routes=app.routes,
     )
+    # Records of the streaming routes, which FastAPI doesn't collect from non-JSON responses
+    schemas = openapi_schema.setdefault("components", {}).setdefault("schemas", {})
+    for model in (OCRStreamOut, ErrorOut):
+        schema = model.model_json_schema(ref_template="#/components/schemas/{model}")
+        for name, definition in schema.pop("$defs", {}).items():
+            schemas.setdefault(name, definition)
+        schemas[model.__name__] = schema
     app.openapi_schema = openapi_schema
     return app.openapi_schema
 
@@ -0,0 +1,86 @@
+# Copyright (C) 2021-2025, Mindee.
+
+# This program is licensed under the Apache License 2.0.
+# See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
+
+
+import copy
+import hashlib
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+from doctr.io import Document
+
+from . import config as cfg
+from .schemas import OCRIn
+from .vision import init_predictor
+
+__all__ = ["OCRCache", "extract_payslip", "ocr_cache"]
+
+
+class OCRCache:
+    """LRU cache of OCR results, keyed by the hash of the processed file
+
+    Args:
+        max_size: maximum number of OCR results kept in memory
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Document] = OrderedDict()
+
+    @staticmethod
+    def key(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def get(self, key: str) -> Document | None:
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: Document) -> None:
+        if self.max_size <= 0:
+            return
+        # The cache holds its own copy, without the page images which are not needed for the extraction
+        self._entries[key] = copy.deepcopy(result, memo={id(page.page): None for page in result.pages})
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+ocr_cache = OCRCache(cfg.OCR_CACHE_SIZE)
+
+
+@lru_cache(maxsize=1)
+def _get_extractor() -> Any:
+    # The extractor lives at the root of the repository, which needs to be on the PYTHONPATH
+    from advanced_extractor import AdvancedPayslipExtractor
+
+    # Reuse the pooled predictor rather than letting the extractor load its own
+    return AdvancedPayslipExtractor(model=init_predictor(OCRIn()))
+
+
+def extract_payslip(result: Document, filename: str, file_size: int) -> dict[str, Any]:
+    """Extract the payslip fields from an OCR result
+
+    Args:
+        result: the OCR result of the payslip
+        filename: the name of the uploaded file
+        file_size: the size of the uploaded file, in bytes
+
+    Returns:
+        dict[str, Any]: the extracted fields, grouped by section
+    """
+    file_info = {
+        "file_name": filename,
+        "file_size": f"{file_size / 1024:.1f} KB",
+        "extraction_date": datetime.now().isoformat(),
+        "file_path": "",
+    }
+    return _get_extractor().extract_from_result(result, file_info)
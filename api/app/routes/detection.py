@@ -6,8 +6,9 @@
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 
+from app.batching import batcher
 from app.schemas import DetectionIn, DetectionOut
-from app.utils import get_documents, resolve_geometry
+from app.utils import executor, get_documents, resolve_geometry
 from app.vision import init_predictor
 from doctr.file_utils import CLASS_NAME
 
@@ -18,11 +19,14 @@ router = APIRouter()
 async def text_detection(request: DetectionIn = Depends(), files: list[UploadFile] = [File(...)]):
     """Runs docTR text detection model to analyze the input image"""
     try:
-        predictor = init_predictor(request)
+        # Build (or fetch) the predictor beforehand, so that invalid configurations are reported as such
+        await executor.run(init_predictor, request)
         content, filenames = await get_documents(files)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+    out = await batcher.run(request, content)
+
     return [
         DetectionOut(
             name=filename,
@@ -31,5 +35,5 @@ async def text_detection(request: DetectionIn = Depends(), files: list[UploadFil
                 for geom in doc[CLASS_NAME]
             ],
         )
-        for doc, filename in zip(predictor(content), filenames)
+        for doc, filename in zip(out, filenames)
     ]
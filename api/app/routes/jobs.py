@@ -0,0 +1,71 @@
+# Copyright (C) 2021-2025, Mindee.
+
+# This program is licensed under the Apache License 2.0.
+# See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
+
+
+import asyncio
+import time
+from typing import Any
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.jobs import JobStore
+from app.schemas import JobOut, JobResultOut
+from app.utils import check_files
+
+router = APIRouter()
+
+
+def get_job_store(request: Request) -> JobStore:
+    """The job store of the app, created on startup"""
+    return request.app.state.job_store
+
+
+def _submit(store: JobStore, uploads: list[tuple[str, str, bytes]]) -> list[dict[str, Any] | None]:
+    return [store.get(store.submit(*upload)) for upload in uploads]
+
+
+@router.post("/", response_model=list[JobOut], status_code=status.HTTP_202_ACCEPTED, summary="Submit payslips")
+async def submit_jobs(files: list[UploadFile] = [File(...)], job_store: JobStore = Depends(get_job_store)):
+    """Queues one payslip extraction job per file, to be processed in the background"""
+    try:
+        check_files(files)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    uploads = [(file.filename or "", file.content_type or "", await file.read()) for file in files]
+    # The database & the files are written out of the event loop
+    jobs = await run_in_threadpool(_submit, job_store, uploads)
+    return [JobOut(**job) for job in jobs]  # type: ignore[arg-type]
+
+
+@router.get("/{job_id}", response_model=JobOut, status_code=status.HTTP_200_OK, summary="Get the status of a job")
+async def get_job(
+    job_id: str, wait: float = Query(default=0, ge=0, le=60), job_store: JobStore = Depends(get_job_store)
+):
+    """Returns the status of a job, waiting up to `wait` seconds for it to be finished (long polling)"""
+    deadline = time.monotonic() + wait
+    job = await run_in_threadpool(job_store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    while job["status"] in ("queued", "running") and time.monotonic() < deadline:
+        await asyncio.sleep(min(0.5, deadline - time.monotonic()))
+        job = await run_in_threadpool(job_store.get, job_id)
+    return JobOut(**job)  # type: ignore[arg-type]
+
+
+@router.get(
+    "/{job_id}/result", response_model=JobResultOut, status_code=status.HTTP_200_OK, summary="Get the result of a job"
+)
+async def get_job_result(job_id: str, job_store: JobStore = Depends(get_job_store)):
+    """Returns the extracted payslip fields of a finished job"""
+    job = await run_in_threadpool(job_store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=job["error"])
+    if job["status"] != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+    return JobResultOut(**job)
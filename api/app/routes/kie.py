@@ -6,8 +6,9 @@
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 
+from app.batching import batcher
 from app.schemas import KIEElement, KIEIn, KIEOut
-from app.utils import get_documents, resolve_geometry
+from app.utils import executor, get_documents, resolve_geometry
 from app.vision import init_predictor
 
 router = APIRouter()
@@ -17,12 +18,13 @@ router = APIRouter()
 async def perform_kie(request: KIEIn = Depends(), files: list[UploadFile] = [File(...)]):
     """Runs docTR KIE model to analyze the input image"""
     try:
-        predictor = init_predictor(request)
+        # Build (or fetch) the predictor beforehand, so that invalid configurations are reported as such
+        await executor.run(init_predictor, request)
         content, filenames = await get_documents(files)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    out = predictor(content)
+    out = await batcher.run(request, content)
 
     results = [
         KIEOut(
@@ -4,63 +4,238 @@
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from collections.abc import AsyncIterator
+from typing import Any, Literal
 
-from app.schemas import OCRBlock, OCRIn, OCRLine, OCROut, OCRPage, OCRWord
-from app.utils import get_documents, resolve_geometry
+import numpy as np
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
+
+from app.batching import batcher
+from app.schemas import ErrorOut, OCRColumnarOut, OCRIn, OCROut, OCRStreamOut
+from app.utils import FastJSONResponse, check_files, dumps, executor, get_documents, iter_pages
 from app.vision import init_predictor
+from doctr.io import Artefact, Page, WordTable
+from doctr.utils.geometry import resolve_enclosing_rbbox
 
 router = APIRouter()
 
+# Each record of a stream is the result of a page, or an error (the models are registered in the OpenAPI components
+# by `app.main.custom_openapi`, as FastAPI only documents the models of JSON responses)
+_STREAM_RECORD = {
+    "schema": {"oneOf": [{"$ref": f"#/components/schemas/{model.__name__}"} for model in (OCRStreamOut, ErrorOut)]}
+}
+
+
+def _round(values: np.ndarray) -> list[float]:
+    return np.round(np.asarray(values, dtype=np.float64), 2).tolist()
+
+
+def _page_header(page: Page, name: str) -> dict[str, Any]:
+    return {"name": name, "orientation": page.orientation, "language": page.language, "dimensions": page.dimensions}
+
+
+def _group_boxes(table: WordTable, word_offsets: np.ndarray, artefacts: list[list[Artefact]] | None = None) -> list:
+    """Smallest boxes enclosing each group of consecutive words (and the artefacts of the group), as elements do"""
+    if table.geometries.ndim == 2:
+        starts = word_offsets[:-1]
+        boxes = np.concatenate(
+            [
+                np.minimum.reduceat(table.geometries[:, :2], starts, axis=0),
+                np.maximum.reduceat(table.geometries[:, 2:], starts, axis=0),
+            ],
+            axis=1,
+        )
+        for idx, group_artefacts in enumerate(artefacts or []):
+            if len(group_artefacts) > 0:
+                points = np.concatenate([boxes[idx].reshape(2, 2)] + [np.asarray(a.geometry) for a in group_artefacts])
+                boxes[idx] = np.concatenate([points.min(axis=0), points.max(axis=0)])
+        return boxes.tolist()
+    offsets = word_offsets.tolist()
+    return [
+        resolve_enclosing_rbbox(
+            list(table.geometries[start:end]) + [np.asarray(a.geometry) for a in (artefacts[idx] if artefacts else [])]
+        )
+        .reshape(-1)
+        .tolist()
+        for idx, (start, end) in enumerate(zip(offsets[:-1], offsets[1:]))
+    ]
+
+
+def _columns(table: WordTable) -> dict[str, dict[str, list]]:
+    """Columns of the blocks, lines & words of a word table, without instantiating any element"""
+    if len(table) == 0:
+        return {
+            "blocks": {"geometry": [], "objectness_score": []},
+            "lines": {"geometry": [], "objectness_score": [], "block_idx": []},
+            "words": {
+                "value": [],
+                "geometry": [],
+                "objectness_score": [],
+                "confidence": [],
+                "crop_orientation": [],
+                "line_idx": [],
+            },
+        }
+
+    # Word offsets of each block
+    block_word_offsets = table.line_offsets[table.block_offsets]
+    # Same scores as the ones resolved by line & block elements: the mean of the scores of their words
+    if table.line_objectness_scores is None:
+        line_scores = np.add.reduceat(table.objectness_scores, table.line_offsets[:-1]) / np.diff(table.line_offsets)
+    else:
+        line_scores = table.line_objectness_scores
+    if table.block_objectness_scores is None:
+        block_scores = np.add.reduceat(table.objectness_scores, block_word_offsets[:-1]) / np.diff(block_word_offsets)
+    else:
+        block_scores = table.block_objectness_scores
+
+    blocks = {
+        "geometry": (
+            _group_boxes(table, block_word_offsets, table.artefacts)
+            if table.block_geometries is None
+            else table.block_geometries.reshape(table.num_blocks, -1).tolist()
+        ),
+        "objectness_score": _round(block_scores),
+    }
+    lines = {
+        "geometry": (
+            _group_boxes(table, table.line_offsets)
+            if table.line_geometries is None
+            else table.line_geometries.reshape(table.num_lines, -1).tolist()
+        ),
+        "objectness_score": _round(line_scores),
+        "block_idx": np.repeat(np.arange(table.num_blocks), np.diff(table.block_offsets)).tolist(),
+    }
+    words = {
+        "value": table.values,
+        "geometry": table.geometries.reshape(len(table), -1).tolist(),
+        "objectness_score": _round(table.objectness_scores),
+        "confidence": _round(table.confidences),
+        # Missing crop orientation confidences are stored as NaN, the only value not equal to itself
+        "crop_orientation": [
+            {"value": angle, "confidence": None if conf != conf else conf}
+            for angle, conf in zip(table.crop_angles.tolist(), table.crop_confidences.tolist())
+        ],
+        "line_idx": np.repeat(np.arange(table.num_lines), np.diff(table.line_offsets)).tolist(),
+    }
+    return {"blocks": blocks, "lines": lines, "words": words}
+
+
+def _to_ocr_columns(page: Page, name: str) -> dict[str, Any]:
+    """Serialize a page following the `OCRColumnarOut` schema: one array per attribute instead of nested objects"""
+    return {**_page_header(page, name), **_columns(page.word_table)}
 
-@router.post("/", response_model=list[OCROut], status_code=status.HTTP_200_OK, summary="Perform OCR")
-async def perform_ocr(request: OCRIn = Depends(), files: list[UploadFile] = [File(...)]):
-    """Runs docTR OCR model to analyze the input image"""
+
+def _to_ocr_out(page: Page, name: str) -> dict[str, Any]:
+    """Serialize a page following the `OCROut` schema, without instantiating (and validating) any model
+
+    The nested objects are sliced from the columns of the word table of the page.
+    """
+    table = page.word_table
+    columns = _columns(table)
+    blocks, lines, words = columns["blocks"], columns["lines"], columns["words"]
+    word_offsets, line_offsets = table.line_offsets.tolist(), table.block_offsets.tolist()
+    word_keys = ["value", "geometry", "objectness_score", "confidence", "crop_orientation"]
+    word_items = [dict(zip(word_keys, item)) for item in zip(*(words[key] for key in word_keys))]
+    return {
+        **_page_header(page, name),
+        "items": [
+            {
+                "blocks": [
+                    {
+                        "geometry": blocks["geometry"][block_idx],
+                        "objectness_score": blocks["objectness_score"][block_idx],
+                        "lines": [
+                            {
+                                "geometry": lines["geometry"][line_idx],
+                                "objectness_score": lines["objectness_score"][line_idx],
+                                "words": word_items[word_offsets[line_idx] : word_offsets[line_idx + 1]],
+                            }
+                            for line_idx in range(line_offsets[block_idx], line_offsets[block_idx + 1])
+                        ],
+                    }
+                    for block_idx in range(table.num_blocks)
+                ]
+            }
+        ],
+    }
+
+
+@router.post(
+    "/",
+    response_model=list[OCROut] | list[OCRColumnarOut],
+    status_code=status.HTTP_200_OK,
+    summary="Perform OCR",
+)
+async def perform_ocr(
+    request: OCRIn = Depends(),
+    files: list[UploadFile] = [File(...)],
+    output_format: Literal["nested", "columnar"] = Query(default="nested"),
+):
+    """Runs docTR OCR model to analyze the input image
+
+    With `output_format=columnar`, each page is returned as parallel arrays (values, geometries, scores, ...)
+    rather than as nested blocks, lines and words.
+    """
     try:
         # generator object to list
         content, filenames = await get_documents(files)
-        predictor = init_predictor(request)
+        # Build (or fetch) the predictor beforehand, so that invalid configurations are reported as such
+        await executor.run(init_predictor, request)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    out = predictor(content)
-
-    results = [
-        OCROut(
-            name=filenames[i],
-            orientation=page.orientation,
-            language=page.language,
-            dimensions=page.dimensions,
-            items=[
-                OCRPage(
-                    blocks=[
-                        OCRBlock(
-                            geometry=resolve_geometry(block.geometry),
-                            objectness_score=round(block.objectness_score, 2),
-                            lines=[
-                                OCRLine(
-                                    geometry=resolve_geometry(line.geometry),
-                                    objectness_score=round(line.objectness_score, 2),
-                                    words=[
-                                        OCRWord(
-                                            value=word.value,
-                                            geometry=resolve_geometry(word.geometry),
-                                            objectness_score=round(word.objectness_score, 2),
-                                            confidence=round(word.confidence, 2),
-                                            crop_orientation=word.crop_orientation,
-                                        )
-                                        for word in line.words
-                                    ],
-                                )
-                                for line in block.lines
-                            ],
-                        )
-                        for block in page.blocks
-                    ]
-                )
-            ],
-        )
-        for i, page in enumerate(out.pages)
-    ]
+    out = await batcher.run(request, content)
+
+    serialize = _to_ocr_columns if output_format == "columnar" else _to_ocr_out
+    # The response is built from plain objects: skip the validation of thousands of word models
+    return FastJSONResponse([serialize(page, filenames[i]) for i, page in enumerate(out.pages)])
+
+
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Perform OCR, streaming the result of each page",
+    responses={
+        200: {
+            "description": "One record per page, or an error record",
+            "content": {"application/x-ndjson": _STREAM_RECORD, "text/event-stream": _STREAM_RECORD},
+        }
+    },
+)
+async def perform_ocr_stream(
+    request: OCRIn = Depends(),
+    files: list[UploadFile] = [File(...)],
+    stream_format: Literal["ndjson", "sse"] = Query(default="ndjson"),
+):
+    """Runs docTR OCR model on the input documents, and streams the result of each page as soon as it is available
+
+    Each page result follows the `OCRStreamOut` schema, sent either as a line of NDJSON or as a server-sent event.
+    If an error occurs after the first page, it is sent as an `{"error": ...}` object (or an `error` event).
+    """
+    try:
+        check_files(files)
+        # Build (or fetch) the predictor beforehand, so that invalid configurations are reported as such
+        await executor.run(init_predictor, request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def _format(payload: str, event: str | None = None) -> str:
+        if stream_format == "sse":
+            return f"event: {event}\ndata: {payload}\n\n" if event else f"data: {payload}\n\n"
+        return f"{payload}\n"
+
+    async def _stream() -> AsyncIterator[str]:
+        try:
+            # Pages are decoded & processed one by one, only a single one is held in memory
+            async for page, filename, page_idx in iter_pages(files):
+                out = await batcher.run(request, [page])
+                yield _format(dumps({**_to_ocr_out(out.pages[0], filename), "page_idx": page_idx}))
+        except (HTTPException, ValueError) as e:
+            detail = e.detail if isinstance(e, HTTPException) else str(e)
+            yield _format(dumps({"error": detail}), event="error")
 
-    return results
+    media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(_stream(), media_type=media_type)
@@ -0,0 +1,38 @@
+# Copyright (C) 2021-2025, Mindee.
+
+# This program is licensed under the Apache License 2.0.
+# See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
+
+
+from fastapi import APIRouter, File, HTTPException, UploadFile, status
+
+from app.batching import batcher
+from app.payslip import extract_payslip, ocr_cache
+from app.schemas import OCRIn, PayslipOut
+from app.utils import check_files, executor, read_document
+
+router = APIRouter()
+
+
+@router.post("/", response_model=list[PayslipOut], status_code=status.HTTP_200_OK, summary="Extract payslip fields")
+async def extract_payslips(files: list[UploadFile] = [File(...)]):
+    """Runs docTR OCR model on the input payslips, and extracts their fields"""
+    try:
+        check_files(files)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    results = []
+    for file in files:
+        data = await file.read()
+        key = ocr_cache.key(data)
+        result = ocr_cache.get(key)
+        cached = result is not None
+        if result is None:
+            pages = await executor.run(read_document, data, file.content_type)
+            result = await batcher.run(OCRIn(), pages)
+            ocr_cache.put(key, result)
+        fields = await executor.run(extract_payslip, result, file.filename or "", len(data))
+        results.append(PayslipOut(name=file.filename or "", cached=cached, **fields))
+
+    return results
@@ -6,8 +6,9 @@
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 
+from app.batching import batcher
 from app.schemas import RecognitionIn, RecognitionOut
-from app.utils import get_documents
+from app.utils import executor, get_documents
 from app.vision import init_predictor
 
 router = APIRouter()
@@ -19,11 +20,14 @@ router = APIRouter()
 async def text_recognition(request: RecognitionIn = Depends(), files: list[UploadFile] = [File(...)]):
     """Runs docTR text recognition model to analyze the input image"""
     try:
-        predictor = init_predictor(request)
+        # Build (or fetch) the predictor beforehand, so that invalid configurations are reported as such
+        await executor.run(init_predictor, request)
         content, filenames = await get_documents(files)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+    out = await batcher.run(request, content)
     return [
         RecognitionOut(name=filename, value=res[0], confidence=round(res[1], 2))
-        for res, filename in zip(predictor(content), filenames)
+        for res, filename in zip(out, filenames)
     ]
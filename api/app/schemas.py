@@ -3,7 +3,7 @@
 # This program is licensed under the Apache License 2.0.
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -162,6 +162,42 @@ class OCROut(BaseModel):
     )
 
 
+class OCRBlockColumns(BaseModel):
+    geometry: list[list[float]] = Field(..., examples=[[[0.0, 0.0, 0.0, 0.0]]])
+    objectness_score: list[float] = Field(..., examples=[[0.99]])
+
+
+class OCRLineColumns(OCRBlockColumns):
+    block_idx: list[int] = Field(..., examples=[[0]])
+
+
+class OCRWordColumns(BaseModel):
+    value: list[str] = Field(..., examples=[["example"]])
+    geometry: list[list[float]] = Field(..., examples=[[[0.0, 0.0, 0.0, 0.0]]])
+    objectness_score: list[float] = Field(..., examples=[[0.99]])
+    confidence: list[float] = Field(..., examples=[[0.99]])
+    crop_orientation: list[dict[str, Any]] = Field(..., examples=[[{"value": 0, "confidence": None}]])
+    line_idx: list[int] = Field(..., examples=[[0]])
+
+
+class OCRColumnarOut(BaseModel):
+    name: str = Field(..., examples=["example.jpg"])
+    orientation: dict[str, float | None] = Field(..., examples=[{"value": 0.0, "confidence": 0.99}])
+    language: dict[str, str | float | None] = Field(..., examples=[{"value": "en", "confidence": 0.99}])
+    dimensions: tuple[int, int] = Field(..., examples=[(100, 100)])
+    blocks: OCRBlockColumns
+    lines: OCRLineColumns
+    words: OCRWordColumns
+
+
+class OCRStreamOut(OCROut):
+    page_idx: int = Field(..., examples=[0])
+
+
+class ErrorOut(BaseModel):
+    error: str = Field(..., examples=["Unsupported file format"])
+
+
 class KIEElement(BaseModel):
     class_name: str = Field(..., examples=["example"])
     items: list[dict[str, str | list[float] | float | dict[str, Any]]] = Field(
@@ -184,3 +220,130 @@ class KIEOut(BaseModel):
     language: dict[str, str | float | None] = Field(..., examples=[{"value": "en", "confidence": 0.99}])
     dimensions: tuple[int, int] = Field(..., examples=[(100, 100)])
     predictions: list[KIEElement]
+
+
+class JobOut(BaseModel):
+    id: str = Field(..., examples=["5f0c6d3a1e9b4c2f8a7d6e5b4c3a2f1e"])
+    filename: str = Field(..., examples=["payslip.pdf"])
+    status: Literal["queued", "running", "done", "failed"] = Field(..., examples=["queued"])
+    created_at: float = Field(..., examples=[1735689600.0])
+    started_at: float | None = Field(default=None, examples=[1735689601.0])
+    finished_at: float | None = Field(default=None, examples=[1735689605.0])
+    error: str | None = Field(default=None, examples=[None])
+
+
+class PayslipFileInfo(BaseModel):
+    file_name: str = Field(default="", examples=["payslip.pdf"])
+    file_size: str = Field(default="", examples=["154.2 KB"])
+    extraction_date: str = Field(default="", examples=["2025-01-31T12:00:00"])
+    file_path: str = Field(default="", examples=[""])
+
+
+class PayslipEmployerInfo(BaseModel):
+    company_name: str = Field(default="", examples=["ACME"])
+    address_line1: str = Field(default="", examples=["RUE SANTOS DUMONT"])
+    postal_code: str = Field(default="", examples=["27930"])
+    city: str = Field(default="", examples=["GUICHAINVILLE"])
+    siret: str = Field(default="", examples=["12345678900012"])
+    naf_code: str = Field(default="", examples=["6201Z"])
+    urssaf_number: str = Field(default="", examples=["123456789"])
+    SIREN: str = Field(default="", examples=["123456789"])
+
+
+class PayslipEmployeeInfo(BaseModel):
+    full_name: str = Field(default="", examples=["JEAN DUPONT"])
+    title: str = Field(default="", examples=["Monsieur"])
+    matricule: str = Field(default="", examples=["1231"])
+    social_security: str = Field(default="", examples=["1850127123456"])
+    address_line1: str = Field(default="", examples=["29 AVENUE DU MARECHAL FOCH"])
+    address_line2: str = Field(default="", examples=["APPT 29"])
+    postal_code: str = Field(default="", examples=["27000"])
+    city: str = Field(default="", examples=["EVREUX"])
+
+
+class PayslipEmploymentDetails(BaseModel):
+    job_title: str = Field(default="", examples=["INGENIEUR"])
+    start_date: str = Field(default="", examples=["01/09/2020"])
+    seniority: str = Field(default="", examples=["3 ans et 6 mois"])
+
+
+class PayslipPayPeriod(BaseModel):
+    period: str = Field(default="", examples=["MARS 2024"])
+    month: str = Field(default="", examples=["MARS"])
+    year: str = Field(default="", examples=["2024"])
+
+
+class PayslipSalaryElements(BaseModel):
+    base_salary: str = Field(default="", examples=["3500.00"])
+    variable_pay: str = Field(default="", examples=["0.00"])
+    gross_salary: str = Field(default="", examples=["3500.00"])
+    net_before_tax: str = Field(default="", examples=["2730.00"])
+    net_paid: str = Field(default="", examples=["2550.00"])
+    social_net: str = Field(default="", examples=["2750.00"])
+
+
+class PayslipSocialCharges(BaseModel):
+    health_insurance_employee: str = Field(default="", examples=["0.00"])
+    health_insurance_employer: str = Field(default="", examples=["0.00"])
+    solidarity_contribution: str = Field(default="", examples=["0.00"])
+    pension_uncapped: str = Field(default="", examples=["0.00"])
+    pension_capped: str = Field(default="", examples=["0.00"])
+    family_allowances: str = Field(default="", examples=["0.00"])
+    work_accident: str = Field(default="", examples=["0.00"])
+    unemployment_insurance: str = Field(default="", examples=["0.00"])
+    ags: str = Field(default="", examples=["0.00"])
+
+
+class PayslipLeaveInfo(BaseModel):
+    acquired_leave_n_minus_1: str = Field(default="", examples=["25"])
+    taken_leave_n_minus_1: str = Field(default="", examples=["10"])
+    remaining_leave: str = Field(default="", examples=["15"])
+
+
+class PayslipTotals(BaseModel):
+    ss_ceiling_monthly: str = Field(default="", examples=["3864.00"])
+    taxable_net: str = Field(default="", examples=["2800.00"])
+    employer_charges: str = Field(default="", examples=["1500.00"])
+    global_cost: str = Field(default="", examples=["5000.00"])
+    total_paid: str = Field(default="", examples=["2550.00"])
+
+
+class PayslipAnnualData(BaseModel):
+    annual_gross: str = Field(default="", examples=["10500.00"])
+    annual_ss_ceiling: str = Field(default="", examples=["11592.00"])
+    annual_taxable: str = Field(default="", examples=["8400.00"])
+
+
+class PayslipLegalInfo(BaseModel):
+    labor_code: str = Field(default="", examples=[""])
+    conservation_notice: str = Field(default="", examples=["Conservez ce bulletin sans limitation de durée"])
+
+
+class PayslipPaymentInfo(BaseModel):
+    payment_date: str = Field(default="", examples=["29/03/2024"])
+    payment_method: str = Field(default="", examples=["Virement"])
+
+
+class PayslipData(BaseModel):
+    file_info: PayslipFileInfo = Field(default_factory=PayslipFileInfo)
+    employer_info: PayslipEmployerInfo = Field(default_factory=PayslipEmployerInfo)
+    employee_info: PayslipEmployeeInfo = Field(default_factory=PayslipEmployeeInfo)
+    employment_details: PayslipEmploymentDetails = Field(default_factory=PayslipEmploymentDetails)
+    pay_period: PayslipPayPeriod = Field(default_factory=PayslipPayPeriod)
+    salary_elements: PayslipSalaryElements = Field(default_factory=PayslipSalaryElements)
+    social_charges: PayslipSocialCharges = Field(default_factory=PayslipSocialCharges)
+    leave_info: PayslipLeaveInfo = Field(default_factory=PayslipLeaveInfo)
+    totals: PayslipTotals = Field(default_factory=PayslipTotals)
+    annual_data: PayslipAnnualData = Field(default_factory=PayslipAnnualData)
+    legal_info: PayslipLegalInfo = Field(default_factory=PayslipLegalInfo)
+    payment_info: PayslipPaymentInfo = Field(default_factory=PayslipPaymentInfo)
+    raw_text: str = Field(default="", examples=["Bulletin de salaire\n..."])
+
+
+class PayslipOut(PayslipData):
+    name: str = Field(..., examples=["payslip.pdf"])
+    cached: bool = Field(..., examples=[False])
+
+
+class JobResultOut(JobOut):
+    result: PayslipData
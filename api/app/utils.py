@@ -4,13 +4,86 @@
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
 
-from typing import Any
+import asyncio
+import io
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, BinaryIO
 
 import numpy as np
-from fastapi import UploadFile
+import orjson
+import pypdfium2 as pdfium
+from fastapi import HTTPException, UploadFile, status
+from fastapi.responses import JSONResponse
 
 from doctr.io import DocumentFile
 
+from . import config as cfg
+
+
+class BoundedExecutor:
+    """Runs blocking work (inference, decoding) in a thread pool, out of the event loop
+
+    Args:
+        max_workers: number of jobs running at the same time
+        max_pending: maximum number of running & waiting jobs, beyond which new jobs are rejected with a 503
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_pending = max_pending
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inference")
+        # Only updated from the event loop, so it doesn't need a lock
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def run(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a function in the pool and wait for its result without blocking the event loop
+
+        Args:
+            fn: the function to run
+            *args: positional arguments of the function
+            **kwargs: keyword arguments of the function
+
+        Returns:
+            the output of the function
+        """
+        if self._pending >= self.max_pending:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many pending requests, please retry later",
+                headers={"Retry-After": "1"},
+            )
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, partial(fn, *args, **kwargs))
+        finally:
+            self._pending -= 1
+
+
+executor = BoundedExecutor(cfg.INFERENCE_WORKERS, cfg.MAX_PENDING_JOBS)
+
+
+def dumps(content: Any) -> str:
+    """Serialize to JSON, numpy arrays & scalars included"""
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response serialized with orjson, numpy arrays & scalars included"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+SUPPORTED_IMAGE_TYPES = ["image/jpeg", "image/png"]
+# pdfium is not thread-safe: calls from the pool threads are serialized
+_pdfium_lock = threading.Lock()
+
 
 def resolve_geometry(
     geom: Any,
@@ -20,6 +93,99 @@ def resolve_geometry(
     return (*geom[0], *geom[1])
 
 
+def check_files(files: list[UploadFile]) -> None:
+    """Check that the files are all supported documents
+
+    Args:
+        files: list of UploadFile objects
+    """
+    for file in files:
+        if file.content_type not in [*SUPPORTED_IMAGE_TYPES, "application/pdf"]:
+            raise ValueError(f"Unsupported file format: {file.content_type} for file {file.filename}")
+
+
+def upload_content(file: UploadFile) -> bytes | BinaryIO:
+    """Access the content of an uploaded file without copying it
+
+    Small uploads are held in memory, their buffer is shared. Larger ones are spooled to disk, the file is returned
+    so that its content is read lazily.
+
+    Args:
+        file: the uploaded file
+
+    Returns:
+        bytes | BinaryIO: the content of the file, or the file itself
+    """
+    # The spooled file wraps either a BytesIO or a temporary file
+    spooled = getattr(file.file, "_file", file.file)
+    spooled.seek(0)
+    if isinstance(spooled, io.BytesIO):
+        # Unlike `read`, `getvalue` doesn't copy the buffer of an unmodified BytesIO
+        return spooled.getvalue()
+    return spooled
+
+
+def _read_pdf(data: bytes | BinaryIO) -> list[np.ndarray]:
+    with _pdfium_lock:
+        return DocumentFile.from_pdf(data)
+
+
+def read_document(data: bytes | BinaryIO, content_type: str) -> list[np.ndarray]:
+    """Decode the pages of a document
+
+    Args:
+        data: the content of the document, or a binary stream
+        content_type: the MIME type of the document
+
+    Returns:
+        list[np.ndarray]: the pages of the document
+    """
+    if content_type in SUPPORTED_IMAGE_TYPES:
+        # Images are decoded in one go, they need their full content
+        return DocumentFile.from_images([data if isinstance(data, bytes) else data.read()])
+    if content_type == "application/pdf":
+        return _read_pdf(data)
+    raise ValueError(f"Unsupported file format: {content_type}")
+
+
+def _open_pdf(data: bytes | BinaryIO) -> tuple[pdfium.PdfDocument, int]:
+    with _pdfium_lock:
+        pdf = pdfium.PdfDocument(data)
+        return pdf, len(pdf)
+
+
+def _render_pdf_page(pdf: pdfium.PdfDocument, page_idx: int) -> np.ndarray:
+    # Same rendering as `DocumentFile.from_pdf`
+    with _pdfium_lock:
+        return pdf[page_idx].render(scale=2, rev_byteorder=True).to_numpy()
+
+
+async def iter_pages(files: list[UploadFile]) -> AsyncIterator[tuple[np.ndarray, str, int]]:  # pragma: no cover
+    """Decode the pages of a list of UploadFile objects one by one, so that only one page is held in memory
+
+    Args:
+        files: list of UploadFile objects
+
+    Returns:
+        AsyncIterator[tuple[np.ndarray, str, int]]: iterator over the pages, their filename and index in the file
+    """
+    for file in files:
+        filename = file.filename or ""
+        if file.content_type in SUPPORTED_IMAGE_TYPES:
+            yield (await executor.run(read_document, upload_content(file), file.content_type))[0], filename, 0
+        elif file.content_type == "application/pdf":
+            # Pages are rendered on demand, from the buffer (or the spooled file) of the upload
+            pdf, num_pages = await executor.run(_open_pdf, upload_content(file))
+            try:
+                for page_idx in range(num_pages):
+                    yield await executor.run(_render_pdf_page, pdf, page_idx), filename, page_idx
+            finally:
+                with _pdfium_lock:
+                    pdf.close()
+        else:
+            raise ValueError(f"Unsupported file format: {file.content_type} for file {file.filename}")
+
+
 async def get_documents(files: list[UploadFile]) -> tuple[list[np.ndarray], list[str]]:  # pragma: no cover
     """Convert a list of UploadFile objects to lists of numpy arrays and their corresponding filenames
 
@@ -34,11 +200,12 @@ async def get_documents(files: list[UploadFile]) -> tuple[list[np.ndarray], list
     docs = []
     for file in files:
         mime_type = file.content_type
-        if mime_type in ["image/jpeg", "image/png"]:
-            docs.extend(DocumentFile.from_images([await file.read()]))
+        if mime_type in SUPPORTED_IMAGE_TYPES:
+            docs.extend(await executor.run(read_document, upload_content(file), mime_type))
             filenames.append(file.filename or "")
         elif mime_type == "application/pdf":
-            pdf_content = DocumentFile.from_pdf(await file.read())
+            # Rasterization is CPU-bound, keep it out of the event loop
+            pdf_content = await executor.run(read_document, upload_content(file), mime_type)
             docs.extend(pdf_content)
             filenames.extend([file.filename] * len(pdf_content) or [""] * len(pdf_content))
         else:
@@ -4,14 +4,26 @@
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
 
-from collections.abc import Callable
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
 
+import numpy as np
 import torch
 
+import doctr
 from doctr.models import kie_predictor, ocr_predictor
+from doctr.models.utils import load_predictor, save_predictor
 
+from . import config as cfg
 from .schemas import DetectionIn, KIEIn, OCRIn, RecognitionIn
 
+__all__ = ["PredictorRegistry", "init_predictor", "predict", "registry", "warm_up"]
+
 
 def _move_to_device(predictor: Callable) -> Callable:
     """Move the predictor to the desired device
@@ -25,29 +37,178 @@ def _move_to_device(predictor: Callable) -> Callable:
     return predictor.to(torch.device("cuda" if torch.cuda.is_available() else "cpu"))
 
 
+class PredictorRegistry:
+    """Process-wide LRU cache of predictors, keyed by their architecture and configuration
+
+    Args:
+        max_size: maximum number of predictors kept in memory
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, Callable] = OrderedDict()
+        # One lock per configuration being built, so that concurrent requests don't build the same predictor twice
+        self._build_locks: dict[Hashable, threading.Lock] = {}
+        # One lock per predictor, held while its (shared) state is set & used. They live as long as their predictor,
+        # so that evicting a predictor doesn't release it for the threads still using it
+        self._predictor_locks: weakref.WeakKeyDictionary[Callable, threading.Lock] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, factory: Callable[[], Callable]) -> Callable:
+        """Retrieve the predictor registered under a key, building it if needed
+
+        Args:
+            key: the configuration key of the predictor
+            factory: function building the predictor when it is not cached
+
+        Returns:
+            the predictor
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+        # Models are built out of the registry lock: requests for other predictors are not blocked meanwhile
+        with build_lock:
+            with self._lock:
+                # Built by another thread while this one was waiting
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    return self._entries[key]
+            try:
+                predictor = factory()
+                with self._lock:
+                    self._entries[key] = predictor
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+            finally:
+                with self._lock:
+                    self._build_locks.pop(key, None)
+            return predictor
+
+    def lock(self, predictor: Callable) -> threading.Lock:
+        """Retrieve the lock guarding the usage of a predictor
+
+        Args:
+            predictor: the predictor, as returned by `get`
+
+        Returns:
+            the lock of the predictor
+        """
+        with self._lock:
+            return self._predictor_locks.setdefault(predictor, threading.Lock())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+registry = PredictorRegistry(cfg.PREDICTOR_CACHE_SIZE)
+
+
+def _build_predictor(request: KIEIn | OCRIn | RecognitionIn | DetectionIn, params: dict[str, Any]) -> Callable:
+    if isinstance(request, (OCRIn, RecognitionIn, DetectionIn)):
+        predictor = ocr_predictor(pretrained=True, **params)
+        if isinstance(request, DetectionIn):
+            return predictor.det_predictor
+        elif isinstance(request, RecognitionIn):
+            return predictor.reco_predictor
+        return predictor
+    return kie_predictor(pretrained=True, **params)
+
+
+def _load_predictor(
+    request: KIEIn | OCRIn | RecognitionIn | DetectionIn, key: Hashable, params: dict[str, Any]
+) -> Callable:
+    """Build the predictor of a request, or load its snapshot if snapshots are enabled"""
+    if cfg.PREDICTOR_SNAPSHOT_DIR is None:
+        return _move_to_device(_build_predictor(request, params))
+    # Snapshots are tied to the docTR version which saved them
+    digest = hashlib.sha256(repr((doctr.__version__, key)).encode("utf-8")).hexdigest()[:16]
+    path = Path(cfg.PREDICTOR_SNAPSHOT_DIR) / f"{type(request).__name__}-{digest}.pt"
+    if path.is_file():
+        return _move_to_device(load_predictor(path))
+    predictor = _build_predictor(request, params)
+    # The next processes (e.g. job workers) will load it rather than building it
+    path.parent.mkdir(parents=True, exist_ok=True)
+    save_predictor(predictor, path)
+    return _move_to_device(predictor)
+
+
+def _predictor_key(request: KIEIn | OCRIn | RecognitionIn | DetectionIn) -> tuple[Hashable, dict[str, Any]]:
+    params = request.model_dump()
+    # Thresholds are applied on each call, they don't require a new predictor
+    params.pop("bin_thresh", None)
+    params.pop("box_thresh", None)
+    return (type(request).__name__, *sorted(params.items())), params
+
+
+def _apply_thresholds(predictor: Any, request: KIEIn | OCRIn | RecognitionIn | DetectionIn) -> None:
+    if isinstance(request, (OCRIn, KIEIn)):
+        predictor.det_predictor.model.postprocessor.bin_thresh = request.bin_thresh
+        predictor.det_predictor.model.postprocessor.box_thresh = request.box_thresh
+    elif isinstance(request, DetectionIn):
+        predictor.model.postprocessor.bin_thresh = request.bin_thresh
+        predictor.model.postprocessor.box_thresh = request.box_thresh
+
+
 def init_predictor(request: KIEIn | OCRIn | RecognitionIn | DetectionIn) -> Callable:
     """Initialize the predictor based on the request
 
+    Predictors are cached by configuration, only the detection thresholds of the request are applied on each call.
+
     Args:
         request: input request
 
     Returns:
         Callable: the predictor
     """
-    params = request.model_dump()
-    bin_thresh = params.pop("bin_thresh", None)
-    box_thresh = params.pop("box_thresh", None)
-    if isinstance(request, (OCRIn, RecognitionIn, DetectionIn)):
-        predictor = ocr_predictor(pretrained=True, **params)
-        predictor.det_predictor.model.postprocessor.bin_thresh = bin_thresh
-        predictor.det_predictor.model.postprocessor.box_thresh = box_thresh
-        if isinstance(request, DetectionIn):
-            return _move_to_device(predictor.det_predictor)
-        elif isinstance(request, RecognitionIn):
-            return _move_to_device(predictor.reco_predictor)
-        return _move_to_device(predictor)
-    elif isinstance(request, KIEIn):
-        predictor = kie_predictor(pretrained=True, **params)
-        predictor.det_predictor.model.postprocessor.bin_thresh = bin_thresh
-        predictor.det_predictor.model.postprocessor.box_thresh = box_thresh
-        return _move_to_device(predictor)
+    key, params = _predictor_key(request)
+    predictor = registry.get(key, lambda: _load_predictor(request, key, params))
+    with registry.lock(predictor):
+        _apply_thresholds(predictor, request)
+    return predictor
+
+
+def predict(request: KIEIn | OCRIn | RecognitionIn | DetectionIn, inputs: list[np.ndarray]) -> Any:
+    """Run the predictor matching the request on the inputs
+
+    Args:
+        request: input request
+        inputs: list of images or pages
+
+    Returns:
+        the output of the predictor
+    """
+    key, params = _predictor_key(request)
+    predictor = registry.get(key, lambda: _load_predictor(request, key, params))
+    # Cached predictors are shared: keep the thresholds of this request until its inference is over
+    with registry.lock(predictor):
+        _apply_thresholds(predictor, request)
+        return predictor(inputs)
+
+
+def warm_up(tasks: list[str]) -> None:
+    """Build the default predictors of the given tasks and run them once
+
+    Args:
+        tasks: names of the tasks to warm up, among "ocr", "kie", "detection" and "recognition"
+    """
+    requests: dict[str, KIEIn | OCRIn | RecognitionIn | DetectionIn] = {
+        "ocr": OCRIn(),
+        "kie": KIEIn(),
+        "detection": DetectionIn(),
+        "recognition": RecognitionIn(),
+    }
+    for task in tasks:
+        if task not in requests:
+            raise ValueError(f"unknown task to warm up: {task}")
+        # A single dummy pass initializes lazy backends (cudnn, thread pools, ...)
+        predict(requests[task], [np.zeros((64, 256, 3), dtype=np.uint8)])
@@ -2,6 +2,7 @@ import pytest_asyncio
 import requests
 from httpx import ASGITransport, AsyncClient
 
+from app.jobs import JobStore
 from app.main import app
 
 
@@ -25,10 +26,13 @@ def mock_txt_file(tmpdir_factory):
 
 
 @pytest_asyncio.fixture(scope="function")
-async def test_app_asyncio():
+async def test_app_asyncio(tmp_path):
+    # The lifespan of the app doesn't run here: jobs are queued in a temporary store, and no worker processes them
+    app.state.job_store = JobStore(tmp_path / "jobs")
     # for httpx>=20, follow_redirects=True (cf. https://github.com/encode/httpx/releases/tag/0.20.0)
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test", follow_redirects=True) as ac:
         yield ac  # testing happens here
+    del app.state.job_store
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import pytest
+
+from app import config as cfg
+
+
+@pytest.mark.asyncio
+async def test_jobs(test_app_asyncio, mock_recognition_image):
+    files = [
+        ("files", ("test.jpg", mock_recognition_image, "image/jpeg")),
+        ("files", ("test2.jpg", mock_recognition_image, "image/jpeg")),
+    ]
+    response = await test_app_asyncio.post("/jobs", files=files)
+    assert response.status_code == 202
+    jobs = response.json()
+    assert [job["filename"] for job in jobs] == ["test.jpg", "test2.jpg"]
+    assert all(job["status"] == "queued" for job in jobs)
+
+    # No worker is running in tests: the job stays queued
+    response = await test_app_asyncio.get(f"/jobs/{jobs[0]['id']}", params={"wait": 0.1})
+    assert response.status_code == 200 and response.json()["status"] == "queued"
+    response = await test_app_asyncio.get(f"/jobs/{jobs[0]['id']}/result")
+    assert response.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_jobs_invalid(test_app_asyncio, mock_txt_file):
+    response = await test_app_asyncio.post("/jobs", files=[("files", ("test.txt", mock_txt_file))])
+    assert response.status_code == 400
+    response = await test_app_asyncio.get("/jobs/unknown")
+    assert response.status_code == 404
+    response = await test_app_asyncio.get("/jobs/unknown/result")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_jobs_store(test_app_asyncio, tmp_path):
+    # Jobs are queued in the store of the app, nothing is written in the working directory
+    response = await test_app_asyncio.post("/jobs", files=[("files", ("test.png", b"data", "image/png"))])
+    assert response.status_code == 202
+    assert (tmp_path / "jobs" / "files" / response.json()[0]["id"]).read_bytes() == b"data"
+    assert not (Path.cwd() / cfg.JOBS_DIR).exists()
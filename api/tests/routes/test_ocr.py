@@ -1,3 +1,5 @@
+import json
+
 import numpy as np
 import pytest
 
@@ -77,3 +79,113 @@ async def test_ocr_invalid_file(test_app_asyncio, mock_txt_file):
     ]
     response = await test_app_asyncio.post("/ocr", files=files, headers=headers)
     assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream_format", ["ndjson", "sse"])
+async def test_ocr_stream(test_app_asyncio, mock_detection_image, mock_ocr_response, stream_format):
+    headers = {
+        "accept": "application/json",
+    }
+    params = {"det_arch": "db_resnet50", "reco_arch": "crnn_vgg16_bn", "stream_format": stream_format}
+    files = [
+        ("files", ("test.jpg", mock_detection_image, "image/jpeg")),
+        ("files", ("test2.jpg", mock_detection_image, "image/jpeg")),
+    ]
+    response = await test_app_asyncio.post("/ocr/stream", params=params, files=files, headers=headers)
+    assert response.status_code == 200
+    if stream_format == "sse":
+        assert response.headers["content-type"].startswith("text/event-stream")
+        chunks = [chunk.removeprefix("data: ") for chunk in response.text.split("\n\n") if chunk]
+    else:
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        chunks = response.text.splitlines()
+    json_response = [json.loads(chunk) for chunk in chunks]
+    assert len(json_response) == 2
+    assert [page["name"] for page in json_response] == ["test.jpg", "test2.jpg"]
+    assert all(page["page_idx"] == 0 for page in json_response)
+    common_test(json_response, mock_ocr_response["box"])
+
+
+@pytest.mark.asyncio
+async def test_ocr_stream_invalid_file(test_app_asyncio, mock_txt_file):
+    files = [
+        ("files", ("test.txt", mock_txt_file)),
+    ]
+    response = await test_app_asyncio.post("/ocr/stream", files=files)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_ocr_stream_schema(test_app_asyncio):
+    response = await test_app_asyncio.get("/openapi.json")
+    assert response.status_code == 200
+    schema = response.json()
+    content = schema["paths"]["/ocr/stream"]["post"]["responses"]["200"]["content"]
+    assert set(content) == {"application/x-ndjson", "text/event-stream"}
+    refs = [ref["$ref"].rpartition("/")[-1] for ref in content["application/x-ndjson"]["schema"]["oneOf"]]
+    assert refs == ["OCRStreamOut", "ErrorOut"]
+    assert all(name in schema["components"]["schemas"] for name in refs)
+    assert "page_idx" in schema["components"]["schemas"]["OCRStreamOut"]["properties"]
+
+
+@pytest.mark.asyncio
+async def test_ocr_columnar(test_app_asyncio, mock_detection_image, mock_ocr_response):
+    params = {"det_arch": "db_resnet50", "reco_arch": "crnn_vgg16_bn", "output_format": "columnar"}
+    files = [
+        ("files", ("test.jpg", mock_detection_image, "image/jpeg")),
+    ]
+    response = await test_app_asyncio.post("/ocr", params=params, files=files)
+    assert response.status_code == 200
+    json_response = response.json()
+    assert isinstance(json_response, list) and len(json_response) == 1
+    page = json_response[0]
+    expected_words = [
+        word
+        for block in mock_ocr_response["box"]["items"][0]["blocks"]
+        for line in block["lines"]
+        for word in line["words"]
+    ]
+    assert page["words"]["value"] == [word["value"] for word in expected_words]
+    np.testing.assert_allclose(page["words"]["geometry"], [word["geometry"] for word in expected_words], rtol=1e-2)
+    num_words = len(expected_words)
+    assert all(len(values) == num_words for values in page["words"].values())
+    assert len(page["lines"]["geometry"]) == len(page["lines"]["block_idx"]) == 1
+    assert page["words"]["line_idx"] == [0] * num_words
+    assert len(page["blocks"]["geometry"]) == 1
+
+
+@pytest.mark.parametrize("rotated", [False, True])
+def test_ocr_serialization_word_table(rotated):
+    from app.routes.ocr import _to_ocr_columns, _to_ocr_out
+    from doctr.io import Page
+    from doctr.models.builder import DocumentBuilder
+
+    rng = np.random.default_rng(0)
+    corners = rng.random((12, 2)) * 0.8
+    if rotated:
+        boxes = np.stack([corners, corners + [0.1, 0.01], corners + [0.1, 0.03], corners + [0, 0.02]], axis=1)
+    else:
+        boxes = np.concatenate([corners, corners + [0.1, 0.02]], axis=1)
+    doc = DocumentBuilder(resolve_blocks=True)(
+        [np.zeros((100, 100, 3), dtype=np.uint8)],
+        [boxes],
+        [rng.random(12)],
+        [[(f"word{idx}", 0.9) for idx in range(12)]],
+        [(100, 100)],
+        [[{"value": 0, "confidence": None}] * 12],
+    )
+    # Pages built by the predictor hold a word table, the result must match the one of the elements
+    page = doc.pages[0]
+    blocks_page = Page(page.page, page.word_table.to_blocks(), 0, (100, 100))
+    for serialize in (_to_ocr_out, _to_ocr_columns):
+        out = json.loads(json.dumps(serialize(page, "test.jpg")))
+        assert out == json.loads(json.dumps(serialize(blocks_page, "test.jpg")))
+
+    nested = _to_ocr_out(page, "test.jpg")["items"][0]["blocks"]
+    columns = _to_ocr_columns(page, "test.jpg")
+    words = [word for block in nested for line in block["lines"] for word in line["words"]]
+    assert columns["words"]["value"] == [word["value"] for word in words]
+    assert columns["words"]["geometry"] == [word["geometry"] for word in words]
+    assert len(columns["lines"]["block_idx"]) == sum(len(block["lines"]) for block in nested)
+    assert all(len(geometry) == (8 if rotated else 4) for geometry in columns["blocks"]["geometry"])
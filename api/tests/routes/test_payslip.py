@@ -0,0 +1,25 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_payslip(test_app_asyncio, mock_detection_image):
+    files = [
+        ("files", ("test.jpg", mock_detection_image, "image/jpeg")),
+        ("files", ("test2.jpg", mock_detection_image, "image/jpeg")),
+    ]
+    response = await test_app_asyncio.post("/payslip", files=files)
+    assert response.status_code == 200
+    json_response = response.json()
+    assert [payslip["name"] for payslip in json_response] == ["test.jpg", "test2.jpg"]
+    # The second file has the same content: its OCR result is retrieved from the cache
+    assert [payslip["cached"] for payslip in json_response] == [False, True]
+    for payslip in json_response:
+        assert payslip["file_info"]["file_name"] == payslip["name"]
+        assert isinstance(payslip["employee_info"]["full_name"], str)
+        assert "Hello" in payslip["raw_text"]
+
+
+@pytest.mark.asyncio
+async def test_payslip_invalid_file(test_app_asyncio, mock_txt_file):
+    response = await test_app_asyncio.post("/payslip", files=[("files", ("test.txt", mock_txt_file))])
+    assert response.status_code == 400
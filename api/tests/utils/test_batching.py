@@ -0,0 +1,40 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.batching import RequestBatcher
+from app.schemas import DetectionIn, RecognitionIn
+from app.utils import BoundedExecutor
+
+
+@pytest.mark.asyncio
+async def test_request_batcher():
+    calls = []
+
+    def mock_predict(request, inputs):
+        calls.append(len(inputs))
+        if any(sample.shape[0] == 0 for sample in inputs):
+            raise ValueError("empty input")
+        return [int(sample[0, 0, 0]) for sample in inputs]
+
+    batcher = RequestBatcher(BoundedExecutor(1, 8), max_batch_size=4, max_wait=0.05, predict_fn=mock_predict)
+    inputs = [[np.full((8, 8, 3), idx, dtype=np.uint8)] for idx in range(3)]
+    # Concurrent requests with the same configuration are processed in a single pass
+    out = await asyncio.gather(*[batcher.run(RecognitionIn(), sample) for sample in inputs])
+    assert out == [[0], [1], [2]] and calls == [3]
+
+    # The batch is flushed as soon as it is full, different configurations aren't mixed
+    calls.clear()
+    out = await asyncio.gather(
+        batcher.run(RecognitionIn(), inputs[0] + inputs[1]),
+        batcher.run(DetectionIn(), inputs[2]),
+        batcher.run(RecognitionIn(), inputs[1] + inputs[2]),
+    )
+    assert out == [[0, 1], [2], [1, 2]] and sorted(calls) == [1, 4]
+
+    # Errors are propagated to every request of the batch
+    with pytest.raises(ValueError):
+        await asyncio.gather(
+            batcher.run(RecognitionIn(), inputs[0]), batcher.run(RecognitionIn(), [np.zeros((0, 8, 3))])
+        )
@@ -0,0 +1,47 @@
+import threading
+
+from app.jobs import JobStore, _worker_loop
+
+
+def test_job_store(tmp_path):
+    store = JobStore(tmp_path)
+    assert store.get("unknown") is None and store.claim() is None
+
+    first = store.submit("first.pdf", "application/pdf", b"first")
+    second = store.submit("second.png", "image/png", b"second")
+    assert store.file_path(first).read_bytes() == b"first"
+    job = store.get(first)
+    assert job["status"] == "queued" and job["filename"] == "first.pdf" and job["result"] is None
+
+    # Jobs are claimed in submission order
+    assert store.claim()["id"] == first
+    assert store.get(first)["status"] == "running"
+    store.complete(first, {"employee_info": {"full_name": "JEAN DUPONT"}})
+    job = store.get(first)
+    assert job["status"] == "done" and job["result"] == {"employee_info": {"full_name": "JEAN DUPONT"}}
+    assert not store.file_path(first).exists()
+
+    # Interrupted jobs are requeued, the queue survives a new instance
+    assert store.claim()["id"] == second
+    store = JobStore(tmp_path)
+    assert store.requeue_running() == 1
+    assert store.claim()["id"] == second
+    store.fail(second, "ValueError: corrupted file")
+    assert store.get(second)["status"] == "failed" and store.get(second)["error"] == "ValueError: corrupted file"
+
+
+def test_worker_loop(tmp_path):
+    store = JobStore(tmp_path)
+    job_ids = [store.submit(f"{idx}.png", "image/png", b"data" * idx) for idx in range(3)]
+    stop_event = threading.Event()
+
+    def mock_process(store, job):
+        if job["filename"] == "0.png":
+            raise ValueError("empty file")
+        if job["filename"] == "2.png":
+            stop_event.set()
+        return {"size": store.file_path(job["id"]).stat().st_size}
+
+    _worker_loop(tmp_path, stop_event, 0.01, mock_process)
+    assert store.get(job_ids[0])["status"] == "failed" and store.get(job_ids[0])["error"] == "ValueError: empty file"
+    assert [store.get(job_id)["result"] for job_id in job_ids[1:]] == [{"size": 4}, {"size": 8}]
@@ -0,0 +1,34 @@
+import numpy as np
+
+from app.payslip import OCRCache
+from doctr.io import Document, Page
+
+
+def _mock_result():
+    return Document([Page(np.zeros((32, 32, 3), dtype=np.uint8), [], 0, (32, 32))])
+
+
+def test_ocr_cache():
+    cache = OCRCache(max_size=2)
+    keys = [cache.key(data) for data in (b"first", b"second", b"third")]
+    assert keys[0] == cache.key(b"first") and len(set(keys)) == 3
+    assert cache.get(keys[0]) is None
+
+    result = _mock_result()
+    cache.put(keys[0], result)
+    cached = cache.get(keys[0])
+    # The cache holds a copy without the page images, the result of the caller is left untouched
+    assert cached is not result and cached.pages[0].page is None
+    assert result.pages[0].page is not None
+    result.pages[0].dimensions = (64, 64)
+    assert cache.get(keys[0]).pages[0].dimensions == (32, 32)
+    cache.put(keys[1], _mock_result())
+    # The first entry was used last, so the second one is evicted first
+    cache.get(keys[0])
+    cache.put(keys[2], _mock_result())
+    assert len(cache) == 2 and cache.get(keys[1]) is None and cache.get(keys[0]) is cached
+
+    # Disabled cache
+    cache = OCRCache(max_size=0)
+    cache.put(keys[0], _mock_result())
+    assert len(cache) == 0
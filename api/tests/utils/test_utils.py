@@ -1,4 +1,11 @@
-from app.utils import resolve_geometry
+import asyncio
+import tempfile
+import threading
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.utils import BoundedExecutor, resolve_geometry, upload_content
 
 
 def test_resolve_geometry():
@@ -7,3 +14,37 @@ def test_resolve_geometry():
 
     assert resolve_geometry(dummy_box) == (0.0, 0.0, 1.0, 0.0)
     assert resolve_geometry(dummy_polygon) == (0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0)
+
+
+@pytest.mark.asyncio
+async def test_bounded_executor():
+    executor = BoundedExecutor(max_workers=1, max_pending=1)
+    assert await executor.run(sum, [1, 2], start=3) == 6
+    assert executor.pending == 0
+
+    event = threading.Event()
+    job = asyncio.create_task(executor.run(event.wait))
+    await asyncio.sleep(0.05)
+    assert executor.pending == 1
+    # The queue is full: new jobs are rejected
+    with pytest.raises(HTTPException) as e:
+        await executor.run(sum, [1, 2])
+    assert e.value.status_code == 503 and "Retry-After" in e.value.headers
+    event.set()
+    assert await job is True
+    assert executor.pending == 0
+
+
+def test_upload_content():
+    # Small uploads are kept in memory
+    spooled = tempfile.SpooledTemporaryFile(max_size=16)
+    spooled.write(b"%PDF-1.4")
+    content = upload_content(UploadFile(spooled))
+    assert content == b"%PDF-1.4"
+    # Larger ones are rolled over to disk, and read from there
+    spooled.seek(0, 2)
+    spooled.write(b"x" * 32)
+    content = upload_content(UploadFile(spooled))
+    assert not isinstance(content, bytes)
+    assert content.read() == b"%PDF-1.4" + b"x" * 32
+    spooled.close()
@@ -1,5 +1,13 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from torch import nn
+
+from app import config as cfg
+from app import vision
 from app.schemas import DetectionIn, KIEIn, OCRIn, RecognitionIn
-from app.vision import init_predictor
+from app.vision import PredictorRegistry, init_predictor
+from doctr.models import ocr_predictor
 from doctr.models.detection.predictor import DetectionPredictor
 from doctr.models.kie_predictor import KIEPredictor
 from doctr.models.predictor import OCRPredictor
@@ -11,3 +19,81 @@ def test_vision():
     assert isinstance(init_predictor(DetectionIn()), DetectionPredictor)
     assert isinstance(init_predictor(RecognitionIn()), RecognitionPredictor)
     assert isinstance(init_predictor(KIEIn()), KIEPredictor)
+
+
+def test_vision_cache():
+    predictor = init_predictor(OCRIn(bin_thresh=0.3, box_thresh=0.2))
+    # Same configuration: the predictor is reused, with the thresholds of the request
+    assert init_predictor(OCRIn(bin_thresh=0.5, box_thresh=0.4)) is predictor
+    assert predictor.det_predictor.model.postprocessor.bin_thresh == 0.5
+    assert predictor.det_predictor.model.postprocessor.box_thresh == 0.4
+    assert init_predictor(OCRIn(det_bs=4)) is not predictor
+
+
+def test_predictor_registry():
+    registry = PredictorRegistry(max_size=2)
+    calls = []
+
+    def factory(name):
+        def _build():
+            calls.append(name)
+            return object()
+
+        return _build
+
+    first = registry.get("a", factory("a"))
+    assert registry.get("a", factory("a")) is first and calls == ["a"]
+    registry.get("b", factory("b"))
+    # "a" was used last, so "b" is evicted first
+    registry.get("a", factory("a"))
+    registry.get("c", factory("c"))
+    assert len(registry) == 2 and "a" in registry and "b" not in registry
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_predictor_registry_concurrency():
+    registry = PredictorRegistry(max_size=1)
+    cached = registry.get("cached", lambda: nn.Identity())
+    building, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_factory():
+        calls.append("slow")
+        building.set()
+        release.wait(5)
+        return nn.Identity()
+
+    with ThreadPoolExecutor(2) as executor:
+        futures = [executor.submit(registry.get, "slow", slow_factory) for _ in range(2)]
+        assert building.wait(5)
+        # Cache hits are not blocked by the build of another predictor
+        assert registry.get("cached", lambda: None) is cached
+        # A predictor still in use keeps its lock after being evicted
+        lock = registry.lock(cached)
+        release.set()
+        slow = futures[0].result()
+        # Concurrent requests wait for a single build
+        assert futures[1].result() is slow and calls == ["slow"]
+    assert "cached" not in registry and registry.lock(cached) is lock
+
+
+def test_predictor_snapshots(tmp_path, monkeypatch):
+    monkeypatch.setattr(cfg, "PREDICTOR_SNAPSHOT_DIR", str(tmp_path))
+    builds = []
+
+    def _build(request, params):
+        builds.append(params)
+        return ocr_predictor("fast_tiny", "crnn_mobilenet_v3_small", pretrained=False, pretrained_backbone=False)
+
+    monkeypatch.setattr(vision, "_build_predictor", _build)
+    key, params = vision._predictor_key(OCRIn())
+    predictor = vision._load_predictor(OCRIn(), key, params)
+    assert len(builds) == 1 and len(list(tmp_path.iterdir())) == 1
+    # The next processes load the snapshot rather than building the predictor
+    loaded = vision._load_predictor(OCRIn(), key, params)
+    assert len(builds) == 1 and isinstance(loaded, OCRPredictor) and loaded is not predictor
+    # Another configuration has its own snapshot
+    key, params = vision._predictor_key(OCRIn(det_bs=4))
+    vision._load_predictor(OCRIn(det_bs=4), key, params)
+    assert len(builds) == 2 and len(list(tmp_path.iterdir())) == 2
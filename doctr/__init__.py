@@ -1,2 +1,5 @@
-from . import io, models, datasets, contrib, transforms, utils
+from .file_utils import lazy_import
 from .version import __version__  # noqa: F401
+
+# Submodules are imported on first access, e.g. `import doctr.io` doesn't pull the models & datasets
+__all__, __getattr__, __dir__ = lazy_import(__name__, ["io", "models", "datasets", "contrib", "transforms", "utils"])
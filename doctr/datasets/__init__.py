@@ -1,22 +1,39 @@
-from .generator import *
-from .coco_text import *
-from .cord import *
-from .detection import *
-from .doc_artefacts import *
-from .funsd import *
-from .ic03 import *
-from .ic13 import *
-from .iiit5k import *
-from .iiithws import *
-from .imgur5k import *
-from .mjsynth import *
-from .ocr import *
-from .recognition import *
-from .orientation import *
-from .sroie import *
-from .svhn import *
-from .svt import *
-from .synthtext import *
-from .utils import *
-from .vocabs import *
-from .wildreceipt import *
+from doctr.file_utils import lazy_import
+
+# Each dataset (and its dependencies) is only imported when accessed
+__all__, __getattr__, __dir__ = lazy_import(
+    __name__,
+    ["datasets", "generator", "utils", "vocabs"],
+    {
+        ".generator": ["CharacterGenerator", "WordGenerator"],
+        ".coco_text": ["COCOTEXT"],
+        ".cord": ["CORD"],
+        ".detection": ["DetectionDataset"],
+        ".doc_artefacts": ["DocArtefacts"],
+        ".funsd": ["FUNSD"],
+        ".ic03": ["IC03"],
+        ".ic13": ["IC13"],
+        ".iiit5k": ["IIIT5K"],
+        ".iiithws": ["IIITHWS"],
+        ".imgur5k": ["IMGUR5K"],
+        ".mjsynth": ["MJSynth"],
+        ".ocr": ["OCRDataset"],
+        ".recognition": ["RecognitionDataset"],
+        ".orientation": ["OrientationDataset"],
+        ".sroie": ["SROIE"],
+        ".svhn": ["SVHN"],
+        ".svt": ["SVT"],
+        ".synthtext": ["SynthText"],
+        ".utils": [
+            "translate",
+            "encode_string",
+            "decode_sequence",
+            "encode_sequences",
+            "pre_transform_multiclass",
+            "crop_bboxes_from_image",
+            "convert_target_to_relative",
+        ],
+        ".vocabs": ["VOCABS"],
+        ".wildreceipt": ["WILDRECEIPT"],
+    },
+)
@@ -205,7 +205,8 @@ def crop_bboxes_from_image(img_path: str | Path, geoms: np.ndarray) -> list[np.n
     if geoms.ndim == 3 and geoms.shape[1:] == (4, 2):
         return extract_rcrops(img, geoms.astype(dtype=int))
     if geoms.ndim == 2 and geoms.shape[1] == 4:
-        return extract_crops(img, geoms.astype(dtype=int))
+        # Crops are views of the image: copy them so that the dataset does not retain full images
+        return [crop.copy() for crop in extract_crops(img, geoms.astype(dtype=int))]
     raise ValueError("Invalid geometry format")
 
 
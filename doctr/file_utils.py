@@ -3,10 +3,14 @@
 # This program is licensed under the Apache License 2.0.
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
+import importlib
 import importlib.metadata
 import logging
+import sys
+from collections.abc import Callable
+from typing import Any
 
-__all__ = ["requires_package", "CLASS_NAME"]
+__all__ = ["requires_package", "lazy_import", "CLASS_NAME"]
 
 CLASS_NAME: str = "words"
 ENV_VARS_TRUE_VALUES = {"1", "ON", "YES", "TRUE"}
@@ -28,3 +32,41 @@ def requires_package(name: str, extra_message: str | None = None) -> None:  # pr
             f"\n\n{extra_message if extra_message is not None else ''} "
             f"\nPlease install it with the following command: pip install {name}\n"
         )
+
+
+def lazy_import(
+    module_name: str,
+    submodules: list[str] | None = None,
+    exports: dict[str, list[str]] | None = None,
+) -> tuple[list[str], Callable[[str], Any], Callable[[], list[str]]]:
+    """Defer the import of the submodules of a package until one of their attributes is accessed (PEP 562)
+
+    >>> __all__, __getattr__, __dir__ = lazy_import(__name__, ["zoo"], {".zoo": ["ocr_predictor"]})
+
+    Args:
+        module_name: the name of the package, i.e. its `__name__`
+        submodules: the submodules which can be accessed as attributes of the package
+        exports: the names exported by each submodule (relative to the package), as a star import would
+
+    Returns:
+        the `__all__` (the exported names, or the submodules if there are none), `__getattr__` and `__dir__` of the
+        package
+    """
+    submodules = submodules or []
+    origins = {name: submodule for submodule, names in (exports or {}).items() for name in names}
+
+    def _getattr(name: str) -> Any:
+        if name in origins:
+            value = getattr(importlib.import_module(origins[name], module_name), name)
+        elif name in submodules:
+            value = importlib.import_module(f".{name}", module_name)
+        else:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'")
+        # Later accesses don't go through __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def _dir() -> list[str]:
+        return sorted({*vars(sys.modules[module_name]), *submodules, *origins})
+
+    return [*origins] or [*submodules], _getattr, _dir
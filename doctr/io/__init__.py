@@ -3,3 +3,6 @@ from .html import *
 from .image import *
 from .pdf import *
 from .reader import *
+from .serialization import *
+from .xml_writer import *
+from .pdf_writer import *
@@ -26,7 +26,18 @@ try:  # optional dependency for visualization
 except ModuleNotFoundError:
     pass
 
-__all__ = ["Element", "Word", "Artefact", "Line", "Prediction", "Block", "Page", "KIEPage", "Document"]
+__all__ = [
+    "Element",
+    "Word",
+    "Artefact",
+    "Line",
+    "Prediction",
+    "Block",
+    "WordTable",
+    "Page",
+    "KIEPage",
+    "Document",
+]
 
 
 class Element(NestedObject):
@@ -248,12 +259,316 @@ class Block(Element):
         return cls(**kwargs)
 
 
+def _stack_geometries(geometries: list[Any]) -> np.ndarray:
+    """Stack geometries in an array of shape (N, 4) for straight boxes, or (N, 4, 2) for rotated ones"""
+    if len(geometries) == 0:
+        return np.zeros((0, 4))
+    stacked = np.asarray(geometries)
+    # ((xmin, ymin), (xmax, ymax)) --> (xmin, ymin, xmax, ymax)
+    return stacked.reshape(-1, 4) if stacked.shape[1] == 2 else stacked
+
+
+def _straight_geometry(box: np.ndarray) -> BoundingBox:
+    return ((box[0], box[1]), (box[2], box[3]))
+
+
+class WordTable:
+    """Implements a columnar storage of the words of a page, grouped in lines and blocks
+
+    Words are stored in reading order: the words of a line, the lines of a block and the blocks of the page are
+    contiguous. Word, line & block elements are only built when requested.
+
+    >>> import numpy as np
+    >>> from doctr.io import WordTable
+    >>> table = WordTable.from_columns(
+    ...     values=["Hello", "world"],
+    ...     confidences=np.array([0.99, 0.98]),
+    ...     geometries=np.array([[0.1, 0.1, 0.3, 0.2], [0.35, 0.1, 0.6, 0.2]]),
+    ...     objectness_scores=np.array([0.95, 0.96]),
+    ...     crop_orientations=[{"value": 0, "confidence": None}] * 2,
+    ...     line_offsets=np.array([0, 2]),
+    ...     block_offsets=np.array([0, 1]),
+    ... )
+    >>> blocks = table.to_blocks()
+
+    Args:
+        text: the values of all words, separated by a space
+        word_offsets: the position of each word in `text`, of shape (N + 1,) (the last one being `len(text) + 1`)
+        confidences: the confidences of the text predictions, of shape (N,)
+        geometries: the bounding boxes of the words, of shape (N, 4) in format (xmin, ymin, xmax, ymax) or
+            (N, 4, 2) for rotated boxes, where coordinates are relative to the page's size
+        objectness_scores: the objectness scores of the detections, of shape (N,)
+        crop_angles: the general orientation of each crop in degrees, of shape (N,)
+        crop_confidences: the confidence of each crop orientation, NaN when unavailable, of shape (N,)
+        line_offsets: the index of the first word of each line, of shape (L + 1,) (the last one being N)
+        block_offsets: the index of the first line of each block, of shape (B + 1,) (the last one being L)
+        line_geometries: the bounding boxes of the lines, of shape (L, 4) or (L, 4, 2). If not specified, they are
+            resolved from their words.
+        line_objectness_scores: the objectness scores of the lines, of shape (L,). If not specified, they are
+            resolved from their words.
+        block_geometries: the bounding boxes of the blocks, of shape (B, 4) or (B, 4, 2). If not specified, they are
+            resolved from their lines & artefacts.
+        block_objectness_scores: the objectness scores of the blocks, of shape (B,). If not specified, they are
+            resolved from their words.
+        artefacts: the artefacts of each block, if any
+    """
+
+    def __init__(
+        self,
+        text: str,
+        word_offsets: np.ndarray,
+        confidences: np.ndarray,
+        geometries: np.ndarray,
+        objectness_scores: np.ndarray,
+        crop_angles: np.ndarray,
+        crop_confidences: np.ndarray,
+        line_offsets: np.ndarray,
+        block_offsets: np.ndarray,
+        line_geometries: np.ndarray | None = None,
+        line_objectness_scores: np.ndarray | None = None,
+        block_geometries: np.ndarray | None = None,
+        block_objectness_scores: np.ndarray | None = None,
+        artefacts: list[list[Artefact]] | None = None,
+    ) -> None:
+        self.text = text
+        self.word_offsets = word_offsets
+        self.confidences = confidences
+        self.geometries = geometries
+        self.objectness_scores = objectness_scores
+        self.crop_angles = crop_angles
+        self.crop_confidences = crop_confidences
+        self.line_offsets = line_offsets
+        self.block_offsets = block_offsets
+        self.line_geometries = line_geometries
+        self.line_objectness_scores = line_objectness_scores
+        self.block_geometries = block_geometries
+        self.block_objectness_scores = block_objectness_scores
+        self.artefacts = artefacts
+
+    @classmethod
+    def from_columns(
+        cls,
+        values: list[str],
+        confidences: np.ndarray,
+        geometries: np.ndarray,
+        objectness_scores: np.ndarray,
+        crop_orientations: list[dict[str, Any]],
+        line_offsets: np.ndarray,
+        block_offsets: np.ndarray,
+        **kwargs: Any,
+    ) -> "WordTable":
+        """Build a table from the values & crop orientations of the words, and their other columns
+
+        Args:
+            values: the text of the words
+            confidences: the confidences of the text predictions, of shape (N,)
+            geometries: the bounding boxes of the words, of shape (N, 4) or (N, 4, 2)
+            objectness_scores: the objectness scores of the detections, of shape (N,)
+            crop_orientations: the general orientation of each crop, with its confidence
+            line_offsets: the index of the first word of each line, of shape (L + 1,)
+            block_offsets: the index of the first line of each block, of shape (B + 1,)
+            **kwargs: the optional line & block columns of the table
+
+        Returns:
+            the word table
+        """
+        word_offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum([len(value) + 1 for value in values], out=word_offsets[1:])
+        return cls(
+            " ".join(values),
+            word_offsets,
+            np.asarray(confidences, dtype=np.float64),
+            geometries,
+            np.asarray(objectness_scores, dtype=np.float64),
+            np.asarray([orientation["value"] for orientation in crop_orientations]),
+            np.asarray(
+                [
+                    np.nan if orientation["confidence"] is None else orientation["confidence"]
+                    for orientation in crop_orientations
+                ],
+                dtype=np.float64,
+            ),
+            np.asarray(line_offsets, dtype=np.int64),
+            np.asarray(block_offsets, dtype=np.int64),
+            **kwargs,
+        )
+
+    @classmethod
+    def from_blocks(cls, blocks: list[Block]) -> "WordTable":
+        """Build a table from block elements, keeping the geometries & scores of their lines and blocks
+
+        Args:
+            blocks: list of block elements
+
+        Returns:
+            the word table
+        """
+        lines = [line for block in blocks for line in block.lines]
+        words = [word for line in lines for word in line.words]
+        line_offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+        np.cumsum([len(line.words) for line in lines], out=line_offsets[1:])
+        block_offsets = np.zeros(len(blocks) + 1, dtype=np.int64)
+        np.cumsum([len(block.lines) for block in blocks], out=block_offsets[1:])
+        return cls.from_columns(
+            values=[word.value for word in words],
+            confidences=np.asarray([word.confidence for word in words], dtype=np.float64),
+            geometries=_stack_geometries([word.geometry for word in words]),
+            objectness_scores=np.asarray([word.objectness_score for word in words], dtype=np.float64),
+            crop_orientations=[word.crop_orientation for word in words],
+            line_offsets=line_offsets,
+            block_offsets=block_offsets,
+            line_geometries=_stack_geometries([line.geometry for line in lines]),
+            line_objectness_scores=np.asarray([line.objectness_score for line in lines], dtype=np.float64),
+            block_geometries=_stack_geometries([block.geometry for block in blocks]),
+            block_objectness_scores=np.asarray([block.objectness_score for block in blocks], dtype=np.float64),
+            artefacts=[block.artefacts for block in blocks] if any(len(block.artefacts) for block in blocks) else None,
+        )
+
+    def __len__(self) -> int:
+        return len(self.word_offsets) - 1
+
+    @property
+    def num_lines(self) -> int:
+        return len(self.line_offsets) - 1
+
+    @property
+    def num_blocks(self) -> int:
+        return len(self.block_offsets) - 1
+
+    @property
+    def values(self) -> list[str]:
+        """The text of each word"""
+        offsets = self.word_offsets.tolist()
+        return [self.text[start : end - 1] for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def render(self, line_break: str = "\n", block_break: str = "\n\n") -> tuple[str, np.ndarray]:
+        """Renders the full text of the table, as `Page.render` does, without building any element
+
+        Args:
+            line_break: the separator between the lines of a block
+            block_break: the separator between blocks
+
+        Returns:
+            the text, and the start & end positions of each line in it, of shape (L, 2)
+        """
+        # Words of a line are contiguous in `text`, separated by a space: each line is a single slice
+        line_starts = self.word_offsets[self.line_offsets[:-1]]
+        line_ends = np.maximum(self.word_offsets[self.line_offsets[1:]] - 1, line_starts)
+        lines = [self.text[start:end] for start, end in zip(line_starts.tolist(), line_ends.tolist())]
+        block_offsets = self.block_offsets.tolist()
+        text = block_break.join(
+            line_break.join(lines[first:last]) for first, last in zip(block_offsets[:-1], block_offsets[1:])
+        )
+
+        # Position of each line: length of the previous lines, and number of separators before it
+        lines_per_block = np.diff(self.block_offsets)
+        line_block_idcs = np.repeat(np.arange(self.num_blocks), lines_per_block)
+        prev_line_breaks = np.concatenate(([0], np.cumsum(np.maximum(lines_per_block - 1, 0))))[line_block_idcs]
+        num_line_breaks = prev_line_breaks + np.arange(self.num_lines) - self.block_offsets[line_block_idcs]
+        lengths = line_ends - line_starts
+        starts = np.cumsum(lengths) - lengths + num_line_breaks * len(line_break) + line_block_idcs * len(block_break)
+        return text, np.stack((starts, starts + lengths), axis=-1).astype(np.int64)
+
+    def export_words(self) -> dict[str, np.ndarray]:
+        """Exports the words as a flat table: one array per column, one row per word
+
+        Straight boxes are exported as `xmin`, `ymin`, `xmax` & `ymax` columns, rotated ones as `x1`, `y1`, ...,
+        `x4`, `y4` columns. The table can be loaded as is by pandas or pyarrow.
+
+        Returns:
+            the columns of the table
+        """
+        words_per_line = np.diff(self.line_offsets)
+        columns: dict[str, np.ndarray] = {"value": np.asarray(self.values, dtype=str)}
+        if self.geometries.ndim == 3:
+            for pt_idx in range(4):
+                columns[f"x{pt_idx + 1}"] = self.geometries[:, pt_idx, 0]
+                columns[f"y{pt_idx + 1}"] = self.geometries[:, pt_idx, 1]
+        else:
+            for col_idx, name in enumerate(("xmin", "ymin", "xmax", "ymax")):
+                columns[name] = self.geometries[:, col_idx]
+        columns.update({
+            "confidence": self.confidences,
+            "objectness_score": self.objectness_scores,
+            "crop_angle": self.crop_angles,
+            "crop_confidence": self.crop_confidences,
+            "block_idx": np.repeat(np.repeat(np.arange(self.num_blocks), np.diff(self.block_offsets)), words_per_line),
+            "line_idx": np.repeat(np.arange(self.num_lines), words_per_line),
+        })
+        return columns
+
+    def to_words(self, word_cls: type[Word] = Word) -> list[Word]:
+        """Build the word elements of the table
+
+        Args:
+            word_cls: the class of the elements to build (`Word` or `Prediction`)
+
+        Returns:
+            list of word elements, in reading order
+        """
+        if self.geometries.ndim == 3:
+            geometries = [tuple(tuple(pt) for pt in box) for box in self.geometries.tolist()]
+        else:
+            # Same scalar types as the boxes of the detection
+            geometries = [_straight_geometry(box) for box in self.geometries]
+        # Missing crop orientation confidences are stored as NaN, the only value not equal to itself
+        return [
+            word_cls(
+                value,
+                confidence,
+                geometry,
+                objectness_score,
+                {"value": angle, "confidence": None if conf != conf else conf},
+            )
+            for value, confidence, geometry, objectness_score, angle, conf in zip(
+                self.values,
+                self.confidences.tolist(),
+                geometries,
+                self.objectness_scores.tolist(),
+                self.crop_angles.tolist(),
+                self.crop_confidences.tolist(),
+            )
+        ]
+
+    def to_blocks(self) -> list[Block]:
+        """Build the block elements of the table
+
+        Returns:
+            list of block elements
+        """
+        words = self.to_words()
+        line_offsets = self.line_offsets.tolist()
+        lines = [
+            Line(
+                words[start:end],
+                None if self.line_geometries is None else self._geometry(self.line_geometries[idx]),
+                None if self.line_objectness_scores is None else float(self.line_objectness_scores[idx]),
+            )
+            for idx, (start, end) in enumerate(zip(line_offsets[:-1], line_offsets[1:]))
+        ]
+        block_offsets = self.block_offsets.tolist()
+        return [
+            Block(
+                lines[start:end],
+                [] if self.artefacts is None else self.artefacts[idx],
+                None if self.block_geometries is None else self._geometry(self.block_geometries[idx]),
+                None if self.block_objectness_scores is None else float(self.block_objectness_scores[idx]),
+            )
+            for idx, (start, end) in enumerate(zip(block_offsets[:-1], block_offsets[1:]))
+        ]
+
+    @staticmethod
+    def _geometry(box: np.ndarray) -> BoundingBox | np.ndarray:
+        # Rotated boxes of lines & blocks are arrays
+        return box if box.ndim == 2 else _straight_geometry(box)
+
+
 class Page(Element):
     """Implements a page element as a collection of blocks
 
     Args:
         page: image encoded as a numpy array in uint8
-        blocks: list of block elements
+        blocks: list of block elements, or the word table they are lazily built from
         page_idx: the index of the page in the input raw document
         dimensions: the page size in pixels in format (height, width)
         orientation: a dictionary with the value of the rotation angle in degress and confidence of the prediction
@@ -262,12 +577,14 @@ class Page(Element):
 
     _exported_keys: list[str] = ["page_idx", "dimensions", "orientation", "language"]
     _children_names: list[str] = ["blocks"]
-    blocks: list[Block] = []
+    # Block elements, built from the word table on first access when the page was created from one
+    _blocks: list[Block] | None
+    _word_table: WordTable | None
 
     def __init__(
         self,
         page: np.ndarray,
-        blocks: list[Block],
+        blocks: list[Block] | WordTable,
         page_idx: int,
         dimensions: tuple[int, int],
         orientation: dict[str, Any] | None = None,
@@ -280,9 +597,67 @@ class Page(Element):
         self.orientation = orientation if isinstance(orientation, dict) else dict(value=None, confidence=None)
         self.language = language if isinstance(language, dict) else dict(value=None, confidence=None)
 
-    def render(self, block_break: str = "\n\n") -> str:
+    @property
+    def blocks(self) -> list[Block]:
+        """Block elements of the page
+
+        When the page holds a word table, they are built on first access. From then on, they are the source of the
+        text & columnar accessors (`render`, `word_table`, `export_words`...), so that editing them is reflected there.
+        """
+        if self._blocks is None:
+            # Either the elements or the table are set
+            assert self._word_table is not None
+            self._blocks = self._word_table.to_blocks()
+        return self._blocks
+
+    @blocks.setter
+    def blocks(self, blocks: list[Block] | WordTable) -> None:
+        if isinstance(blocks, WordTable):
+            self._blocks, self._word_table = None, blocks
+        else:
+            self._blocks, self._word_table = blocks, None
+
+    @property
+    def word_table(self) -> WordTable:
+        """Columnar view of the words of the page"""
+        # The table is only read while no element was built (elements may have been edited since)
+        if self._blocks is None and self._word_table is not None:
+            return self._word_table
+        return WordTable.from_blocks(self.blocks)
+
+    def render(self, block_break: str = "\n\n", line_break: str = "\n") -> str:
         """Renders the full text of the element"""
-        return block_break.join(b.render() for b in self.blocks)
+        if self._blocks is None and self._word_table is not None:
+            return self._word_table.render(line_break, block_break)[0]
+        return block_break.join(b.render(line_break) for b in self.blocks)
+
+    def render_with_offsets(self, block_break: str = "\n\n", line_break: str = "\n") -> tuple[str, np.ndarray]:
+        """Renders the full text of the element, along with the position of each line in it
+
+        >>> text, line_spans = page.render_with_offsets()
+        >>> start, end = line_spans[0]
+        >>> first_line = text[start:end]
+
+        Args:
+            block_break: the separator between blocks
+            line_break: the separator between the lines of a block
+
+        Returns:
+            the text, and the start & end positions of each line in it, of shape (L, 2), lines being numbered as in
+            the `line_idx` column of `export_words`
+        """
+        return self.word_table.render(line_break, block_break)
+
+    def export_words(self) -> dict[str, np.ndarray]:
+        """Exports the words of the page as a flat table, see `WordTable.export_words`
+
+        >>> import pandas as pd
+        >>> words = pd.DataFrame(page.export_words())
+
+        Returns:
+            the columns of the table, one row per word
+        """
+        return self.word_table.export_words()
 
     def extra_repr(self) -> str:
         return f"dimensions={self.dimensions}"
@@ -367,8 +742,8 @@ class Page(Element):
                 attrib={
                     "class": "ocr_carea",
                     "id": f"block_{block_count}",
-                    "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} \
-                    {int(round(xmax * width))} {int(round(ymax * height))}",
+                    "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} "
+                    f"{int(round(xmax * width))} {int(round(ymax * height))}",
                 },
             )
             paragraph = SubElement(
@@ -377,8 +752,8 @@ class Page(Element):
                 attrib={
                     "class": "ocr_par",
                     "id": f"par_{block_count}",
-                    "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} \
-                    {int(round(xmax * width))} {int(round(ymax * height))}",
+                    "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} "
+                    f"{int(round(xmax * width))} {int(round(ymax * height))}",
                 },
             )
             block_count += 1
@@ -391,9 +766,9 @@ class Page(Element):
                     attrib={
                         "class": "ocr_line",
                         "id": f"line_{line_count}",
-                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} \
-                        {int(round(xmax * width))} {int(round(ymax * height))}; \
-                        baseline 0 0; x_size 0; x_descenders 0; x_ascenders 0",
+                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} "
+                        f"{int(round(xmax * width))} {int(round(ymax * height))}; "
+                        "baseline 0 0; x_size 0; x_descenders 0; x_ascenders 0",
                     },
                 )
                 line_count += 1
@@ -406,9 +781,9 @@ class Page(Element):
                         attrib={
                             "class": "ocrx_word",
                             "id": f"word_{word_count}",
-                            "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} \
-                            {int(round(xmax * width))} {int(round(ymax * height))}; \
-                            x_wconf {int(round(conf * 100))}",
+                            "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} "
+                            f"{int(round(xmax * width))} {int(round(ymax * height))}; "
+                            f"x_wconf {int(round(conf * 100))}",
                         },
                     )
                     # set the text
@@ -546,8 +921,8 @@ class KIEPage(Element):
                     attrib={
                         "class": "ocr_carea",
                         "id": f"{class_name}_prediction_{prediction_count}",
-                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} \
-                        {int(round(xmax * width))} {int(round(ymax * height))}",
+                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} "
+                        f"{int(round(xmax * width))} {int(round(ymax * height))}",
                     },
                 )
                 # NOTE: ocr_par, ocr_line and ocrx_word are the same because the KIE predictions contain only words
@@ -558,8 +933,8 @@ class KIEPage(Element):
                     attrib={
                         "class": "ocr_par",
                         "id": f"{class_name}_par_{prediction_count}",
-                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} \
-                        {int(round(xmax * width))} {int(round(ymax * height))}",
+                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} "
+                        f"{int(round(xmax * width))} {int(round(ymax * height))}",
                     },
                 )
                 line_span = SubElement(
@@ -568,9 +943,9 @@ class KIEPage(Element):
                     attrib={
                         "class": "ocr_line",
                         "id": f"{class_name}_line_{prediction_count}",
-                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} \
-                        {int(round(xmax * width))} {int(round(ymax * height))}; \
-                        baseline 0 0; x_size 0; x_descenders 0; x_ascenders 0",
+                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} "
+                        f"{int(round(xmax * width))} {int(round(ymax * height))}; "
+                        "baseline 0 0; x_size 0; x_descenders 0; x_ascenders 0",
                     },
                 )
                 word_div = SubElement(
@@ -579,9 +954,9 @@ class KIEPage(Element):
                     attrib={
                         "class": "ocrx_word",
                         "id": f"{class_name}_word_{prediction_count}",
-                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} \
-                        {int(round(xmax * width))} {int(round(ymax * height))}; \
-                        x_wconf {int(round(prediction.confidence * 100))}",
+                        "title": f"bbox {int(round(xmin * width))} {int(round(ymin * height))} "
+                        f"{int(round(xmax * width))} {int(round(ymax * height))}; "
+                        f"x_wconf {int(round(prediction.confidence * 100))}",
                     },
                 )
                 word_div.text = prediction.value
@@ -614,9 +989,31 @@ class Document(Element):
     ) -> None:
         super().__init__(pages=pages)
 
-    def render(self, page_break: str = "\n\n\n\n") -> str:
+    def render(self, page_break: str = "\n\n\n\n", block_break: str = "\n\n", line_break: str = "\n") -> str:
         """Renders the full text of the element"""
-        return page_break.join(p.render() for p in self.pages)
+        return page_break.join(p.render(block_break, line_break) for p in self.pages)
+
+    def export_words(self) -> dict[str, np.ndarray]:
+        """Exports the words of the document as a flat table, see `WordTable.export_words`
+
+        Block & line indices are relative to the page, given by the `page_idx` column.
+
+        >>> import pyarrow as pa
+        >>> words = pa.table(doc.export_words())
+
+        Returns:
+            the columns of the table, one row per word
+        """
+        tables = [(page.page_idx, page.export_words()) for page in self.pages]
+        # Empty pages can't tell whether their boxes are straight or rotated
+        tables = [(page_idx, table) for page_idx, table in tables if len(table["value"]) > 0] or tables[:1]
+        if len(tables) == 0:
+            return {}
+        columns = {name: np.concatenate([table[name] for _, table in tables]) for name in tables[0][1]}
+        columns["page_idx"] = np.concatenate([
+            np.full(len(table["value"]), page_idx, dtype=np.int64) for page_idx, table in tables
+        ])
+        return columns
 
     def show(self, **kwargs) -> None:
         """Overlay the result on a given image"""
@@ -667,3 +1064,7 @@ class KIEDocument(Document):
         pages: list[KIEPage],
     ) -> None:
         super().__init__(pages=pages)  # type: ignore[arg-type]
+
+    def render(self, page_break: str = "\n\n\n\n", prediction_break: str = "\n\n") -> str:  # type: ignore[override]
+        """Renders the full text of the element"""
+        return page_break.join(p.render(prediction_break) for p in self.pages)
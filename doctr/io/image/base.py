@@ -24,7 +24,7 @@ def read_img_as_numpy(
     >>> page = read_img_as_numpy("path/to/your/doc.jpg")
 
     Args:
-        file: the path to the image file
+        file: the path to the image file or its content (bytes, bytearray or memoryview)
         output_size: the expected output size of each page in format H x W
         rgb_output: whether the output ndarray channel order should be RGB instead of BGR.
 
@@ -35,7 +35,8 @@ def read_img_as_numpy(
         if not Path(file).is_file():
             raise FileNotFoundError(f"unable to access {file}")
         img = cv2.imread(str(file), cv2.IMREAD_COLOR)
-    elif isinstance(file, bytes):
+    elif isinstance(file, (bytes, bytearray, memoryview)):
+        # Decoded straight from the buffer, without copying it
         _file: np.ndarray = np.frombuffer(file, np.uint8)
         img = cv2.imdecode(_file, cv2.IMREAD_COLOR)
     else:
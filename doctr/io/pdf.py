@@ -3,7 +3,8 @@
 # This program is licensed under the Apache License 2.0.
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
-from typing import Any
+import ctypes
+from typing import Any, BinaryIO
 
 import numpy as np
 import pypdfium2 as pdfium
@@ -13,8 +14,22 @@ from doctr.utils.common_types import AbstractFile
 __all__ = ["read_pdf"]
 
 
+def _as_pdfium_input(file: AbstractFile | BinaryIO) -> Any:
+    """Convert in-memory buffers to an input pypdfium2 can load without copying them"""
+    if not isinstance(file, (bytearray, memoryview)):
+        # Paths, bytes & binary streams are natively supported
+        return file
+    view = memoryview(file)
+    if not view.readonly and view.c_contiguous:
+        # ctypes array sharing the memory of the buffer
+        return (ctypes.c_char * view.nbytes).from_buffer(view)
+    if isinstance(view.obj, bytes) and view.nbytes == len(view.obj):
+        return view.obj
+    return view.tobytes()
+
+
 def read_pdf(
-    file: AbstractFile,
+    file: AbstractFile | BinaryIO,
     scale: int = 2,
     rgb_mode: bool = True,
     password: str | None = None,
@@ -26,7 +41,7 @@ def read_pdf(
     >>> doc = read_pdf("path/to/your/doc.pdf")
 
     Args:
-        file: the path to the PDF file
+        file: the path to the PDF file, its content (bytes, bytearray or memoryview) or a seekable binary stream
         scale: rendering scale (1 corresponds to 72dpi)
         rgb_mode: if True, the output will be RGB, otherwise BGR
         password: a password to unlock the document, if encrypted
@@ -36,7 +51,7 @@ def read_pdf(
         the list of pages decoded as numpy ndarray of shape H x W x C
     """
     # Rasterise pages to numpy ndarrays with pypdfium2
-    pdf = pdfium.PdfDocument(file, password=password)
+    pdf = pdfium.PdfDocument(_as_pdfium_input(file), password=password)
     try:
         return [page.render(scale=scale, rev_byteorder=rgb_mode, **kwargs).to_numpy() for page in pdf]
     finally:
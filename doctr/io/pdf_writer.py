@@ -0,0 +1,214 @@
+# Copyright (C) 2021-2025, Mindee.
+
+# This program is licensed under the Apache License 2.0.
+# See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
+
+import ctypes
+import logging
+import multiprocessing as mp
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO
+
+import numpy as np
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+
+from doctr.file_utils import ENV_VARS_TRUE_VALUES
+from doctr.utils.common_types import AbstractFile, AbstractPath
+
+from .elements import Document, KIEPage, _stack_geometries
+from .pdf import _as_pdfium_input
+
+__all__ = ["write_searchable_pdf", "write_searchable_pdfs"]
+
+# (page index, words, relative boxes (xmin, ymin, xmax, ymax) of shape (N, 4))
+_TextLayer = tuple[int, list[str], np.ndarray]
+
+# Directions of the display axes (rightwards & downwards) in PDF user space, for each page rotation
+_DISPLAY_AXES = {
+    0: ((1, 0), (0, -1)),
+    90: ((0, 1), (1, 0)),
+    180: ((-1, 0), (0, 1)),
+    270: ((0, -1), (-1, 0)),
+}
+# Standard fonts only have glyphs for the characters of their built-in encoding, which is WinAnsi except for these
+_SYMBOLIC_FONTS = {"Symbol", "ZapfDingbats"}
+
+
+def _text_layers(doc: Document) -> list[_TextLayer]:
+    """Gather the words of each page of a document, with their boxes"""
+    layers = []
+    for page in doc.pages:
+        if isinstance(page, KIEPage):
+            predictions = [pred for preds in page.predictions.values() for pred in preds]
+            values = [pred.value for pred in predictions]
+            geometries = _stack_geometries([pred.geometry for pred in predictions])
+        else:
+            table = page.word_table
+            values, geometries = table.values, table.geometries
+        if geometries.ndim == 3:
+            # Rotated boxes are approximated by their enclosing straight box
+            geometries = np.concatenate([geometries.min(axis=1), geometries.max(axis=1)], axis=1)
+        layers.append((page.page_idx, values, np.asarray(geometries, dtype=np.float64)))
+    return layers
+
+
+def _is_winansi(value: str) -> bool:
+    try:
+        value.encode("cp1252")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _write_text_layers(
+    file: AbstractFile | BinaryIO,
+    layers: list[_TextLayer],
+    output: AbstractPath | BinaryIO,
+    password: str | None = None,
+    font_name: str = "Helvetica",
+) -> None:
+    """Add the words of each layer as invisible text on the matching page of a PDF, then save it"""
+    pdf = pdfium.PdfDocument(_as_pdfium_input(file), password=password)
+    font = pdfium_c.FPDFText_LoadStandardFont(pdf.raw, font_name.encode("ascii"))
+    if not font:
+        pdf.close()
+        raise ValueError(f"unknown standard font: {font_name}")
+    bounds = [ctypes.c_float() for _ in range(4)]
+    num_skipped = 0
+    try:
+        for page_idx, values, boxes in layers:
+            if page_idx >= len(pdf):
+                raise ValueError(f"the PDF has no page {page_idx}")
+            page = pdf[page_idx]
+            try:
+                # Rendered pages (and thus the OCR boxes) cover the crop box, displayed with the page rotation
+                left, bottom, right, top = page.get_cropbox()
+                rotation = page.get_rotation()
+                axis_u, axis_v = _DISPLAY_AXES[rotation]
+                origin = {0: (left, top), 90: (left, bottom), 180: (right, bottom), 270: (right, top)}[rotation]
+                width, height = right - left, top - bottom
+                if rotation in (90, 270):
+                    width, height = height, width
+                # Boxes in display points
+                boxes = boxes * np.array([width, height, width, height])
+                for value, (xmin, ymin, xmax, ymax) in zip(values, boxes.tolist()):
+                    if len(value) == 0 or xmax <= xmin or ymax <= ymin:
+                        continue
+                    if font_name not in _SYMBOLIC_FONTS and not _is_winansi(value):
+                        # The word would be written with missing glyphs, and extracted as such
+                        num_skipped += 1
+                        continue
+                    obj = pdfium_c.FPDFPageObj_CreateTextObj(pdf.raw, font, 1.0)
+                    text = ctypes.create_string_buffer((value + "\0").encode("utf-16-le"))
+                    pdfium_c.FPDFText_SetText(obj, ctypes.cast(text, pdfium_c.FPDF_WIDESTRING))
+                    pdfium_c.FPDFPageObj_GetBounds(obj, *bounds)
+                    glyph_left, glyph_bottom, glyph_right, glyph_top = (bound.value for bound in bounds)
+                    if glyph_right <= glyph_left or glyph_top <= glyph_bottom:
+                        pdfium_c.FPDFPageObj_Destroy(obj)
+                        continue
+                    # Stretch the text so that its glyphs fill the box of the word
+                    scale_x = (xmax - xmin) / (glyph_right - glyph_left)
+                    scale_y = (ymax - ymin) / (glyph_top - glyph_bottom)
+                    u = xmin - glyph_left * scale_x
+                    v = ymax + glyph_bottom * scale_y
+                    pdfium_c.FPDFPageObj_SetMatrix(
+                        obj,
+                        pdfium_c.FS_MATRIX(
+                            scale_x * axis_u[0],
+                            scale_x * axis_u[1],
+                            -scale_y * axis_v[0],
+                            -scale_y * axis_v[1],
+                            origin[0] + u * axis_u[0] + v * axis_v[0],
+                            origin[1] + u * axis_u[1] + v * axis_v[1],
+                        ),
+                    )
+                    pdfium_c.FPDFTextObj_SetTextRenderMode(obj, pdfium_c.FPDF_TEXTRENDERMODE_INVISIBLE)
+                    # The page takes the ownership of the object
+                    pdfium_c.FPDFPage_InsertObject(page.raw, obj)
+                page.gen_content()
+            finally:
+                page.close()
+        if num_skipped > 0:
+            logging.warning(
+                f"{num_skipped} word(s) not written: their characters are out of the encoding of the {font_name} font"
+            )
+        pdf.save(output)
+    finally:
+        pdfium_c.FPDFFont_Close(font)
+        pdf.close()
+
+
+def write_searchable_pdf(
+    file: AbstractFile | BinaryIO,
+    doc: Document,
+    output: AbstractPath | BinaryIO,
+    password: str | None = None,
+    font_name: str = "Helvetica",
+) -> None:
+    """Make a PDF searchable, by adding the OCR result as an invisible text layer on its pages
+
+    The pages are not rasterized again: the original content is kept as is, each word is written at the position
+    of its box. Pages are matched by their `page_idx`, the document is expected to result from the analysis of
+    the PDF pages as rendered by `DocumentFile.from_pdf`.
+
+    >>> from doctr.io import DocumentFile, write_searchable_pdf
+    >>> result = model(DocumentFile.from_pdf("path/to/your/doc.pdf"))
+    >>> write_searchable_pdf("path/to/your/doc.pdf", result, "path/to/your/searchable_doc.pdf")
+
+    Args:
+        file: the path to the source PDF file, its content or a seekable binary stream
+        doc: the OCR (or KIE) result of the PDF
+        output: the path of the output PDF file, or a binary stream
+        password: a password to unlock the source document, if encrypted
+        font_name: the name of the standard PDF font used for the text layer. Words with characters out of its
+            encoding (WinAnsi for the Latin fonts) are not written.
+    """
+    _write_text_layers(file, _text_layers(doc), output, password, font_name)
+
+
+def write_searchable_pdfs(
+    files: Sequence[AbstractFile],
+    docs: Sequence[Document],
+    outputs: Sequence[AbstractPath],
+    num_workers: int | None = None,
+    password: str | None = None,
+    font_name: str = "Helvetica",
+) -> None:
+    """Make a batch of PDF files searchable, in parallel processes (see `write_searchable_pdf`)
+
+    >>> from doctr.io import write_searchable_pdfs
+    >>> write_searchable_pdfs(paths, results, [path.with_suffix(".ocr.pdf") for path in paths])
+
+    Args:
+        files: the paths to the source PDF files, or their content
+        docs: the OCR (or KIE) result of each PDF
+        outputs: the paths of the output PDF files
+        num_workers: number of worker processes, defaults to the number of CPUs (up to 16)
+        password: a password to unlock the source documents, if encrypted
+        font_name: the name of the standard PDF font used for the text layer
+
+    Notes:
+        PDFium is not thread-safe, so documents are processed in separate processes. To process them in the current
+        one, set 'DOCTR_MULTIPROCESSING_DISABLE' to 'TRUE'.
+    """
+    if not len(files) == len(docs) == len(outputs):
+        raise ValueError("files, docs and outputs are expected to have the same length")
+    # Only the words & boxes are sent to the workers, not the page images
+    layers = [_text_layers(doc) for doc in docs]
+    num_workers = num_workers if isinstance(num_workers, int) else min(16, mp.cpu_count())
+    num_workers = min(num_workers, len(files))
+    if num_workers < 2 or os.environ.get("DOCTR_MULTIPROCESSING_DISABLE", "").upper() in ENV_VARS_TRUE_VALUES:
+        for file, doc_layers, output in zip(files, layers, outputs):
+            _write_text_layers(file, doc_layers, output, password, font_name)
+        return
+    # Spawned workers don't inherit the state of PDFium (or of any other library) from the parent
+    with ProcessPoolExecutor(num_workers, mp_context=mp.get_context("spawn")) as executor:
+        futures = [
+            executor.submit(_write_text_layers, file, doc_layers, output, password, font_name)
+            for file, doc_layers, output in zip(files, layers, outputs)
+        ]
+        for future in futures:
+            future.result()
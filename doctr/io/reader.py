@@ -5,6 +5,7 @@
 
 from collections.abc import Sequence
 from pathlib import Path
+from typing import BinaryIO
 
 import numpy as np
 
@@ -22,14 +23,14 @@ class DocumentFile:
     """Read a document from multiple extensions"""
 
     @classmethod
-    def from_pdf(cls, file: AbstractFile, **kwargs) -> list[np.ndarray]:
+    def from_pdf(cls, file: AbstractFile | BinaryIO, **kwargs) -> list[np.ndarray]:
         """Read a PDF file
 
         >>> from doctr.io import DocumentFile
         >>> doc = DocumentFile.from_pdf("path/to/your/doc.pdf")
 
         Args:
-            file: the path to the PDF file or a binary stream
+            file: the path to the PDF file, its content (bytes, bytearray or memoryview) or a seekable binary stream
             **kwargs: additional parameters to :meth:`pypdfium2.PdfPage.render`
 
         Returns:
@@ -73,7 +74,7 @@ class DocumentFile:
         Returns:
             the list of pages decoded as numpy ndarray of shape H x W x 3
         """
-        if isinstance(files, (str, Path, bytes)):
+        if isinstance(files, (str, Path, bytes, bytearray, memoryview)):
             files = [files]
 
         return [read_img_as_numpy(file, **kwargs) for file in files]
@@ -0,0 +1,225 @@
+# Copyright (C) 2021-2025, Mindee.
+
+# This program is licensed under the Apache License 2.0.
+# See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
+
+import json
+import mmap
+import struct
+from typing import Any, cast
+
+import numpy as np
+
+from doctr.utils.common_types import AbstractPath, BoundingBox
+
+from .elements import Artefact, Document, KIEDocument, KIEPage, Page, Prediction, WordTable, _stack_geometries
+
+__all__ = ["save_document", "load_document"]
+
+# File layout: magic, version & header size, the JSON header, then the raw arrays it references
+_MAGIC = b"DOCTRBIN"
+_VERSION = 1
+_PREFIX = struct.Struct("<8sIQ")
+# Arrays are aligned so that their memory-mapped views are aligned as well
+_ALIGNMENT = 64
+
+_TABLE_COLUMNS = [
+    "word_offsets",
+    "confidences",
+    "geometries",
+    "objectness_scores",
+    "crop_angles",
+    "crop_confidences",
+    "line_offsets",
+    "block_offsets",
+]
+_OPTIONAL_COLUMNS = ["line_geometries", "line_objectness_scores", "block_geometries", "block_objectness_scores"]
+
+
+class _ArrayWriter:
+    """Lays out arrays one after the other, keeping track of their location"""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes | memoryview] = []
+        self.size = 0
+
+    def add(self, array: np.ndarray) -> list[Any]:
+        if array.dtype == object:
+            raise TypeError("arrays of Python objects can't be serialized")
+        array = np.ascontiguousarray(array)
+        padding = -self.size % _ALIGNMENT
+        if padding > 0:
+            self.chunks.append(b"\0" * padding)
+            self.size += padding
+        offset = self.size
+        self.chunks.append(array.reshape(-1).view(np.uint8).data)
+        self.size += array.nbytes
+        return [offset, array.dtype.str, list(array.shape)]
+
+
+def _json_default(obj: Any) -> Any:
+    # Numpy scalars of the orientation & language predictions
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_table(table: WordTable, writer: _ArrayWriter) -> dict[str, Any]:
+    arrays = {"text": writer.add(np.frombuffer(table.text.encode("utf-8"), dtype=np.uint8))}
+    arrays.update({name: writer.add(getattr(table, name)) for name in _TABLE_COLUMNS})
+    arrays.update({
+        name: writer.add(getattr(table, name)) for name in _OPTIONAL_COLUMNS if getattr(table, name) is not None
+    })
+    return arrays
+
+
+def _load_table(arrays: dict[str, np.ndarray], artefacts: list[list[Artefact]] | None = None) -> WordTable:
+    return WordTable(
+        bytes(arrays["text"]).decode("utf-8"),
+        word_offsets=arrays["word_offsets"],
+        confidences=arrays["confidences"],
+        geometries=arrays["geometries"],
+        objectness_scores=arrays["objectness_scores"],
+        crop_angles=arrays["crop_angles"],
+        crop_confidences=arrays["crop_confidences"],
+        line_offsets=arrays["line_offsets"],
+        block_offsets=arrays["block_offsets"],
+        line_geometries=arrays.get("line_geometries"),
+        line_objectness_scores=arrays.get("line_objectness_scores"),
+        block_geometries=arrays.get("block_geometries"),
+        block_objectness_scores=arrays.get("block_objectness_scores"),
+        artefacts=artefacts,
+    )
+
+
+def _kie_table(predictions: list[Prediction]) -> WordTable:
+    # Each prediction is a line & a block on its own
+    offsets = np.arange(len(predictions) + 1, dtype=np.int64)
+    return WordTable.from_columns(
+        values=[pred.value for pred in predictions],
+        confidences=np.asarray([pred.confidence for pred in predictions], dtype=np.float64),
+        geometries=_stack_geometries([pred.geometry for pred in predictions]),
+        objectness_scores=np.asarray([pred.objectness_score for pred in predictions], dtype=np.float64),
+        crop_orientations=[pred.crop_orientation for pred in predictions],
+        line_offsets=offsets,
+        block_offsets=offsets,
+    )
+
+
+def save_document(doc: Document, path: AbstractPath, include_images: bool = False) -> None:
+    """Save a document in a binary file, which can be loaded back with `load_document`
+
+    Words are stored column-wise (see `WordTable`), so that loading them back doesn't require parsing each of them.
+
+    >>> from doctr.io import save_document
+    >>> save_document(result, "result.doctr")
+
+    Args:
+        doc: the document (or KIE document) to save
+        path: the path of the output file
+        include_images: whether the images of the pages should be saved as well
+    """
+    writer = _ArrayWriter()
+    pages: list[dict[str, Any]] = []
+    for page in doc.pages:
+        page_info = {name: getattr(page, name) for name in Page._exported_keys}
+        if include_images and isinstance(page.page, np.ndarray):
+            page_info["image"] = writer.add(page.page)
+        if isinstance(page, KIEPage):
+            page_info["predictions"] = {
+                class_name: _dump_table(_kie_table(predictions), writer)
+                for class_name, predictions in page.predictions.items()
+            }
+        else:
+            table = page.word_table
+            page_info["arrays"] = _dump_table(table, writer)
+            if table.artefacts is not None:
+                page_info["artefacts"] = [
+                    [[artefact.type, artefact.confidence, artefact.geometry] for artefact in artefacts]
+                    for artefacts in table.artefacts
+                ]
+        pages.append(page_info)
+
+    header = json.dumps(
+        {"type": "kie" if isinstance(doc, KIEDocument) else "ocr", "pages": pages}, default=_json_default
+    ).encode("utf-8")
+    # The data section starts aligned
+    header += b" " * (-(_PREFIX.size + len(header)) % _ALIGNMENT)
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(_MAGIC, _VERSION, len(header)))
+        f.write(header)
+        for chunk in writer.chunks:
+            f.write(chunk)
+
+
+def load_document(path: AbstractPath, page_indices: list[int] | None = None) -> Document:
+    """Load a document saved with `save_document`
+
+    The file is memory-mapped: the arrays of the pages are read-only views on it, and only the pages which are
+    accessed are read from the disk. Elements of OCR pages are built on first access to their blocks, while
+    `Page.render` & `Page.export_words` work on the arrays directly.
+
+    >>> from doctr.io import load_document
+    >>> doc = load_document("result.doctr", page_indices=[0])
+
+    Args:
+        path: the path of the file
+        page_indices: the indices of the pages to load, all of them by default
+
+    Returns:
+        the document (or KIE document)
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size or _PREFIX.unpack(prefix)[0] != _MAGIC:
+            raise ValueError(f"{path} is not a serialized docTR document")
+        _, version, header_size = _PREFIX.unpack(prefix)
+        if version > _VERSION:
+            raise ValueError(f"unsupported serialization version: {version}")
+        header = json.loads(f.read(header_size))
+        # The mapping stays open as long as arrays reference it
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    data_start = _PREFIX.size + header_size
+
+    def _arrays(spec: dict[str, list[Any]]) -> dict[str, np.ndarray]:
+        return {
+            name: np.frombuffer(
+                buffer, dtype=np.dtype(dtype), count=int(np.prod(shape)), offset=data_start + offset
+            ).reshape(shape)
+            for name, (offset, dtype, shape) in spec.items()
+        }
+
+    page_infos = header["pages"]
+    if page_indices is not None:
+        page_infos = [page_infos[idx] for idx in page_indices]
+
+    pages: list[Any] = []
+    for info in page_infos:
+        image = _arrays({"image": info["image"]})["image"] if "image" in info else None
+        kwargs = dict(
+            page_idx=info["page_idx"],
+            dimensions=tuple(info["dimensions"]),
+            orientation=info["orientation"],
+            language=info["language"],
+        )
+        if header["type"] == "kie":
+            predictions = {
+                class_name: _load_table(_arrays(spec)).to_words(Prediction)
+                for class_name, spec in info["predictions"].items()
+            }
+            pages.append(KIEPage(image, predictions, **kwargs))  # type: ignore[arg-type]
+        else:
+            artefacts = (
+                [
+                    [
+                        Artefact(artefact_type, confidence, cast(BoundingBox, tuple(map(tuple, geometry))))
+                        for artefact_type, confidence, geometry in block
+                    ]
+                    for block in info["artefacts"]
+                ]
+                if "artefacts" in info
+                else None
+            )
+            pages.append(Page(image, _load_table(_arrays(info["arrays"]), artefacts), **kwargs))  # type: ignore[arg-type]
+
+    return KIEDocument(pages) if header["type"] == "kie" else Document(pages)
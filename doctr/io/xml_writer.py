@@ -0,0 +1,217 @@
+# Copyright (C) 2021-2025, Mindee.
+
+# This program is licensed under the Apache License 2.0.
+# See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
+
+from collections.abc import Iterator
+from typing import IO
+
+import numpy as np
+
+import doctr
+
+from .elements import KIEPage, Page
+
+__all__ = ["write_hocr", "write_alto"]
+
+_ATTR_ENTITIES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# (value, pixel box, confidence)
+_WordItem = tuple[str, list[int], float]
+# (pixel box, words)
+_LineItem = tuple[list[int], list[_WordItem]]
+
+
+def _escape(text: str) -> str:
+    return text.translate(_ATTR_ENTITIES)
+
+
+def _to_pixels(boxes: np.ndarray, width: int, height: int) -> list[list[int]]:
+    """Convert relative boxes (xmin, ymin, xmax, ymax) to rounded pixel coordinates"""
+    if boxes.ndim != 2:
+        raise TypeError("XML export is only available for straight bounding boxes for now.")
+    scale = np.array([width, height, width, height], dtype=boxes.dtype)
+    return np.round(boxes * scale).astype(np.int64).tolist()
+
+
+def _enclosing_boxes(boxes: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Smallest boxes enclosing each (non-empty) group of consecutive boxes"""
+    starts = offsets[:-1]
+    return np.concatenate(
+        [np.minimum.reduceat(boxes[:, :2], starts, axis=0), np.maximum.reduceat(boxes[:, 2:], starts, axis=0)], axis=1
+    )
+
+
+def _page_blocks(page: Page | KIEPage) -> Iterator[tuple[str, list[int], list[_LineItem]]]:
+    """Iterate over the blocks of a page, in pixel coordinates, without building its elements
+
+    Yields:
+        the prefix of the element identifiers, the box of the block and its lines
+    """
+    height, width = page.dimensions
+    if isinstance(page, KIEPage):
+        # Each prediction is a block with a single line & word
+        for class_name, predictions in page.predictions.items():
+            for prediction in predictions:
+                if len(prediction.geometry) != 2:
+                    raise TypeError("XML export is only available for straight bounding boxes for now.")
+                box = _to_pixels(np.asarray(prediction.geometry).reshape(1, 4), width, height)[0]
+                yield f"{class_name}_", box, [(box, [(prediction.value, box, prediction.confidence)])]
+        return
+
+    table = page.word_table
+    if len(table) == 0:
+        return
+    words = _to_pixels(table.geometries, width, height)
+    if table.line_geometries is not None:
+        line_boxes = table.line_geometries
+    else:
+        line_boxes = _enclosing_boxes(table.geometries, table.line_offsets)
+    if table.block_geometries is not None:
+        block_boxes = table.block_geometries
+    else:
+        block_boxes = _enclosing_boxes(table.geometries, table.line_offsets[table.block_offsets])
+        if table.artefacts is not None:
+            for idx, artefacts in enumerate(table.artefacts):
+                if len(artefacts) > 0:
+                    block_boxes[idx] = _enclosing_boxes(
+                        np.concatenate([block_boxes[idx : idx + 1], [np.ravel(a.geometry) for a in artefacts]]),
+                        np.array([0, len(artefacts) + 1]),
+                    )[0]
+    lines = _to_pixels(line_boxes, width, height)
+    blocks = _to_pixels(block_boxes, width, height)
+
+    values, confidences = table.values, table.confidences.tolist()
+    word_offsets, line_offsets = table.line_offsets.tolist(), table.block_offsets.tolist()
+    for block_idx, block_box in enumerate(blocks):
+        block_lines = []
+        for line_idx in range(line_offsets[block_idx], line_offsets[block_idx + 1]):
+            start, end = word_offsets[line_idx], word_offsets[line_idx + 1]
+            block_lines.append((
+                lines[line_idx],
+                list(zip(values[start:end], words[start:end], confidences[start:end])),
+            ))
+        yield "", block_box, block_lines
+
+
+def write_hocr(page: Page | KIEPage, f: IO[bytes], file_title: str = "docTR - XML export (hOCR)") -> None:
+    """Write a page as XML (hOCR-format) in a binary file, one block at a time
+    convention: https://github.com/kba/hocr-spec/blob/master/1.2/spec.md
+
+    Unlike `Page.export_as_xml`, no element tree is built, which keeps the memory usage low on large batches.
+
+    >>> from doctr.io import write_hocr
+    >>> for page in result.pages:
+    >>>     with open(f"page_{page.page_idx}.hocr", "wb") as f:
+    >>>         write_hocr(page, f)
+
+    Args:
+        page: the page (or KIE page) to export
+        f: the binary file handle to write to
+        file_title: the title of the XML file
+    """
+    height, width = page.dimensions
+    language = page.language.get("value") or "en"
+    f.write(
+        (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="{_escape(str(language))}">\n'
+            f"<head>\n<title>{_escape(file_title)}</title>\n"
+            '<meta http-equiv="Content-Type" content="text/html; charset=utf-8" />\n'
+            f'<meta name="ocr-system" content="python-doctr {doctr.__version__}" />\n'  # type: ignore[attr-defined]
+            '<meta name="ocr-capabilities" content="ocr_page ocr_carea ocr_par ocr_line ocrx_word" />\n'
+            "</head>\n<body>\n"
+            f'<div class="ocr_page" id="page_{page.page_idx + 1}" '
+            f'title="image; bbox 0 0 {width} {height}; ppageno 0">\n'
+        ).encode("utf-8")
+    )
+    block_count, line_count, word_count = 1, 1, 1
+    for prefix, block_box, lines in _page_blocks(page):
+        prefix = _escape(prefix)
+        bbox = "bbox {} {} {} {}".format(*block_box)
+        chunks = [
+            f'<div class="ocr_carea" id="{prefix}block_{block_count}" title="{bbox}">\n',
+            f'<p class="ocr_par" id="{prefix}par_{block_count}" title="{bbox}">\n',
+        ]
+        for line_box, words in lines:
+            # NOTE: baseline, x_size, x_descenders, x_ascenders is currently initalized to 0
+            chunks.append(
+                f'<span class="ocr_line" id="{prefix}line_{line_count}" title="bbox {" ".join(map(str, line_box))}; '
+                'baseline 0 0; x_size 0; x_descenders 0; x_ascenders 0">\n'
+            )
+            for value, word_box, confidence in words:
+                chunks.append(
+                    f'<span class="ocrx_word" id="{prefix}word_{word_count}" '
+                    f'title="bbox {" ".join(map(str, word_box))}; x_wconf {int(round(confidence * 100))}">'
+                    f"{_escape(value)}</span>\n"
+                )
+                word_count += 1
+            chunks.append("</span>\n")
+            line_count += 1
+        chunks.append("</p>\n</div>\n")
+        block_count += 1
+        f.write("".join(chunks).encode("utf-8"))
+    f.write(b"</div>\n</body>\n</html>\n")
+
+
+def write_alto(page: Page | KIEPage, f: IO[bytes], file_name: str | None = None) -> None:
+    """Write a page as XML (ALTO v4 format) in a binary file, one block at a time
+    convention: https://www.loc.gov/standards/alto/
+
+    >>> from doctr.io import write_alto
+    >>> with open("page.xml", "wb") as f:
+    >>>     write_alto(result.pages[0], f, file_name="page.jpg")
+
+    Args:
+        page: the page (or KIE page) to export
+        f: the binary file handle to write to
+        file_name: the name of the source image, if any
+    """
+    height, width = page.dimensions
+    source = (
+        f"<sourceImageInformation>\n<fileName>{_escape(file_name)}</fileName>\n</sourceImageInformation>\n"
+        if file_name is not None
+        else ""
+    )
+    f.write(
+        (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<alto xmlns="http://www.loc.gov/standards/alto/ns-v4#" '
+            'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            'xsi:schemaLocation="http://www.loc.gov/standards/alto/ns-v4# '
+            'http://www.loc.gov/alto/v4/alto-4-2.xsd">\n'
+            f"<Description>\n<MeasurementUnit>pixel</MeasurementUnit>\n{source}"
+            '<OCRProcessing ID="ocr_0">\n<ocrProcessingStep>\n<processingSoftware>\n'
+            "<softwareName>python-doctr</softwareName>\n"
+            f"<softwareVersion>{doctr.__version__}</softwareVersion>\n"  # type: ignore[attr-defined]
+            "</processingSoftware>\n</ocrProcessingStep>\n</OCRProcessing>\n</Description>\n"
+            f'<Layout>\n<Page ID="page_{page.page_idx + 1}" PHYSICAL_IMG_NR="{page.page_idx + 1}" '
+            f'WIDTH="{width}" HEIGHT="{height}">\n'
+            f'<PrintSpace HPOS="0" VPOS="0" WIDTH="{width}" HEIGHT="{height}">\n'
+        ).encode("utf-8")
+    )
+
+    def _position(box: list[int]) -> str:
+        xmin, ymin, xmax, ymax = box
+        return f'HPOS="{xmin}" VPOS="{ymin}" WIDTH="{xmax - xmin}" HEIGHT="{ymax - ymin}"'
+
+    block_count, line_count, word_count = 1, 1, 1
+    for prefix, block_box, lines in _page_blocks(page):
+        prefix = _escape(prefix)
+        chunks = [f'<TextBlock ID="{prefix}block_{block_count}" {_position(block_box)}>\n']
+        for line_box, words in lines:
+            chunks.append(f'<TextLine ID="{prefix}line_{line_count}" {_position(line_box)}>\n')
+            for word_idx, (value, word_box, confidence) in enumerate(words):
+                if word_idx > 0:
+                    chunks.append("<SP/>\n")
+                chunks.append(
+                    f'<String ID="{prefix}word_{word_count}" CONTENT="{_escape(value)}" {_position(word_box)} '
+                    f'WC="{confidence:.4f}"/>\n'
+                )
+                word_count += 1
+            chunks.append("</TextLine>\n")
+            line_count += 1
+        chunks.append("</TextBlock>\n")
+        block_count += 1
+        f.write("".join(chunks).encode("utf-8"))
+    f.write(b"</PrintSpace>\n</Page>\n</Layout>\n</alto>\n")
@@ -1,5 +1,37 @@
-from .classification import *
-from .detection import *
-from .recognition import *
-from .zoo import *
-from .factory import *
+import importlib
+
+from doctr.file_utils import lazy_import
+
+from . import classification, detection, recognition
+
+# Architectures, predictors & hub helpers are imported on first access
+__all__, __getattr__, __dir__ = lazy_import(
+    __name__,
+    [
+        "classification",
+        "detection",
+        "recognition",
+        "zoo",
+        "factory",
+        "builder",
+        "core",
+        "kie_predictor",
+        "modules",
+        "predictor",
+        "preprocessor",
+        "utils",
+    ],
+    {
+        ".classification": classification.__all__,
+        ".detection": detection.__all__,
+        ".recognition": recognition.__all__,
+        ".zoo": ["ocr_predictor", "kie_predictor"],
+        ".factory": ["login_to_hub", "push_to_hf_hub", "from_hub", "_save_model_and_config_for_hf_hub"],
+    },
+)
+
+# `kie_predictor` names both a predictor of `.zoo` and a subpackage. A subpackage is bound to its package when it is
+# first imported, which would hide the predictor: it is imported upfront (it only resolves its predictor lazily) and
+# unbound, so that the predictor is resolved on first access
+importlib.import_module(".kie_predictor", __name__)
+del globals()["kie_predictor"]
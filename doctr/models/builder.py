@@ -7,9 +7,11 @@
 from typing import Any
 
 import numpy as np
-from scipy.cluster.hierarchy import fclusterdata
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 
-from doctr.io.elements import Block, Document, KIEDocument, KIEPage, Line, Page, Prediction, Word
+from doctr.io.elements import Block, Document, KIEDocument, KIEPage, Page, Prediction, WordTable
 from doctr.utils.geometry import estimate_page_angle, resolve_enclosing_bbox, resolve_enclosing_rbbox, rotate_boxes
 from doctr.utils.repr import NestedObject
 
@@ -62,43 +64,23 @@ class DocumentBuilder(NestedObject):
             boxes = np.concatenate((boxes.min(1), boxes.max(1)), -1)
         return (boxes[:, 0] + 2 * boxes[:, 3] / np.median(boxes[:, 3] - boxes[:, 1])).argsort(), boxes
 
-    def _resolve_sub_lines(self, boxes: np.ndarray, word_idcs: list[int]) -> list[list[int]]:
+    def _resolve_sub_lines(self, boxes: np.ndarray, word_idcs: np.ndarray) -> list[list[int]]:
         """Split a line in sub_lines
 
         Args:
             boxes: bounding boxes of shape (N, 4)
-            word_idcs: list of indexes for the words of the line
+            word_idcs: indexes of the words of the line, of shape (M,)
 
         Returns:
             A list of (sub-)lines computed from the original line (words)
         """
-        lines = []
         # Sort words horizontally
-        word_idcs = [word_idcs[idx] for idx in boxes[word_idcs, 0].argsort().tolist()]
-
-        # Eventually split line horizontally
-        if len(word_idcs) < 2:
-            lines.append(word_idcs)
-        else:
-            sub_line = [word_idcs[0]]
-            for i in word_idcs[1:]:
-                horiz_break = True
-
-                prev_box = boxes[sub_line[-1]]
-                # Compute distance between boxes
-                dist = boxes[i, 0] - prev_box[2]
-                # If distance between boxes is lower than paragraph break, same sub-line
-                if dist < self.paragraph_break:
-                    horiz_break = False
+        _idcs = word_idcs[boxes[word_idcs, 0].argsort()]
 
-                if horiz_break:
-                    lines.append(sub_line)
-                    sub_line = []
-
-                sub_line.append(i)
-            lines.append(sub_line)
-
-        return lines
+        # Eventually split line horizontally: a sub-line ends when the gap with the next word
+        # reaches the paragraph break
+        breaks = np.flatnonzero(boxes[_idcs[1:], 0] - boxes[_idcs[:-1], 2] >= self.paragraph_break) + 1
+        return [sub_line.tolist() for sub_line in np.split(_idcs, breaks)]
 
     def _resolve_lines(self, boxes: np.ndarray) -> list[list[int]]:
         """Order boxes to group them in lines
@@ -114,32 +96,26 @@ class DocumentBuilder(NestedObject):
 
         # Compute median for boxes heights
         y_med = np.median(boxes[:, 3] - boxes[:, 1])
-
-        lines = []
-        words = [idxs[0]]  # Assign the top-left word to the first line
-        # Define a mean y-center for the line
-        y_center_sum = boxes[idxs[0]][[1, 3]].mean()
-
-        for idx in idxs[1:]:
-            vert_break = True
-
-            # Compute y_dist
-            y_dist = abs(boxes[idx][[1, 3]].mean() - y_center_sum / len(words))
+        # y-centers of the boxes, in reading order
+        y_centers = boxes[idxs][:, [1, 3]].mean(axis=1)
+
+        # A box starts a new line when its y-center is too far from the mean y-center of the current line.
+        # The mean depends on the previous decisions, so only this scan is sequential
+        starts = [0]
+        y_center_sum = y_centers[0]
+        num_words = 1
+        for pos, y_center in enumerate(y_centers[1:], 1):
             # If y-center of the box is close enough to mean y-center of the line, same line
-            if y_dist < y_med / 2:
-                vert_break = False
-
-            if vert_break:
-                # Compute sub-lines (horizontal split)
-                lines.extend(self._resolve_sub_lines(boxes, words))
-                words = []
-                y_center_sum = 0
-
-            words.append(idx)
-            y_center_sum += boxes[idx][[1, 3]].mean()
+            if abs(y_center - y_center_sum / num_words) < y_med / 2:
+                y_center_sum += y_center
+                num_words += 1
+            else:
+                starts.append(pos)
+                y_center_sum = y_center
+                num_words = 1
 
-        # Use the remaining words to form the last(s) line(s)
-        if len(words) > 0:
+        lines = []
+        for words in np.split(idxs, starts[1:]):
             # Compute sub-lines (horizontal split)
             lines.extend(self._resolve_sub_lines(boxes, words))
 
@@ -195,8 +171,14 @@ class DocumentBuilder(NestedObject):
                 ),
                 axis=-1,
             )
-        # Compute clusters
-        clusters = fclusterdata(box_features, t=0.1, depth=4, criterion="distance", metric="euclidean")
+        # Compute clusters: single-linkage with a distance threshold, i.e. the connected components of the graph
+        # linking lines whose features are within the threshold. Neighbors are found with a KD-tree, which avoids
+        # the pairwise distance matrix of a hierarchical clustering
+        pairs = cKDTree(box_features).query_pairs(r=0.1, output_type="ndarray")
+        graph = coo_matrix(
+            (np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])), shape=(len(lines), len(lines))
+        )
+        _, clusters = connected_components(graph, directed=False)
 
         _blocks: dict[int, list[int]] = {}
         # Form clusters
@@ -211,14 +193,14 @@ class DocumentBuilder(NestedObject):
 
         return blocks
 
-    def _build_blocks(
+    def _build_word_table(
         self,
         boxes: np.ndarray,
         objectness_scores: np.ndarray,
         word_preds: list[tuple[str, float]],
         crop_orientations: list[dict[str, Any]],
-    ) -> list[Block]:
-        """Gather independent words in structured blocks
+    ) -> WordTable:
+        """Gather independent words in a columnar table, structured in lines and blocks
 
         Args:
             boxes: bounding boxes of all detected words of the page, of shape (N, 4) or (N, 4, 2)
@@ -228,52 +210,65 @@ class DocumentBuilder(NestedObject):
                 the general orientation (orientations + confidences) of the crops
 
         Returns:
-            list of block elements
+            the word table of the page
         """
         if boxes.shape[0] != len(word_preds):
             raise ValueError(f"Incompatible argument lengths: {boxes.shape[0]}, {len(word_preds)}")
 
-        if boxes.shape[0] == 0:
-            return []
-
         # Decide whether we try to form lines
-        _boxes = boxes
-        if self.resolve_lines:
-            lines = self._resolve_lines(_boxes if _boxes.ndim == 3 else _boxes[:, :4])
+        _boxes = boxes if boxes.ndim == 3 else boxes[:, :4]
+        _blocks: list[list[list[int]]]
+        if boxes.shape[0] == 0:
+            _blocks = []
+        elif self.resolve_lines:
+            lines = self._resolve_lines(_boxes)
             # Decide whether we try to form blocks
             if self.resolve_blocks and len(lines) > 1:
-                _blocks = self._resolve_blocks(_boxes if _boxes.ndim == 3 else _boxes[:, :4], lines)
+                _blocks = self._resolve_blocks(_boxes, lines)
             else:
                 _blocks = [lines]
         else:
             # Sort bounding boxes, one line for all boxes, one block for the line
-            lines = [self._sort_boxes(_boxes if _boxes.ndim == 3 else _boxes[:, :4])[0]]  # type: ignore[list-item]
-            _blocks = [lines]
-
-        blocks = [
-            Block([
-                Line([
-                    Word(
-                        *word_preds[idx],
-                        tuple(tuple(pt) for pt in boxes[idx].tolist()),  # type: ignore[arg-type]
-                        float(objectness_scores[idx]),
-                        crop_orientations[idx],
-                    )
-                    if boxes.ndim == 3
-                    else Word(
-                        *word_preds[idx],
-                        ((boxes[idx, 0], boxes[idx, 1]), (boxes[idx, 2], boxes[idx, 3])),
-                        float(objectness_scores[idx]),
-                        crop_orientations[idx],
-                    )
-                    for idx in line
-                ])
-                for line in lines
-            ])
-            for lines in _blocks
-        ]
+            _blocks = [[self._sort_boxes(_boxes)[0]]]  # type: ignore[list-item]
+
+        lines = [line for block in _blocks for line in block]
+        line_offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+        np.cumsum([len(line) for line in lines], out=line_offsets[1:])
+        block_offsets = np.zeros(len(_blocks) + 1, dtype=np.int64)
+        np.cumsum([len(block) for block in _blocks], out=block_offsets[1:])
+        # Words in reading order
+        order = np.concatenate(lines).astype(np.int64) if len(lines) > 0 else np.zeros(0, dtype=np.int64)
+
+        return WordTable.from_columns(
+            values=[word_preds[idx][0] for idx in order.tolist()],
+            confidences=np.asarray([pred[1] for pred in word_preds], dtype=np.float64)[order],
+            geometries=_boxes[order],
+            objectness_scores=np.asarray(objectness_scores)[order],
+            crop_orientations=[crop_orientations[idx] for idx in order.tolist()],
+            line_offsets=line_offsets,
+            block_offsets=block_offsets,
+        )
 
-        return blocks
+    def _build_blocks(
+        self,
+        boxes: np.ndarray,
+        objectness_scores: np.ndarray,
+        word_preds: list[tuple[str, float]],
+        crop_orientations: list[dict[str, Any]],
+    ) -> list[Block]:
+        """Gather independent words in structured blocks
+
+        Args:
+            boxes: bounding boxes of all detected words of the page, of shape (N, 4) or (N, 4, 2)
+            objectness_scores: objectness scores of all detected words of the page, of shape N
+            word_preds: list of all detected words of the page, of shape N
+            crop_orientations: list of dictoinaries containing
+                the general orientation (orientations + confidences) of the crops
+
+        Returns:
+            list of block elements
+        """
+        return self._build_word_table(boxes, objectness_scores, word_preds, crop_orientations).to_blocks()
 
     def extra_repr(self) -> str:
         return (
@@ -330,7 +325,8 @@ class DocumentBuilder(NestedObject):
         _pages = [
             Page(
                 page,
-                self._build_blocks(
+                # Elements are only built if the blocks of the page are accessed
+                self._build_word_table(
                     page_boxes,
                     loc_scores,
                     word_preds,
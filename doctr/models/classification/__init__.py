@@ -1,8 +1,25 @@
-from .mobilenet import *
-from .resnet import *
-from .vgg import *
-from .magc_resnet import *
-from .vit import *
-from .textnet import *
-from .vip import *
-from .zoo import *
+from doctr.file_utils import lazy_import
+
+# Each architecture is only imported when one of its names is accessed
+__all__, __getattr__, __dir__ = lazy_import(
+    __name__,
+    ["mobilenet", "resnet", "vgg", "magc_resnet", "vit", "textnet", "vip", "predictor", "zoo"],
+    {
+        ".mobilenet": [
+            "MobileNetV3",
+            "mobilenet_v3_small",
+            "mobilenet_v3_small_r",
+            "mobilenet_v3_large",
+            "mobilenet_v3_large_r",
+            "mobilenet_v3_small_crop_orientation",
+            "mobilenet_v3_small_page_orientation",
+        ],
+        ".resnet": ["ResNet", "resnet18", "resnet31", "resnet34", "resnet50", "resnet34_wide", "resnet_stage"],
+        ".vgg": ["vgg16_bn_r"],
+        ".magc_resnet": ["magc_resnet31"],
+        ".vit": ["vit_s", "vit_b"],
+        ".textnet": ["textnet_tiny", "textnet_small", "textnet_base"],
+        ".vip": ["vip_tiny", "vip_base"],
+        ".zoo": ["crop_orientation_predictor", "page_orientation_predictor"],
+    },
+)
@@ -49,7 +49,7 @@ def _orientation_predictor(
             raise ValueError(f"unknown architecture '{arch}'")
 
         # Load directly classifier from backbone
-        _model = classification.__dict__[arch](pretrained=pretrained)
+        _model = getattr(classification, arch)(pretrained=pretrained)
     else:
         # Adding the type for torch compiled models to the allowed architectures
         allowed_archs = [classification.MobileNetV3, _CompiledModule]
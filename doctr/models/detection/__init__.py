@@ -1,4 +1,13 @@
-from .differentiable_binarization import *
-from .linknet import *
-from .fast import *
-from .zoo import *
+from doctr.file_utils import lazy_import
+
+# Each architecture is only imported when one of its names is accessed
+__all__, __getattr__, __dir__ = lazy_import(
+    __name__,
+    ["differentiable_binarization", "linknet", "fast", "predictor", "core", "zoo"],
+    {
+        ".differentiable_binarization": ["DBNet", "db_resnet50", "db_resnet34", "db_mobilenet_v3_large"],
+        ".linknet": ["LinkNet", "linknet_resnet18", "linknet_resnet34", "linknet_resnet50"],
+        ".fast": ["FAST", "fast_tiny", "fast_small", "fast_base", "reparameterize"],
+        ".zoo": ["detection_predictor"],
+    },
+)
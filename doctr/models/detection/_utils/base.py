@@ -6,7 +6,9 @@
 
 import numpy as np
 
-__all__ = ["_remove_padding"]
+from doctr.utils.metrics import nms
+
+__all__ = ["_remove_padding", "_get_tile_origins", "_merge_tile_preds"]
 
 
 def _remove_padding(
@@ -61,3 +63,92 @@ def _remove_padding(
                 rectified_preds.append({k: np.clip(loc_pred, 0, 1)})
         return rectified_preds
     return loc_preds
+
+
+def _get_tile_origins(size: int, tile_size: int, overlap: int) -> list[int]:
+    """Compute the offsets of overlapping tiles covering a dimension, the last tile being flush with the end
+
+    Args:
+        size: length of the dimension to cover (in pixels), expected to be at least tile_size
+        tile_size: length of a tile (in pixels)
+        overlap: minimal overlap between two consecutive tiles (in pixels)
+
+    Returns:
+        list of tile offsets
+    """
+    stride = max(tile_size - overlap, 1)
+    num_tiles = max(int(np.ceil((size - tile_size) / stride)), 0) + 1
+    return [min(idx * stride, size - tile_size) for idx in range(num_tiles)]
+
+
+def _merge_tile_preds(
+    loc_preds: list[dict[str, np.ndarray]],
+    origins: list[tuple[int, int]],
+    tile_shape: tuple[int, int],
+    page_shape: tuple[int, int],
+    overlap: tuple[int, int],
+    assume_straight_pages: bool,
+    iou_thresh: float = 0.5,
+) -> dict[str, np.ndarray]:
+    """Merge the localization predictions of the tiles of a page into page-level predictions.
+    Boxes cut by an inner tile border are dropped when the overlap guarantees that a neighbouring tile
+    sees them entirely, and duplicates from overlapping areas are removed with non-maximum suppression.
+
+    Args:
+        loc_preds: list of localization predictions (relative to each tile)
+        origins: list of (y, x) offsets of each tile in the page (in pixels)
+        tile_shape: size of the tiles (H, W)
+        page_shape: size of the page (H, W), tiles may extend beyond it when the page had to be padded
+        overlap: overlap between consecutive tiles (in pixels) in format (H, W)
+        assume_straight_pages: whether the pages are assumed to be straight
+        iou_thresh: IoU threshold of the non-maximum suppression
+
+    Returns:
+        localization predictions relative to the page
+    """
+    tile_h, tile_w = tile_shape
+    page_h, page_w = page_shape
+    tiled_h = max(y for y, _ in origins) + tile_h
+    tiled_w = max(x for _, x in origins) + tile_w
+    merged_preds: dict[str, np.ndarray] = {}
+    for k in loc_preds[0].keys():
+        page_boxes = []
+        for dict_loc_preds, (y, x) in zip(loc_preds, origins):
+            boxes = dict_loc_preds[k].copy()
+            if boxes.shape[0] == 0:
+                page_boxes.append(boxes)
+                continue
+            # Straight bounds of the boxes in tile pixels
+            if assume_straight_pages:
+                xmin, xmax = boxes[:, 0] * tile_w, boxes[:, 2] * tile_w
+                ymin, ymax = boxes[:, 1] * tile_h, boxes[:, 3] * tile_h
+            else:
+                xmin, ymin = boxes[:, :4, 0].min(axis=1) * tile_w, boxes[:, :4, 1].min(axis=1) * tile_h
+                xmax, ymax = boxes[:, :4, 0].max(axis=1) * tile_w, boxes[:, :4, 1].max(axis=1) * tile_h
+            # Boxes touching an inner border, small enough to fit entirely in the neighbouring tile
+            cut_x = ((x > 0) & (xmin <= 1)) | ((x + tile_w < tiled_w) & (xmax >= tile_w - 1))
+            cut_y = ((y > 0) & (ymin <= 1)) | ((y + tile_h < tiled_h) & (ymax >= tile_h - 1))
+            is_cut = (cut_x & (xmax - xmin < overlap[1])) | (cut_y & (ymax - ymin < overlap[0]))
+            boxes = boxes[~is_cut]
+            # Express the coordinates relatively to the page
+            if assume_straight_pages:
+                boxes[:, [0, 2]] = (boxes[:, [0, 2]] * tile_w + x) / page_w
+                boxes[:, [1, 3]] = (boxes[:, [1, 3]] * tile_h + y) / page_h
+            else:
+                boxes[:, :4, 0] = (boxes[:, :4, 0] * tile_w + x) / page_w
+                boxes[:, :4, 1] = (boxes[:, :4, 1] * tile_h + y) / page_h
+            page_boxes.append(boxes)
+
+        boxes = np.concatenate(page_boxes, axis=0)
+        # Non-maximum suppression on the straight bounds of the boxes
+        if assume_straight_pages:
+            straight_boxes = boxes
+        else:
+            straight_boxes = np.concatenate(
+                (boxes[:, :4].min(axis=1), boxes[:, :4].max(axis=1), boxes[:, 4, 1:]),
+                axis=1,
+            )
+        keep = np.asarray(nms(straight_boxes, iou_thresh), dtype=np.int64)
+        merged_preds[k] = np.clip(boxes[keep], 0, 1)
+
+    return merged_preds
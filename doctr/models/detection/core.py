@@ -44,19 +44,92 @@ class DetectionPostProcessor(NestedObject):
         """
         h, w = pred.shape[:2]
 
+        xmin = np.clip(np.floor(points[..., 0].min()).astype(np.int32), 0, w - 1)
+        xmax = np.clip(np.ceil(points[..., 0].max()).astype(np.int32), 0, w - 1)
+        ymin = np.clip(np.floor(points[..., 1].min()).astype(np.int32), 0, h - 1)
+        ymax = np.clip(np.ceil(points[..., 1].max()).astype(np.int32), 0, h - 1)
+
         if assume_straight_pages:
-            xmin = np.clip(np.floor(points[:, 0].min()).astype(np.int32), 0, w - 1)
-            xmax = np.clip(np.ceil(points[:, 0].max()).astype(np.int32), 0, w - 1)
-            ymin = np.clip(np.floor(points[:, 1].min()).astype(np.int32), 0, h - 1)
-            ymax = np.clip(np.ceil(points[:, 1].max()).astype(np.int32), 0, h - 1)
             return pred[ymin : ymax + 1, xmin : xmax + 1].mean()
 
         else:
-            mask: np.ndarray = np.zeros((h, w), np.int32)
-            cv2.fillPoly(mask, [points.astype(np.int32)], 1.0)
-            product = pred * mask
+            # Only rasterize the polygon over its own region of interest rather than the full page
+            roi = pred[ymin : ymax + 1, xmin : xmax + 1]
+            mask: np.ndarray = np.zeros(roi.shape[:2], np.int32)
+            cv2.fillPoly(mask, [points.astype(np.int32) - np.array([xmin, ymin], dtype=np.int32)], 1.0)
+            product = roi * mask
             return np.sum(product) / np.count_nonzero(product)
 
+    @staticmethod
+    def _fill_holes(bitmap: np.ndarray) -> np.ndarray:
+        """Fill the holes of the connected components, so that a labelling matches external contours
+
+        Args:
+            bitmap: binary map of shape (H, W)
+
+        Returns:
+            the binary map where background areas unreachable from the border are set to 1
+        """
+        h, w = bitmap.shape[:2]
+        # Flood the background from the border (4-connectivity, dual of the 8-connectivity of components)
+        background = np.zeros((h + 2, w + 2), dtype=np.uint8)
+        background[1:-1, 1:-1] = bitmap > 0
+        cv2.floodFill(background, None, (0, 0), 2)
+        return (background[1:-1, 1:-1] != 2).astype(np.uint8)
+
+    def straight_bitmap_to_boxes(
+        self,
+        pred: np.ndarray,
+        bitmap: np.ndarray,
+        unclip_ratio: float,
+        min_size_box: int = 2,
+    ) -> np.ndarray:
+        """Compute straight boxes from a bitmap/pred_map in a vectorized way: the components are labelled once,
+        their objectness is computed from the integral image of the pred map and the unclip expansion of each
+        rectangle is resolved analytically.
+
+        Args:
+            pred: Pred map from the model output
+            bitmap: Bitmap map computed from pred (binarized)
+            unclip_ratio: ratio used to unshrink the boxes
+            min_size_box: minimal extent (pix) of a component to be kept
+
+        Returns:
+            np tensor boxes for the bitmap of shape (N, 5), each box containing xmin, ymin, xmax, ymax, score
+        """
+        height, width = bitmap.shape[:2]
+        # Holes are filled so that components nested in another one are discarded, like external contours would
+        _, _, stats, _ = cv2.connectedComponentsWithStats(self._fill_holes(bitmap), connectivity=8)
+        # Drop the background, and components whose extent is too small
+        stats = stats[1:].astype(np.int64)
+        stats = stats[np.all(stats[:, [cv2.CC_STAT_WIDTH, cv2.CC_STAT_HEIGHT]] - 1 >= min_size_box, axis=1)]
+        if stats.shape[0] == 0:
+            return np.zeros((0, 5), dtype=pred.dtype)
+        x, y = stats[:, cv2.CC_STAT_LEFT], stats[:, cv2.CC_STAT_TOP]
+        w, h = stats[:, cv2.CC_STAT_WIDTH], stats[:, cv2.CC_STAT_HEIGHT]
+
+        # Objectness: mean of the pred map over the box, with the box corners (x + w, y + h) included
+        integral = cv2.integral(pred.astype(np.float64))
+        x1, y1 = np.minimum(x + w, width - 1) + 1, np.minimum(y + h, height - 1) + 1
+        sums = integral[y1, x1] - integral[y, x1] - integral[y1, x] + integral[y, x]
+        scores = sums / ((x1 - x) * (y1 - y))
+        keep = scores >= self.box_thresh
+        x, y, w, h, scores = x[keep], y[keep], w[keep], h[keep], scores[keep]
+
+        # Offsetting a (w, h) rectangle with rounded joins expands each side by the same distance,
+        # coordinates being rounded half away from zero like pyclipper does
+        distance = (w * h) * unclip_ratio / (2 * (w + h))
+
+        def _round(coords: np.ndarray) -> np.ndarray:
+            return np.where(coords < 0, np.trunc(coords - 0.5), np.trunc(coords + 0.5))
+
+        xmin, ymin = _round(x - distance), _round(y - distance)
+        # cv2.boundingRect spans one pixel further than the maximal coordinate
+        xmax, ymax = _round(x + w + distance) + 1, _round(y + h + distance) + 1
+
+        boxes = np.stack([xmin / width, ymin / height, xmax / width, ymax / height, scores], axis=1)
+        return np.clip(boxes, 0, 1)
+
     def bitmap_to_boxes(
         self,
         pred: np.ndarray,
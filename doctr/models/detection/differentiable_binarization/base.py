@@ -100,9 +100,12 @@ class DBPostProcessor(DetectionPostProcessor):
             np tensor boxes for the bitmap, each box is a 5-element list
                 containing x, y, w, h, score for the box
         """
-        height, width = bitmap.shape[:2]
         min_size_box = 2
-        boxes: list[np.ndarray | list[float]] = []
+        if self.assume_straight_pages:
+            return self.straight_bitmap_to_boxes(pred, bitmap, self.unclip_ratio, min_size_box)
+
+        height, width = bitmap.shape[:2]
+        boxes: list[np.ndarray] = []
         # get contours from connected components on the bitmap
         contours, _ = cv2.findContours(bitmap.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         for contour in contours:
@@ -110,46 +113,25 @@ class DBPostProcessor(DetectionPostProcessor):
             if np.any(contour[:, 0].max(axis=0) - contour[:, 0].min(axis=0) < min_size_box):
                 continue
             # Compute objectness
-            if self.assume_straight_pages:
-                x, y, w, h = cv2.boundingRect(contour)
-                points: np.ndarray = np.array([[x, y], [x, y + h], [x + w, y + h], [x + w, y]])
-                score = self.box_score(pred, points, assume_straight_pages=True)
-            else:
-                score = self.box_score(pred, contour, assume_straight_pages=False)
-
+            score = self.box_score(pred, contour, assume_straight_pages=False)
             if score < self.box_thresh:  # remove polygons with a weak objectness
                 continue
 
-            if self.assume_straight_pages:
-                _box = self.polygon_to_box(points)
-            else:
-                _box = self.polygon_to_box(np.squeeze(contour))
+            _box = self.polygon_to_box(np.squeeze(contour))
 
             # Remove too small boxes
-            if self.assume_straight_pages:
-                if _box is None or _box[2] < min_size_box or _box[3] < min_size_box:
-                    continue
-            elif np.linalg.norm(_box[2, :] - _box[0, :], axis=-1) < min_size_box:
+            if np.linalg.norm(_box[2, :] - _box[0, :], axis=-1) < min_size_box:
                 continue
 
-            if self.assume_straight_pages:
-                x, y, w, h = _box
-                # compute relative polygon to get rid of img shape
-                xmin, ymin, xmax, ymax = x / width, y / height, (x + w) / width, (y + h) / height
-                boxes.append([xmin, ymin, xmax, ymax, score])
-            else:
-                # compute relative box to get rid of img shape, in that case _box is a 4pt polygon
-                if not isinstance(_box, np.ndarray) and _box.shape == (4, 2):
-                    raise AssertionError("When assume straight pages is false a box is a (4, 2) array (polygon)")
-                _box[:, 0] /= width
-                _box[:, 1] /= height
-                # Add score to box as (0, score)
-                boxes.append(np.vstack([_box, np.array([0.0, score])]))
+            # compute relative box to get rid of img shape, in that case _box is a 4pt polygon
+            if not isinstance(_box, np.ndarray) and _box.shape == (4, 2):
+                raise AssertionError("When assume straight pages is false a box is a (4, 2) array (polygon)")
+            _box[:, 0] /= width
+            _box[:, 1] /= height
+            # Add score to box as (0, score)
+            boxes.append(np.vstack([_box, np.array([0.0, score])]))
 
-        if not self.assume_straight_pages:
-            return np.clip(np.asarray(boxes), 0, 1) if len(boxes) > 0 else np.zeros((0, 5, 2), dtype=pred.dtype)
-        else:
-            return np.clip(np.asarray(boxes), 0, 1) if len(boxes) > 0 else np.zeros((0, 5), dtype=pred.dtype)
+        return np.clip(np.asarray(boxes), 0, 1) if len(boxes) > 0 else np.zeros((0, 5, 2), dtype=pred.dtype)
 
 
 class _DBNet:
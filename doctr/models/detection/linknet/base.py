@@ -98,8 +98,11 @@ class LinkNetPostProcessor(DetectionPostProcessor):
             np tensor boxes for the bitmap, each box is a 6-element list
                 containing x, y, w, h, alpha, score for the box
         """
+        if self.assume_straight_pages:
+            return self.straight_bitmap_to_boxes(pred, bitmap, self.unclip_ratio)
+
         height, width = bitmap.shape[:2]
-        boxes: list[np.ndarray | list[float]] = []
+        boxes: list[np.ndarray] = []
         # get contours from connected components on the bitmap
         contours, _ = cv2.findContours(bitmap.astype(np.uint8), cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         for contour in contours:
@@ -107,37 +110,19 @@ class LinkNetPostProcessor(DetectionPostProcessor):
             if np.any(contour[:, 0].max(axis=0) - contour[:, 0].min(axis=0) < 2):
                 continue
             # Compute objectness
-            if self.assume_straight_pages:
-                x, y, w, h = cv2.boundingRect(contour)
-                points: np.ndarray = np.array([[x, y], [x, y + h], [x + w, y + h], [x + w, y]])
-                score = self.box_score(pred, points, assume_straight_pages=True)
-            else:
-                score = self.box_score(pred, contour, assume_straight_pages=False)
-
+            score = self.box_score(pred, contour, assume_straight_pages=False)
             if score < self.box_thresh:  # remove polygons with a weak objectness
                 continue
 
-            if self.assume_straight_pages:
-                _box = self.polygon_to_box(points)
-            else:
-                _box = self.polygon_to_box(np.squeeze(contour))
-
-            if self.assume_straight_pages:
-                # compute relative polygon to get rid of img shape
-                x, y, w, h = _box
-                xmin, ymin, xmax, ymax = x / width, y / height, (x + w) / width, (y + h) / height
-                boxes.append([xmin, ymin, xmax, ymax, score])
-            else:
-                # compute relative box to get rid of img shape
-                _box[:, 0] /= width
-                _box[:, 1] /= height
-                # Add score to box as (0, score)
-                boxes.append(np.vstack([_box, np.array([0.0, score])]))
+            _box = self.polygon_to_box(np.squeeze(contour))
 
-        if not self.assume_straight_pages:
-            return np.clip(np.asarray(boxes), 0, 1) if len(boxes) > 0 else np.zeros((0, 5, 2), dtype=pred.dtype)
-        else:
-            return np.clip(np.asarray(boxes), 0, 1) if len(boxes) > 0 else np.zeros((0, 5), dtype=pred.dtype)
+            # compute relative box to get rid of img shape
+            _box[:, 0] /= width
+            _box[:, 1] /= height
+            # Add score to box as (0, score)
+            boxes.append(np.vstack([_box, np.array([0.0, score])]))
+
+        return np.clip(np.asarray(boxes), 0, 1) if len(boxes) > 0 else np.zeros((0, 5, 2), dtype=pred.dtype)
 
 
 class _LinkNet(BaseModel):
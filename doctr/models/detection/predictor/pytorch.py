@@ -9,7 +9,7 @@ import numpy as np
 import torch
 from torch import nn
 
-from doctr.models.detection._utils import _remove_padding
+from doctr.models.detection._utils import _get_tile_origins, _merge_tile_preds, _remove_padding
 from doctr.models.preprocessor import PreProcessor
 from doctr.models.utils import set_device_and_dtype
 
@@ -22,33 +22,35 @@ class DetectionPredictor(nn.Module):
     Args:
         pre_processor: transform inputs for easier batched model inference
         model: core detection architecture
+        tiled: if True, pages are split into overlapping tiles of the model input size, processed at native
+            resolution, so that small text elements are not shrunk away on large pages
+        tile_overlap: overlap between consecutive tiles, as a fraction of the tile size. It should exceed the
+            size of most text elements, so that each of them is entirely seen by at least one tile
     """
 
     def __init__(
         self,
         pre_processor: PreProcessor,
         model: nn.Module,
+        tiled: bool = False,
+        tile_overlap: float = 0.2,
     ) -> None:
         super().__init__()
         self.pre_processor = pre_processor
         self.model = model.eval()
+        self.tiled = tiled
+        self.tile_overlap = tile_overlap
 
-    @torch.inference_mode()
-    def forward(
+    def _predict(
         self,
         pages: list[np.ndarray],
-        return_maps: bool = False,
         **kwargs: Any,
-    ) -> list[dict[str, np.ndarray]] | tuple[list[dict[str, np.ndarray]], list[np.ndarray]]:
+    ) -> tuple[list[dict[str, np.ndarray]], list[torch.Tensor]]:
         # Extract parameters from the preprocessor
         preserve_aspect_ratio = self.pre_processor.resize.preserve_aspect_ratio
         symmetric_pad = self.pre_processor.resize.symmetric_pad
         assume_straight_pages = self.model.assume_straight_pages
 
-        # Dimension check
-        if any(page.ndim != 3 for page in pages):
-            raise ValueError("incorrect input shape: all pages are expected to be multi-channel 2D images.")
-
         processed_batches = self.pre_processor(pages)
         _params = next(self.model.parameters())
         self.model, processed_batches = set_device_and_dtype(
@@ -65,10 +67,81 @@ class DetectionPredictor(nn.Module):
             symmetric_pad=symmetric_pad,
             assume_straight_pages=assume_straight_pages,  # type: ignore[arg-type]
         )
+        return preds, [pred for batch in predicted_batches for pred in batch["out_map"]]
 
-        if return_maps:
-            seg_maps = [
-                pred.permute(1, 2, 0).detach().cpu().numpy() for batch in predicted_batches for pred in batch["out_map"]
+    def _tiled_predict(
+        self,
+        pages: list[np.ndarray],
+        return_maps: bool = False,
+        **kwargs: Any,
+    ) -> tuple[list[dict[str, np.ndarray]], list[torch.Tensor]]:
+        tile_h, tile_w = self.pre_processor.resize.size
+        overlap = (int(round(self.tile_overlap * tile_h)), int(round(self.tile_overlap * tile_w)))
+
+        tiles: list[np.ndarray] = []
+        page_origins: list[list[tuple[int, int]]] = []
+        for page in pages:
+            # Pages smaller than a tile are padded at the bottom-right
+            if page.shape[0] < tile_h or page.shape[1] < tile_w:
+                page = np.pad(page, ((0, max(tile_h - page.shape[0], 0)), (0, max(tile_w - page.shape[1], 0)), (0, 0)))
+            origins = [
+                (y, x)
+                for y in _get_tile_origins(page.shape[0], tile_h, overlap[0])
+                for x in _get_tile_origins(page.shape[1], tile_w, overlap[1])
             ]
+            tiles.extend(page[y : y + tile_h, x : x + tile_w] for y, x in origins)
+            page_origins.append(origins)
+
+        # All the tiles are batched together through the model
+        tile_preds, tile_maps = self._predict(tiles, **kwargs)
+
+        preds, out_maps = [], []
+        offset = 0
+        for page, origins in zip(pages, page_origins):
+            preds.append(
+                _merge_tile_preds(
+                    tile_preds[offset : offset + len(origins)],
+                    origins,
+                    (tile_h, tile_w),
+                    page.shape[:2],
+                    overlap,
+                    assume_straight_pages=self.model.assume_straight_pages,  # type: ignore[arg-type]
+                )
+            )
+            if return_maps:
+                # Stitch the tile maps back into a page map, at native resolution
+                _maps = tile_maps[offset : offset + len(origins)]
+                out_map = _maps[0].new_zeros((
+                    _maps[0].shape[0],
+                    max(y for y, _ in origins) + tile_h,
+                    max(x for _, x in origins) + tile_w,
+                ))
+                for tile_map, (y, x) in zip(_maps, origins):
+                    out_map[:, y : y + tile_h, x : x + tile_w] = torch.maximum(
+                        out_map[:, y : y + tile_h, x : x + tile_w], tile_map
+                    )
+                out_maps.append(out_map[:, : page.shape[0], : page.shape[1]])
+            offset += len(origins)
+
+        return preds, out_maps
+
+    @torch.inference_mode()
+    def forward(
+        self,
+        pages: list[np.ndarray],
+        return_maps: bool = False,
+        **kwargs: Any,
+    ) -> list[dict[str, np.ndarray]] | tuple[list[dict[str, np.ndarray]], list[np.ndarray]]:
+        # Dimension check
+        if any(page.ndim != 3 for page in pages):
+            raise ValueError("incorrect input shape: all pages are expected to be multi-channel 2D images.")
+
+        if self.tiled:
+            preds, out_maps = self._tiled_predict(list(pages), return_maps, **kwargs)
+        else:
+            preds, out_maps = self._predict(pages, **kwargs)
+
+        if return_maps:
+            seg_maps = [pred.permute(1, 2, 0).detach().cpu().numpy() for pred in out_maps]
             return preds, seg_maps
         return preds
@@ -8,7 +8,6 @@ from typing import Any
 from doctr.models.utils import _CompiledModule
 
 from .. import detection
-from ..detection.fast import reparameterize
 from ..preprocessor import PreProcessor
 from .predictor import DetectionPredictor
 
@@ -34,14 +33,14 @@ def _predictor(arch: Any, pretrained: bool, assume_straight_pages: bool = True,
         if arch not in ARCHS:
             raise ValueError(f"unknown architecture '{arch}'")
 
-        _model = detection.__dict__[arch](
+        _model = getattr(detection, arch)(
             pretrained=pretrained,
             pretrained_backbone=kwargs.get("pretrained_backbone", True),
             assume_straight_pages=assume_straight_pages,
         )
         # Reparameterize FAST models by default to lower inference latency and memory usage
-        if isinstance(_model, detection.FAST):
-            _model = reparameterize(_model)
+        if arch.startswith("fast_"):
+            _model = detection.reparameterize(_model)
     else:
         # Adding the type for torch compiled models to the allowed architectures
         allowed_archs = [detection.DBNet, detection.LinkNet, detection.FAST, _CompiledModule]
@@ -54,6 +53,8 @@ def _predictor(arch: Any, pretrained: bool, assume_straight_pages: bool = True,
         _model.postprocessor.assume_straight_pages = assume_straight_pages  # type: ignore[attr-defined]
 
     kwargs.pop("pretrained_backbone", None)
+    tiled = kwargs.pop("tiled", False)
+    tile_overlap = kwargs.pop("tile_overlap", 0.2)
 
     kwargs["mean"] = kwargs.get("mean", _model.cfg["mean"])
     kwargs["std"] = kwargs.get("std", _model.cfg["std"])
@@ -61,6 +62,8 @@ def _predictor(arch: Any, pretrained: bool, assume_straight_pages: bool = True,
     predictor = DetectionPredictor(
         PreProcessor(_model.cfg["input_shape"][1:], **kwargs),
         _model,
+        tiled=tiled,
+        tile_overlap=tile_overlap,
     )
     return predictor
 
@@ -72,6 +75,8 @@ def detection_predictor(
     preserve_aspect_ratio: bool = True,
     symmetric_pad: bool = True,
     batch_size: int = 2,
+    tiled: bool = False,
+    tile_overlap: float = 0.2,
     **kwargs: Any,
 ) -> DetectionPredictor:
     """Text detection architecture.
@@ -90,6 +95,9 @@ def detection_predictor(
             running the detection model on it
         symmetric_pad: if True, pad the image symmetrically instead of padding at the bottom-right
         batch_size: number of samples the model processes in parallel
+        tiled: if True, split the pages into overlapping tiles processed at native resolution
+            instead of resizing them to the model input size
+        tile_overlap: overlap between consecutive tiles, as a fraction of the tile size
         **kwargs: optional keyword arguments passed to the architecture
 
     Returns:
@@ -102,5 +110,7 @@ def detection_predictor(
         preserve_aspect_ratio=preserve_aspect_ratio,
         symmetric_pad=symmetric_pad,
         batch_size=batch_size,
+        tiled=tiled,
+        tile_overlap=tile_overlap,
         **kwargs,
     )
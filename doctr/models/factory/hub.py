@@ -153,7 +153,7 @@ def push_to_hf_hub(model: Any, model_name: str, task: str, **kwargs) -> None:  #
                                   \n{json.dumps(vars(run_config), indent=2, ensure_ascii=False)}"""
         )
 
-    if arch not in AVAILABLE_ARCHS[task]:
+    if not isinstance(arch, str) or arch not in AVAILABLE_ARCHS[task]:
         raise ValueError(
             f"Architecture: {arch} for task: {task} not found.\
                          \nAvailable architectures: {AVAILABLE_ARCHS}"
@@ -190,19 +190,19 @@ def from_hub(repo_id: str, **kwargs: Any):
     with open(hf_hub_download(repo_id, filename="config.json", **kwargs), "rb") as f:
         cfg = json.load(f)
 
-    arch = cfg["arch"]
-    task = cfg["task"]
-    cfg.pop("arch")
-    cfg.pop("task")
+    arch = cfg.pop("arch", None)
+    task = cfg.pop("task", None)
+    if not isinstance(arch, str) or task not in AVAILABLE_ARCHS:
+        raise ValueError(f"the config of {repo_id} must specify the architecture and the task of the model")
 
     if task == "classification":
-        model = models.classification.__dict__[arch](
+        model = getattr(models.classification, arch)(
             pretrained=False, classes=cfg["classes"], num_classes=cfg["num_classes"]
         )
     elif task == "detection":
-        model = models.detection.__dict__[arch](pretrained=False)
+        model = getattr(models.detection, arch)(pretrained=False)
     elif task == "recognition":
-        model = models.recognition.__dict__[arch](pretrained=False, input_shape=cfg["input_shape"], vocab=cfg["vocab"])
+        model = getattr(models.recognition, arch)(pretrained=False, input_shape=cfg["input_shape"], vocab=cfg["vocab"])
 
     # update model cfg
     model.cfg = cfg
@@ -1 +1,4 @@
-from .pytorch import *
+from doctr.file_utils import lazy_import
+
+# The predictor is only imported on first access (this package is imported with `doctr.models`)
+__all__, __getattr__, __dir__ = lazy_import(__name__, ["base", "pytorch"], {".pytorch": ["KIEPredictor"]})
@@ -48,5 +48,7 @@ class _KIEPredictor(_OCRPredictor):
         # Remove the following arguments from kwargs after initialization of the parent class
         kwargs.pop("disable_page_orientation", None)
         kwargs.pop("disable_crop_orientation", None)
+        kwargs.pop("straighten_angle_tol", None)
+        kwargs.pop("redetect_angle_tol", None)
 
         self.doc_builder: KIEDocumentBuilder = KIEDocumentBuilder(**kwargs)
@@ -77,16 +77,20 @@ class KIEPredictor(nn.Module, _KIEPredictor):
 
         origin_page_shapes = [page.shape[:2] for page in pages]
 
-        # Localize text elements
-        loc_preds, out_maps = self.det_predictor(pages, return_maps=True, **kwargs)
+        # Localize text elements, segmentation maps are only retrieved when the page orientation is estimated
+        seg_maps: list[np.ndarray] = []
+        if self.detect_orientation or self.straighten_pages:
+            loc_preds, out_maps = self.det_predictor(pages, return_maps=True, **kwargs)
+            seg_maps = [
+                np.where(
+                    np.expand_dims(np.amax(out_map, axis=-1), axis=-1) > kwargs.get("bin_thresh", 0.3), 255, 0
+                ).astype(np.uint8)
+                for out_map in out_maps
+            ]
+        else:
+            loc_preds = self.det_predictor(pages, **kwargs)
 
         # Detect document rotation and rotate pages
-        seg_maps = [
-            np.where(np.expand_dims(np.amax(out_map, axis=-1), axis=-1) > kwargs.get("bin_thresh", 0.3), 255, 0).astype(
-                np.uint8
-            )
-            for out_map in out_maps
-        ]
         if self.detect_orientation:
             general_pages_orientations, origin_pages_orientations = self._get_orientations(pages, seg_maps)
             orientations = [
@@ -97,13 +101,12 @@ class KIEPredictor(nn.Module, _KIEPredictor):
             general_pages_orientations = None
             origin_pages_orientations = None
         if self.straighten_pages:
-            pages = self._straighten_pages(pages, seg_maps, general_pages_orientations, origin_pages_orientations)
+            pages, loc_preds = self._straighten_pages(
+                pages, loc_preds, seg_maps, general_pages_orientations, origin_pages_orientations, **kwargs
+            )
             # update page shapes after straightening
             origin_page_shapes = [page.shape[:2] for page in pages]
 
-            # Forward again to get predictions on straight pages
-            loc_preds = self.det_predictor(pages, **kwargs)
-
         dict_loc_preds: dict[str, list[np.ndarray]] = invert_data_structure(loc_preds)  # type: ignore[assignment]
 
         # Detach objectness scores from loc_preds
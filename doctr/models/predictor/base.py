@@ -9,7 +9,7 @@ from typing import Any
 import numpy as np
 
 from doctr.models.builder import DocumentBuilder
-from doctr.utils.geometry import extract_crops, extract_rcrops, remove_image_padding, rotate_image
+from doctr.utils.geometry import extract_crops, extract_rcrops, remove_image_padding, rotate_boxes, rotate_image
 
 from .._utils import estimate_orientation, rectify_crops, rectify_loc_preds
 from ..classification import crop_orientation_predictor, page_orientation_predictor
@@ -31,9 +31,13 @@ class _OCRPredictor:
         symmetric_pad: if True and preserve_aspect_ratio is True, pas the image symmetrically.
         detect_orientation: if True, the estimated general page orientation will be added to the predictions for each
             page. Doing so will slightly deteriorate the overall latency.
-        **kwargs: keyword args of `DocumentBuilder`
+        **kwargs: keyword args of `DocumentBuilder`, along with `straighten_angle_tol` (pages estimated to be rotated
+            by less than this angle in degrees are not straightened, default: 1) and `redetect_angle_tol` (straightened
+            pages are only passed again to the detection model above this angle in degrees, otherwise the existing
+            predictions are rotated along with the page, default: 5)
     """
 
+    det_predictor: Any
     crop_orientation_predictor: OrientationPredictor | None
     page_orientation_predictor: OrientationPredictor | None
 
@@ -50,6 +54,8 @@ class _OCRPredictor:
         self.straighten_pages = straighten_pages
         self._page_orientation_disabled = kwargs.pop("disable_page_orientation", False)
         self._crop_orientation_disabled = kwargs.pop("disable_crop_orientation", False)
+        self.straighten_angle_tol: float = kwargs.pop("straighten_angle_tol", 1.0)
+        self.redetect_angle_tol: float = kwargs.pop("redetect_angle_tol", 5.0)
         self.crop_orientation_predictor = (
             None
             if assume_straight_pages
@@ -91,10 +97,12 @@ class _OCRPredictor:
     def _straighten_pages(
         self,
         pages: list[np.ndarray],
+        loc_preds: list[dict[str, np.ndarray]],
         seg_maps: list[np.ndarray],
         general_pages_orientations: list[tuple[int, float]] | None = None,
         origin_pages_orientations: list[int] | None = None,
-    ) -> list[np.ndarray]:
+        **kwargs: Any,
+    ) -> tuple[list[np.ndarray], list[dict[str, np.ndarray]]]:
         general_pages_orientations = (
             general_pages_orientations if general_pages_orientations else self._general_page_orientations(pages)
         )
@@ -106,11 +114,91 @@ class _OCRPredictor:
                 for seq_map, general_orientation in zip(seg_maps, general_pages_orientations)
             ]
         )
-        return [
+        straight_pages, straight_loc_preds = [], []
+        redetect_idxs = []
+        for idx, (page, dict_loc_preds, angle) in enumerate(zip(pages, loc_preds, origin_pages_orientations)):
+            # Nearly straight pages are left untouched
+            if abs(angle) < self.straighten_angle_tol:
+                straight_pages.append(page)
+                straight_loc_preds.append(dict_loc_preds)
+                continue
             # expand if height and width are not equal, then remove the padding
-            remove_image_padding(rotate_image(page, angle, expand=page.shape[0] != page.shape[1]))
-            for page, angle in zip(pages, origin_pages_orientations)
-        ]
+            rotated_page = rotate_image(page, angle, expand=page.shape[0] != page.shape[1])
+            straight_page, offsets = remove_image_padding(rotated_page, return_offsets=True)
+            straight_pages.append(straight_page)
+            if abs(angle) < self.redetect_angle_tol:
+                # Small rotations: the existing predictions are rotated along with the page
+                straight_loc_preds.append({
+                    k: self._rotate_loc_preds(
+                        loc_pred, angle, page.shape[:2], rotated_page.shape[:2], offsets, straight_page.shape[:2]
+                    )
+                    for k, loc_pred in dict_loc_preds.items()
+                })
+            else:
+                straight_loc_preds.append(dict_loc_preds)
+                redetect_idxs.append(idx)
+
+        # Forward again to get predictions on the pages which were significantly rotated
+        if len(redetect_idxs) > 0:
+            redetected_loc_preds = self.det_predictor([straight_pages[idx] for idx in redetect_idxs], **kwargs)
+            for idx, dict_loc_preds in zip(redetect_idxs, redetected_loc_preds):
+                straight_loc_preds[idx] = dict_loc_preds
+
+        return straight_pages, straight_loc_preds
+
+    @staticmethod
+    def _rotate_loc_preds(
+        loc_preds: np.ndarray,
+        angle: float,
+        orig_shape: tuple[int, int],
+        rotated_shape: tuple[int, int],
+        offsets: tuple[int, int],
+        target_shape: tuple[int, int],
+    ) -> np.ndarray:
+        """Rotate the localization predictions of a page along with it
+
+        Args:
+            loc_preds: (N, 5) or (N, 5, 2) array of RELATIVE boxes with their objectness scores
+            angle: rotation angle of the page in degrees, between -90 and +90
+            orig_shape: shape of the page before its rotation
+            rotated_shape: shape of the rotated page, before its padding was removed
+            offsets: (y, x) offsets of the rotated page once its padding was removed
+            target_shape: shape of the rotated page once its padding was removed
+
+        Returns:
+            the rotated localization predictions, in the same format
+        """
+        straight_boxes = loc_preds.ndim == 2
+        scores = loc_preds[:, 4] if straight_boxes else loc_preds[:, 4, 1]
+        polys = rotate_boxes(loc_preds[:, :4], angle, orig_shape, min_angle=0, target_shape=rotated_shape)
+        # Remove the padding of the rotated page
+        polys[..., 0] = (polys[..., 0] * rotated_shape[1] - offsets[1]) / target_shape[1]
+        polys[..., 1] = (polys[..., 1] * rotated_shape[0] - offsets[0]) / target_shape[0]
+        if not straight_boxes:
+            rotated_loc_preds = np.concatenate((polys, np.stack((np.zeros_like(scores), scores), axis=-1)[:, None]), 1)
+            return np.clip(rotated_loc_preds, 0, 1)
+
+        # Straight boxes enclose words rotated by the angle: recover the size of the words once straightened
+        cos, sin = np.cos(np.deg2rad(abs(angle))), np.sin(np.deg2rad(abs(angle)))
+        box_w = (loc_preds[:, 2] - loc_preds[:, 0]) * orig_shape[1]
+        box_h = (loc_preds[:, 3] - loc_preds[:, 1]) * orig_shape[0]
+        word_w = (box_w * cos - box_h * sin) / (cos**2 - sin**2)
+        word_h = (box_h * cos - box_w * sin) / (cos**2 - sin**2)
+        # Fallback to the box enclosing the rotated polygon when it can't be the envelope of a rotated word
+        is_valid = (word_w > 0) & (word_h > 0)
+        center_x = polys[..., 0].mean(axis=1) * target_shape[1]
+        center_y = polys[..., 1].mean(axis=1) * target_shape[0]
+        rotated_loc_preds = np.stack(
+            (
+                np.where(is_valid, (center_x - word_w / 2) / target_shape[1], polys[..., 0].min(axis=1)),
+                np.where(is_valid, (center_y - word_h / 2) / target_shape[0], polys[..., 1].min(axis=1)),
+                np.where(is_valid, (center_x + word_w / 2) / target_shape[1], polys[..., 0].max(axis=1)),
+                np.where(is_valid, (center_y + word_h / 2) / target_shape[0], polys[..., 1].max(axis=1)),
+                scores,
+            ),
+            axis=1,
+        )
+        return np.clip(rotated_loc_preds, 0, 1)
 
     @staticmethod
     def _generate_crops(
@@ -77,14 +77,16 @@ class OCRPredictor(nn.Module, _OCRPredictor):
 
         origin_page_shapes = [page.shape[:2] for page in pages]
 
-        # Localize text elements
-        loc_preds, out_maps = self.det_predictor(pages, return_maps=True, **kwargs)
+        # Localize text elements, segmentation maps are only retrieved when the page orientation is estimated
+        seg_maps: list[np.ndarray] = []
+        if self.detect_orientation or self.straighten_pages:
+            loc_preds, out_maps = self.det_predictor(pages, return_maps=True, **kwargs)
+            bin_thresh = getattr(self.det_predictor.model.postprocessor, "bin_thresh")
+            seg_maps = [np.where(out_map > bin_thresh, 255, 0).astype(np.uint8) for out_map in out_maps]
+        else:
+            loc_preds = self.det_predictor(pages, **kwargs)
 
         # Detect document rotation and rotate pages
-        seg_maps = [
-            np.where(out_map > getattr(self.det_predictor.model.postprocessor, "bin_thresh"), 255, 0).astype(np.uint8)
-            for out_map in out_maps
-        ]
         if self.detect_orientation:
             general_pages_orientations, origin_pages_orientations = self._get_orientations(pages, seg_maps)
             orientations = [
@@ -95,13 +97,12 @@ class OCRPredictor(nn.Module, _OCRPredictor):
             general_pages_orientations = None
             origin_pages_orientations = None
         if self.straighten_pages:
-            pages = self._straighten_pages(pages, seg_maps, general_pages_orientations, origin_pages_orientations)
+            pages, loc_preds = self._straighten_pages(
+                pages, loc_preds, seg_maps, general_pages_orientations, origin_pages_orientations, **kwargs
+            )
             # update page shapes after straightening
             origin_page_shapes = [page.shape[:2] for page in pages]
 
-            # Forward again to get predictions on straight pages
-            loc_preds = self.det_predictor(pages, **kwargs)
-
         assert all(len(loc_pred) == 1 for loc_pred in loc_preds), (
             "Detection Model in ocr_predictor should output only one class"
         )
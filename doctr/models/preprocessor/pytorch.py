@@ -76,6 +76,54 @@ class PreProcessor(nn.Module):
 
         return tensor
 
+    def _resize_into(self, crop: np.ndarray, out: np.ndarray) -> None:
+        """Resize (and pad) a uint8 image of shape (H, W, C) into a preallocated buffer, like `self.resize` does"""
+        height, width = out.shape[:2]
+        x_offset, y_offset = 0, 0
+        if self.resize.preserve_aspect_ratio and (height / width) != (crop.shape[0] / crop.shape[1]):
+            actual_ratio = crop.shape[0] / crop.shape[1]
+            if actual_ratio > height / width:
+                tmp_size = (height, max(int(height / actual_ratio), 1))
+            else:
+                tmp_size = (max(int(width * actual_ratio), 1), width)
+            if self.resize.symmetric_pad:
+                y_offset, x_offset = math.ceil((height - tmp_size[0]) / 2), math.ceil((width - tmp_size[1]) / 2)
+            height, width = tmp_size
+        # Same antialiased resampling as `self.resize`, written in place of the padded area
+        resized = F.resize(
+            torch.from_numpy(crop).permute(2, 0, 1), [height, width], self.resize.interpolation, antialias=True
+        )
+        out[y_offset : y_offset + height, x_offset : x_offset + width] = resized.permute(1, 2, 0).numpy()
+
+    def batch_crops(self, crops: list[np.ndarray]) -> list[torch.Tensor]:
+        """Resize, pad, batch and normalize uint8 crops in a single pass
+
+        Each crop is resized directly into a preallocated batch buffer, which avoids the per-crop padding & stacking
+        of `__call__`. Resampling is the same as the one of `__call__`.
+
+        Args:
+            crops: list of uint8 images of shape (H, W, C)
+
+        Returns:
+            list of batches (*, C, H, W) ready for model inference
+        """
+        if any(crop.ndim != 3 for crop in crops):
+            raise AssertionError("expected list of 3D Tensors")
+        if any(crop.dtype != np.uint8 for crop in crops):
+            raise TypeError("unsupported data type for numpy.ndarray")
+        if len(crops) == 0:
+            return []
+
+        buffer = np.zeros((len(crops), *self.resize.size, crops[0].shape[-1]), dtype=np.uint8)
+        list(multithread_exec(lambda idx: self._resize_into(crops[idx], buffer[idx]), range(len(crops))))
+        tensor = torch.from_numpy(buffer).permute(0, 3, 1, 2)
+        batches = [
+            tensor[idx : idx + self.batch_size].to(dtype=torch.float32).div(255)
+            for idx in range(0, len(crops), self.batch_size)
+        ]
+
+        return list(multithread_exec(self.normalize, batches))
+
     def __call__(self, x: np.ndarray | list[np.ndarray]) -> list[torch.Tensor]:
         """Prepare document data for model forwarding
 
@@ -1,7 +1,26 @@
-from .crnn import *
-from .master import *
-from .sar import *
-from .vitstr import *
-from .parseq import *
-from .viptr import *
-from .zoo import *
+import importlib
+
+from doctr.file_utils import lazy_import
+
+# Each architecture is only imported when one of its names is accessed
+__all__, __getattr__, __dir__ = lazy_import(
+    __name__,
+    ["crnn", "master", "sar", "vitstr", "parseq", "viptr", "predictor", "core", "utils", "zoo"],
+    {
+        ".crnn": ["CRNN", "crnn_vgg16_bn", "crnn_mobilenet_v3_small", "crnn_mobilenet_v3_large"],
+        ".master": ["MASTER", "master"],
+        ".sar": ["SAR", "sar_resnet31"],
+        ".vitstr": ["ViTSTR", "vitstr_small", "vitstr_base"],
+        ".parseq": ["PARSeq", "parseq"],
+        ".viptr": ["VIPTR", "viptr_tiny"],
+        ".zoo": ["recognition_predictor"],
+    },
+)
+
+# `master` & `parseq` name both an architecture and its submodule. A submodule is bound to its package when it is first
+# imported, which would hide the architecture: these ones are imported upfront (they only resolve their architecture
+# lazily) and unbound, so that the architectures are resolved on first access, as with star imports
+for _submodule in ("master", "parseq"):
+    importlib.import_module(f".{_submodule}", __name__)
+    del globals()[_submodule]
+del _submodule
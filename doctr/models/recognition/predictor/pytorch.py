@@ -66,7 +66,10 @@ class RecognitionPredictor(nn.Module):
                 crops = new_crops
 
         # Resize & batch them
-        processed_batches = self.pre_processor(crops)  # type: ignore[arg-type]
+        if all(crop.dtype == np.uint8 for crop in crops):
+            processed_batches = self.pre_processor.batch_crops(crops)  # type: ignore[arg-type]
+        else:
+            processed_batches = self.pre_processor(crops)  # type: ignore[arg-type]
 
         # Forward it
         _params = next(self.model.parameters())
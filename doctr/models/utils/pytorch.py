@@ -3,13 +3,19 @@
 # This program is licensed under the Apache License 2.0.
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
+import inspect
 import logging
+import os
+import zipfile
 from typing import Any
 
 import torch
 import validators
 from torch import nn
 
+import doctr
+from doctr.file_utils import ENV_VARS_TRUE_VALUES
+from doctr.utils.common_types import AbstractPath
 from doctr.utils.data import download_from_url
 
 __all__ = [
@@ -17,6 +23,8 @@ __all__ = [
     "conv_sequence_pt",
     "set_device_and_dtype",
     "export_model_to_onnx",
+    "save_predictor",
+    "load_predictor",
     "_copy_tensor",
     "_bf16_to_float32",
     "_CompiledModule",
@@ -24,6 +32,8 @@ __all__ = [
 
 # torch compiled model type
 _CompiledModule = torch._dynamo.eval_frame.OptimizedModule
+# Memory-mapped checkpoints (and the assignment of their tensors to a model) require torch>=2.1
+_MMAP_SUPPORTED = "mmap" in inspect.signature(torch.load).parameters
 
 
 def _copy_tensor(x: torch.Tensor) -> torch.Tensor:
@@ -40,6 +50,7 @@ def load_pretrained_params(
     path_or_url: str | None = None,
     hash_prefix: str | None = None,
     ignore_keys: list[str] | None = None,
+    mmap: bool | None = None,
     **kwargs: Any,
 ) -> None:
     """Load a set of parameters onto a model
@@ -52,7 +63,15 @@ def load_pretrained_params(
         path_or_url: the path or URL to the model parameters (checkpoint)
         hash_prefix: first characters of SHA256 expected hash
         ignore_keys: list of weights to be ignored from the state_dict
+        mmap: whether the parameters should be memory-mapped from the checkpoint rather than copied in memory,
+            defaults to the `DOCTR_MMAP_WEIGHTS` environment variable
         **kwargs: additional arguments to be passed to `doctr.utils.data.download_from_url`
+
+    Notes:
+        Memory-mapped parameters are backed by the page cache: processes loading the same checkpoint share a single
+        copy of the weights, as long as they don't modify them (e.g. by training the model, or moving it to another
+        device or dtype). Enable it for all the models with `DOCTR_MMAP_WEIGHTS=TRUE`. It requires torch>=2.1, the
+        parameters are copied with earlier versions.
     """
     if path_or_url is None:
         logging.warning("No model URL or Path provided, using default initialization.")
@@ -64,15 +83,26 @@ def load_pretrained_params(
         else path_or_url
     )
 
+    if mmap is None:
+        mmap = os.environ.get("DOCTR_MMAP_WEIGHTS", "").upper() in ENV_VARS_TRUE_VALUES
+    if mmap and not _MMAP_SUPPORTED:
+        logging.warning(f"Memory-mapped parameters require torch>=2.1 (found {torch.__version__}), copying them.")
+    # Only checkpoints in the zip format of torch.save can be memory-mapped
+    mmap = mmap and _MMAP_SUPPORTED and zipfile.is_zipfile(archive_path)
+    # The arguments are only passed when enabled, as earlier versions of torch don't accept them
+    load_kwargs: dict[str, Any] = {"mmap": True} if mmap else {}
+    assign_kwargs: dict[str, Any] = {"assign": True} if mmap else {}
+
     # Read state_dict
-    state_dict = torch.load(archive_path, map_location="cpu")
+    state_dict = torch.load(archive_path, map_location="cpu", **load_kwargs)
 
     # Remove weights from the state_dict
+    # NOTE: memory-mapped tensors are assigned to the model as is, copying them would defeat the purpose
     if ignore_keys is not None and len(ignore_keys) > 0:
         for key in ignore_keys:
             if key in state_dict:
                 state_dict.pop(key)
-        missing_keys, unexpected_keys = model.load_state_dict(state_dict, strict=False)
+        missing_keys, unexpected_keys = model.load_state_dict(state_dict, strict=False, **assign_kwargs)
         if any(k not in ignore_keys for k in missing_keys + unexpected_keys):
             raise ValueError(
                 "Unable to load state_dict, due to non-matching keys.\n"
@@ -80,7 +110,7 @@ def load_pretrained_params(
             )
     else:
         # Load weights
-        model.load_state_dict(state_dict)
+        model.load_state_dict(state_dict, **assign_kwargs)
 
 
 def conv_sequence_pt(
@@ -175,3 +205,60 @@ def export_model_to_onnx(model: nn.Module, model_name: str, dummy_input: torch.T
     )
     logging.info(f"Model exported to {model_name}.onnx")
     return f"{model_name}.onnx"
+
+
+def save_predictor(predictor: nn.Module, path: AbstractPath) -> None:
+    """Save a fully built predictor (architectures, weights & pre/post-processing configuration) in a single file,
+    which can be loaded back with `load_predictor`
+
+    >>> from doctr.models import ocr_predictor
+    >>> from doctr.models.utils import save_predictor
+    >>> save_predictor(ocr_predictor(pretrained=True), "ocr_predictor.pt")
+
+    Args:
+        predictor: the predictor (or model) to save
+        path: the path of the snapshot
+    """
+    if any(isinstance(module, _CompiledModule) for module in predictor.modules()):
+        raise ValueError("compiled models can't be saved, save the predictor before compiling it")
+    # Concurrent writers (e.g. worker processes) never leave a partially written snapshot behind
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    version = doctr.__version__  # type: ignore[attr-defined]
+    try:
+        torch.save({"doctr_version": version, "torch_version": torch.__version__, "predictor": predictor}, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_predictor(path: AbstractPath) -> nn.Module:
+    """Load a predictor saved with `save_predictor`
+
+    Nothing is built nor downloaded: the objects are restored as they were saved, and the weights are memory-mapped
+    from the file rather than read (with torch>=2.1), so that loading takes a fraction of the time needed to build the
+    predictor.
+
+    >>> from doctr.models.utils import load_predictor
+    >>> model = load_predictor("ocr_predictor.pt")
+
+    Args:
+        path: the path of the snapshot
+
+    Returns:
+        the predictor, on CPU
+
+    Notes:
+        Snapshots are pickled Python objects, only load the ones you trust. They are tied to the version of docTR
+        which saved them.
+    """
+    snapshot = torch.load(path, map_location="cpu", weights_only=False, **({"mmap": True} if _MMAP_SUPPORTED else {}))
+    if not isinstance(snapshot, dict) or "predictor" not in snapshot:
+        raise ValueError(f"{path} is not a docTR predictor snapshot")
+    version = doctr.__version__  # type: ignore[attr-defined]
+    if snapshot["doctr_version"] != version:
+        logging.warning(
+            f"The predictor was saved with docTR {snapshot['doctr_version']}, it may not behave as expected "
+            f"with docTR {version}."
+        )
+    return snapshot["predictor"]
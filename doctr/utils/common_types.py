@@ -13,5 +13,5 @@ BoundingBox = tuple[Point2D, Point2D]
 Polygon4P = tuple[Point2D, Point2D, Point2D, Point2D]
 Polygon = list[Point2D]
 AbstractPath = str | Path
-AbstractFile = AbstractPath | bytes
+AbstractFile = AbstractPath | bytes | bytearray | memoryview
 Bbox = tuple[float, float, float, float]
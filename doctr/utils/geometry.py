@@ -3,7 +3,6 @@
 # This program is licensed under the Apache License 2.0.
 # See LICENSE or go to <https://opensource.org/licenses/Apache-2.0> for full license details.
 
-from copy import deepcopy
 from math import ceil
 
 import cv2
@@ -329,14 +328,17 @@ def rotate_image(
     return rot_img
 
 
-def remove_image_padding(image: np.ndarray) -> np.ndarray:
+def remove_image_padding(
+    image: np.ndarray, return_offsets: bool = False
+) -> np.ndarray | tuple[np.ndarray, tuple[int, int]]:
     """Remove black border padding from an image
 
     Args:
         image: numpy tensor to remove padding from
+        return_offsets: whether the (y, x) offsets of the kept region in the input image should be returned as well
 
     Returns:
-        Image with padding removed
+        Image with padding removed, and optionally the offsets of the kept region
     """
     # Find the bounding box of the non-black region
     rows = np.any(image, axis=1)
@@ -344,6 +346,8 @@ def remove_image_padding(image: np.ndarray) -> np.ndarray:
     rmin, rmax = np.where(rows)[0][[0, -1]]
     cmin, cmax = np.where(cols)[0][[0, -1]]
 
+    if return_offsets:
+        return image[rmin : rmax + 1, cmin : cmax + 1], (int(rmin), int(cmin))
     return image[rmin : rmax + 1, cmin : cmax + 1]
 
 
@@ -399,7 +403,7 @@ def extract_crops(img: np.ndarray, boxes: np.ndarray) -> list[np.ndarray]:
             coordinates (xmin, ymin, xmax, ymax)
 
     Returns:
-        list of cropped images
+        list of cropped images, which are views of the input image (no pixel is copied)
     """
     if boxes.shape[0] == 0:
         return []
@@ -416,7 +420,7 @@ def extract_crops(img: np.ndarray, boxes: np.ndarray) -> list[np.ndarray]:
         # Add last index
         _boxes[2:] += 1
 
-    return deepcopy([img[box[1] : box[3], box[0] : box[2]] for box in _boxes])
+    return [img[box[1] : box[3], box[0] : box[2]] for box in _boxes]
 
 
 def extract_rcrops(
@@ -445,68 +449,63 @@ def extract_rcrops(
         _boxes[:, :, 0] *= width
         _boxes[:, :, 1] *= height
 
-    src_img = img
-
     # Handle only horizontal oriented boxes
     if assume_horizontal:
-        crops = []
-
-        for box in _boxes:
-            # Calculate the centroid of the quadrilateral
-            centroid = np.mean(box, axis=0)
-
-            # Divide the points into left and right
-            left_points = box[box[:, 0] < centroid[0]]
-            right_points = box[box[:, 0] >= centroid[0]]
-
-            # Sort the left points according to the y-axis
-            left_points = left_points[np.argsort(left_points[:, 1])]
-            top_left_pt = left_points[0]
-            bottom_left_pt = left_points[-1]
-            # Sort the right points according to the y-axis
-            right_points = right_points[np.argsort(right_points[:, 1])]
-            top_right_pt = right_points[0]
-            bottom_right_pt = right_points[-1]
-            box_points = np.array(
-                [top_left_pt, bottom_left_pt, top_right_pt, bottom_right_pt],
-                dtype=dtype,
-            )
-
-            # Get the width and height of the rectangle that will contain the warped quadrilateral
-            width_upper = np.linalg.norm(top_right_pt - top_left_pt)
-            width_lower = np.linalg.norm(bottom_right_pt - bottom_left_pt)
-            height_left = np.linalg.norm(bottom_left_pt - top_left_pt)
-            height_right = np.linalg.norm(bottom_right_pt - top_right_pt)
-
-            # Get the maximum width and height
-            rect_width = max(int(width_upper), int(width_lower))
-            rect_height = max(int(height_left), int(height_right))
-
-            dst_pts = np.array(
-                [
-                    [0, 0],  # top-left
-                    # bottom-left
-                    [0, rect_height - 1],
-                    # top-right
-                    [rect_width - 1, 0],
-                    # bottom-right
-                    [rect_width - 1, rect_height - 1],
-                ],
-                dtype=dtype,
-            )
-
-            # Get the perspective transform matrix using the box points
-            affine_mat = cv2.getPerspectiveTransform(box_points, dst_pts)
+        # Split the points of each box into left and right ones, with respect to its centroid
+        # (a stable sort keeps the original order of points that share the same x-coordinate)
+        centroids = _boxes.mean(axis=1, keepdims=True)
+        is_right = _boxes[..., 0] >= centroids[..., 0]
+        side_order = np.argsort(is_right, axis=1, kind="stable")
+        num_left = (~is_right).sum(axis=1)
+        # Sort each side according to the y-axis
+        y_order = np.argsort(
+            np.where(
+                np.arange(4)[None] < num_left[:, None],
+                np.take_along_axis(_boxes[..., 1], side_order, axis=1),
+                np.inf,
+            ),
+            axis=1,
+            kind="stable",
+        )
+        left_points = np.take_along_axis(_boxes, np.take_along_axis(side_order, y_order, axis=1)[..., None], axis=1)
+        y_order = np.argsort(
+            np.where(
+                np.arange(4)[None] >= num_left[:, None],
+                np.take_along_axis(_boxes[..., 1], side_order, axis=1),
+                np.inf,
+            ),
+            axis=1,
+            kind="stable",
+        )
+        right_points = np.take_along_axis(_boxes, np.take_along_axis(side_order, y_order, axis=1)[..., None], axis=1)
+        rows = np.arange(_boxes.shape[0])
+        top_left_pt, bottom_left_pt = left_points[:, 0], left_points[rows, num_left - 1]
+        top_right_pt, bottom_right_pt = right_points[:, 0], right_points[rows, 3 - num_left]
+        box_points = np.stack([top_left_pt, bottom_left_pt, top_right_pt, bottom_right_pt], axis=1).astype(dtype)
+
+        # Get the maximum width and height of the rectangle that will contain the warped quadrilateral
+        rect_widths = np.maximum(
+            np.linalg.norm(top_right_pt - top_left_pt, axis=-1).astype(int),
+            np.linalg.norm(bottom_right_pt - bottom_left_pt, axis=-1).astype(int),
+        )
+        rect_heights = np.maximum(
+            np.linalg.norm(bottom_left_pt - top_left_pt, axis=-1).astype(int),
+            np.linalg.norm(bottom_right_pt - top_right_pt, axis=-1).astype(int),
+        )
+        # top-left, bottom-left, top-right, bottom-right
+        dst_pts = np.zeros((_boxes.shape[0], 4, 2), dtype=dtype)
+        dst_pts[:, 1, 1] = dst_pts[:, 3, 1] = rect_heights - 1
+        dst_pts[:, 2, 0] = dst_pts[:, 3, 0] = rect_widths - 1
 
-            # Perform the perspective warp to get the rectified crop
-            crop = cv2.warpPerspective(
-                src_img,
-                affine_mat,
-                (rect_width, rect_height),
+        # Perform the perspective warp of each box to get the rectified crops
+        crops = [
+            cv2.warpPerspective(
+                img,
+                cv2.getPerspectiveTransform(box_points[idx], dst_pts[idx]),
+                (int(rect_widths[idx]), int(rect_heights[idx])),
             )
-
-            # Add the crop to the list of crops
-            crops.append(crop)
+            for idx in range(_boxes.shape[0])
+        ]
 
     # Handle any oriented boxes
     else:
@@ -521,7 +520,7 @@ def extract_rcrops(
         # Use a warp transformation to extract the crop
         crops = [
             cv2.warpAffine(
-                src_img,
+                img,
                 # Transformation matrix
                 cv2.getAffineTransform(src_pts[idx], dst_pts[idx]),
                 (int(d1[idx]), int(d2[idx])),
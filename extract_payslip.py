@@ -38,25 +38,36 @@ class PayslipExtractor:
         }
         
         for page_idx, page in enumerate(result.pages):
-            page_text = ""
-            words_data = []
-            
-            for block in page.blocks:
-                for line in block.lines:
-                    line_text = ""
-                    for word in line.words:
-                        word_text = word.value
-                        word_confidence = word.confidence
-                        word_geometry = word.geometry
-                        
-                        words_data.append({
-                            'text': word_text,
-                            'confidence': word_confidence,
-                            'geometry': word_geometry
-                        })
-                        
-                        line_text += word_text + " "
-                    page_text += line_text.strip() + "\n"
+            # Texte et géométrie des mots, depuis la table des mots de la page
+            page_text = page.render(block_break="\n")
+            page_text = page_text + "\n" if page_text else ""
+            words = page.export_words()
+            if 'xmin' in words:
+                geometries = [
+                    ((xmin, ymin), (xmax, ymax))
+                    for xmin, ymin, xmax, ymax in zip(
+                        words['xmin'].tolist(), words['ymin'].tolist(), words['xmax'].tolist(), words['ymax'].tolist()
+                    )
+                ]
+            else:
+                # Boîtes tournées : les 4 coins de chaque mot (colonnes x1, y1, ..., x4, y4)
+                geometries = [
+                    tuple(zip(xs, ys))
+                    for xs, ys in zip(
+                        zip(*(words[f'x{idx}'].tolist() for idx in range(1, 5))),
+                        zip(*(words[f'y{idx}'].tolist() for idx in range(1, 5)))
+                    )
+                ]
+            words_data = [
+                {
+                    'text': word_text,
+                    'confidence': word_confidence,
+                    'geometry': geometry
+                }
+                for word_text, word_confidence, geometry in zip(
+                    words['value'].tolist(), words['confidence'].tolist(), geometries
+                )
+            ]
             
             extracted_data['pages'].append({
                 'page_num': page_idx + 1,
@@ -33,14 +33,9 @@ class PayslipExtractorAdvanced:
         result = self.model(doc)
         
         # Extraire le texte
-        full_text = ""
-        for page in result.pages:
-            for block in page.blocks:
-                for line in block.lines:
-                    line_text = ""
-                    for word in line.words:
-                        line_text += word.value + " "
-                    full_text += line_text.strip() + "\n"
+        # Une ligne de texte par ligne OCR
+        full_text = result.render(page_break="\n", block_break="\n")
+        full_text = full_text + "\n" if full_text else ""
         
         return full_text
     
@@ -18,6 +18,9 @@ from doctr.io import DocumentFile
 class PayslipProcessor:
     """Processeur de bulletins de salaire avec interface utilisateur"""
     
+    # À incrémenter quand la logique d'extraction change : invalide les résultats mis en cache
+    VERSION = "1.0"
+    
     def __init__(self):
         print("🔍 Initialisation du processeur de bulletins...")
         self.model = ocr_predictor(pretrained=True)
@@ -29,19 +32,30 @@ class PayslipProcessor:
         doc = DocumentFile.from_pdf(pdf_path)
         result = self.model(doc)
         
+        return self._parse_result(result, Path(pdf_path).name)
+    
+    def process_payslip_bytes(self, data, file_name: str) -> Dict[str, Any]:
+        """Traiter un bulletin déjà en mémoire (bytes, bytearray ou memoryview), sans fichier temporaire"""
+        return self.process_payslip_pages(DocumentFile.from_pdf(data), file_name)
+    
+    def process_payslip_pages(self, pages, file_name: str) -> Dict[str, Any]:
+        """Traiter les pages déjà décodées d'un bulletin (OCR et extraction des données)"""
+        result = self.model(pages)
+        
+        return self._parse_result(result, file_name)
+    
+    def _parse_result(self, result, file_name: str) -> Dict[str, Any]:
+        """Parser les données importantes d'un résultat OCR"""
         # Extraire le texte
-        full_text = ""
-        for page in result.pages:
-            for block in page.blocks:
-                for line in block.lines:
-                    line_text = " ".join([word.value for word in line.words])
-                    full_text += line_text + "\n"
+        # Une ligne de texte par ligne OCR
+        full_text = result.render(page_break="\n", block_break="\n")
+        full_text = full_text + "\n" if full_text else ""
         
         # Parser les données importantes
         import re
         
         data = {
-            'file_name': Path(pdf_path).name,
+            'file_name': file_name,
             'employer': self._extract_pattern(full_text, r'(?:^|\n)([A-ZÀ-Ÿ\s&]+)\n[0-9]+'),
             'employee_name': self._extract_pattern(full_text, r'(?:Madame|Monsieur|M\.|Mme)\s+([A-ZÀ-Ÿ\s]+)(?=\n[0-9]|\nAPPT)'),
             'matricule': self._extract_pattern(full_text, r'Matricule\s*:?\s*([0-9]+)'),
@@ -20,7 +20,7 @@ def main(args):
 
     # Pretrained imagenet model
     model = (
-        classification.__dict__[args.arch](
+        getattr(classification, args.arch)(
             pretrained=args.pretrained,
         )
         .eval()
@@ -234,7 +234,7 @@ def main(args):
     batch_transforms = Normalize(mean=(0.694, 0.695, 0.693), std=(0.299, 0.296, 0.301))
 
     # Load doctr model
-    model = classification.__dict__[args.arch](pretrained=args.pretrained, num_classes=len(vocab), classes=list(vocab))
+    model = getattr(classification, args.arch)(pretrained=args.pretrained, num_classes=len(vocab), classes=list(vocab))
 
     # Resume weights
     if isinstance(args.resume, str):
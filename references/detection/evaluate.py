@@ -74,7 +74,7 @@ def main(args):
     torch.backends.cudnn.benchmark = True
 
     # Load docTR model
-    model = detection.__dict__[args.arch](
+    model = getattr(detection, args.arch)(
         pretrained=not isinstance(args.resume, str), assume_straight_pages=not args.rotation
     ).eval()
 
@@ -85,7 +85,7 @@ def main(args):
     mean, std = model.cfg["mean"], model.cfg["std"]
 
     st = time.time()
-    ds = datasets.__dict__[args.dataset](
+    ds = getattr(datasets, args.dataset)(
         train=True,
         download=True,
         use_polygons=args.rotation,
@@ -98,7 +98,7 @@ def main(args):
     subfolder = ds.root.split("/")[-2:]
     ds.root = str(Path(ds.root).parent.parent)
     ds.data = [(os.path.join(*subfolder, name), target) for name, target in ds.data]
-    _ds = datasets.__dict__[args.dataset](
+    _ds = getattr(datasets, args.dataset)(
         train=False,
         download=True,
         use_polygons=args.rotation,
@@ -20,7 +20,7 @@ def main(args):
 
     # Pretrained imagenet model
     model = (
-        detection.__dict__[args.arch](pretrained=args.pretrained, pretrained_backbone=False).eval().to(device=device)
+        getattr(detection, args.arch)(pretrained=args.pretrained, pretrained_backbone=False).eval().to(device=device)
     )
 
     # Input
@@ -284,7 +284,7 @@ def main(args):
     batch_transforms = Normalize(mean=(0.798, 0.785, 0.772), std=(0.264, 0.2749, 0.287))
 
     # Load docTR model
-    model = detection.__dict__[args.arch](
+    model = getattr(detection, args.arch)(
         pretrained=args.pretrained,
         assume_straight_pages=not args.rotation,
         class_names=class_names,
@@ -76,7 +76,7 @@ def main(args):
         args.workers = min(16, mp.cpu_count())
 
     # Load doctr model
-    model = recognition.__dict__[args.arch](
+    model = getattr(recognition, args.arch)(
         pretrained=True if args.resume is None else False,
         input_shape=(3, args.input_size, 4 * args.input_size),
         vocab=VOCABS[args.vocab],
@@ -88,7 +88,7 @@ def main(args):
         model.from_pretrained(args.resume)
 
     st = time.time()
-    ds = datasets.__dict__[args.dataset](
+    ds = getattr(datasets, args.dataset)(
         train=True,
         download=True,
         recognition_task=True,
@@ -96,7 +96,7 @@ def main(args):
         img_transforms=T.Resize((args.input_size, 4 * args.input_size), preserve_aspect_ratio=True),
     )
 
-    _ds = datasets.__dict__[args.dataset](
+    _ds = getattr(datasets, args.dataset)(
         train=False,
         download=True,
         recognition_task=True,
@@ -20,7 +20,7 @@ def main(args):
 
     # Pretrained imagenet model
     model = (
-        recognition.__dict__[args.arch](
+        getattr(recognition, args.arch)(
             pretrained=args.pretrained,
             pretrained_backbone=False,
         )
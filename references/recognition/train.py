@@ -255,7 +255,7 @@ def main(args):
             val_hash = None
             val_datasets = args.val_datasets
 
-            val_set = datasets.__dict__[val_datasets[0]](
+            val_set = getattr(datasets, val_datasets[0])(
                 train=False,
                 download=True,
                 recognition_task=True,
@@ -268,7 +268,7 @@ def main(args):
             )
             if len(val_datasets) > 1:
                 for dataset_name in val_datasets[1:]:
-                    _ds = datasets.__dict__[dataset_name](
+                    _ds = getattr(datasets, dataset_name)(
                         train=False,
                         download=True,
                         recognition_task=True,
@@ -307,7 +307,7 @@ def main(args):
     batch_transforms = Normalize(mean=(0.694, 0.695, 0.693), std=(0.299, 0.296, 0.301))
 
     # Load doctr model
-    model = recognition.__dict__[args.arch](pretrained=args.pretrained, vocab=vocab)
+    model = getattr(recognition, args.arch)(pretrained=args.pretrained, vocab=vocab)
 
     # Resume weights
     if isinstance(args.resume, str):
@@ -376,7 +376,7 @@ def main(args):
         train_hash = None
         train_datasets = args.train_datasets
 
-        train_set = datasets.__dict__[train_datasets[0]](
+        train_set = getattr(datasets, train_datasets[0])(
             train=True,
             download=True,
             recognition_task=True,
@@ -389,7 +389,7 @@ def main(args):
         )
         if len(train_datasets) > 1:
             for dataset_name in train_datasets[1:]:
-                _ds = datasets.__dict__[dataset_name](
+                _ds = getattr(datasets, dataset_name)(
                     train=True,
                     download=True,
                     recognition_task=True,
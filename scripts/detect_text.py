@@ -10,7 +10,7 @@ from pathlib import Path
 
 from tqdm import tqdm
 
-from doctr.io import DocumentFile
+from doctr.io import DocumentFile, write_hocr
 from doctr.models import detection, ocr_predictor
 
 IMAGE_FILE_EXTENSIONS = [".jpeg", ".jpg", ".png", ".tif", ".tiff", ".bmp"]
@@ -34,21 +34,20 @@ def _process_file(model, file_path: Path, out_format: str) -> None:
         output = json.dumps(out.export(), indent=2)
     elif out_format == "txt":
         output = out.render()
-    elif out_format == "xml":
-        output = out.export_as_xml()
 
     path = Path("output").joinpath(file_path.stem + "." + out_format)
     if out_format == "xml":
-        for i, (xml_bytes, xml_tree) in enumerate(output):
+        for i, page in enumerate(out.pages):
             path = Path("output").joinpath(file_path.stem + f"_{i}." + out_format)
-            xml_tree.write(path, encoding="utf-8", xml_declaration=True)
+            with open(path, "wb") as f:
+                write_hocr(page, f)
     else:
         with open(path, "w") as f:
             f.write(output)
 
 
 def main(args):
-    detection_model = detection.__dict__[args.detection](
+    detection_model = getattr(detection, args.detection)(
         pretrained=True,
         bin_thresh=args.bin_thresh,
         box_thresh=args.box_thresh,
@@ -52,13 +52,13 @@ def main(args):
         )
         sets = [testset]
     else:
-        train_set = datasets.__dict__[args.dataset](
+        train_set = getattr(datasets, args.dataset)(
             train=True,
             download=True,
             use_polygons=not args.eval_straight,
             sample_transforms=_transform,
         )
-        val_set = datasets.__dict__[args.dataset](
+        val_set = getattr(datasets, args.dataset)(
             train=False,
             download=True,
             use_polygons=not args.eval_straight,
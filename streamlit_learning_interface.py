@@ -4,6 +4,7 @@ Interface Streamlit interactive pour corriger et entraîner l'extracteur
 """
 
 import streamlit as st
+import hashlib
 import json
 from pathlib import Path
 from datetime import datetime
@@ -42,6 +43,15 @@ def main():
     elif mode == "⚙️ Gestion des Patterns":
         pattern_management_mode()
 
+@st.cache_resource(show_spinner=False, max_entries=32)
+def cached_ocr(content_hash: str, _extractor, _data):
+    """Résultat OCR mis en cache par contenu du fichier
+    
+    Les paramètres préfixés par `_` ne sont pas hachés par Streamlit : le hash du contenu suffit.
+    Le résultat est partagé tel quel (sans copie), il ne doit pas être modifié.
+    """
+    return _extractor.ocr_from_bytes(_data)
+
 def extract_and_correct_mode():
     """Mode extraction et correction"""
     st.header("🔍 Extraction et Correction des Bulletins")
@@ -54,19 +64,21 @@ def extract_and_correct_mode():
     )
     
     if uploaded_file is not None:
-        # Sauvegarder temporairement le fichier
-        temp_path = f"/tmp/{uploaded_file.name}"
-        with open(temp_path, "wb") as f:
-            f.write(uploaded_file.read())
-        
         st.success(f"✅ Fichier téléchargé : {uploaded_file.name}")
         
         # Bouton d'extraction
         if st.button("🚀 Extraire les données", type="primary"):
             with st.spinner("🔍 Extraction en cours..."):
                 try:
-                    # Extraire les données
-                    extracted_data = st.session_state.extractor.extract_all_data(temp_path)
+                    # Extraction directement depuis la mémoire, sans fichier temporaire.
+                    # L'OCR d'un même fichier n'est jamais refait : seule l'extraction des champs, qui
+                    # dépend des patterns appris, est relancée
+                    extractor = st.session_state.extractor
+                    data = uploaded_file.getbuffer()
+                    result = cached_ocr(hashlib.sha256(data).hexdigest(), extractor, data)
+                    extracted_data = extractor.extract_from_result(
+                        result, extractor.bytes_file_info(data, uploaded_file.name)
+                    )
                     st.session_state.extracted_data = extracted_data
                     st.session_state.pdf_filename = uploaded_file.name
                     st.success("✅ Extraction terminée !")
@@ -5,10 +5,15 @@ Avec gestion d'erreurs et support de gros fichiers
 """
 
 import streamlit as st
-import tempfile
+import hashlib
 import json
-from pathlib import Path
+import os
+import queue
+import threading
+import time
 import pandas as pd
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 
 # Configuration de la page
@@ -26,10 +31,63 @@ st.markdown("*Uploadez vos bulletins PDF pour extraire automatiquement les donn
 # Barre latérale
 st.sidebar.title("⚙️ Configuration")
 
+# Nombre de workers (chacun garde son propre modèle en mémoire) : fixé au lancement, le pool est partagé
+# par toutes les sessions
+NUM_WORKERS = int(os.environ.get("PAYSLIP_NUM_WORKERS", "2"))
+# PDFium n'est pas thread-safe, même sur des documents différents : le décodage des PDF est sérialisé
+_PDFIUM_LOCK = threading.Lock()
+
+class PayslipWorkerPool:
+    """Pool de workers en arrière-plan, chacun avec son propre processeur (modèle OCR déjà chargé)
+    
+    Les fichiers sont traités en parallèle, sans bloquer l'interface. Les résultats sont mis en cache
+    par contenu du fichier et version du processeur : un bulletin déjà traité n'est jamais ré-OCRisé.
+    """
+    
+    def __init__(self, processor_cls, num_workers, cache_size=256):
+        # Les modèles sont chargés une fois pour toutes, avant le premier fichier
+        self._processors = queue.Queue()
+        for _ in range(num_workers):
+            self._processors.put(processor_cls())
+        self.version = processor_cls.VERSION
+        self._executor = ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="payslip-worker")
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+    
+    def submit(self, data, file_name):
+        """Soumettre un fichier (bytes) : renvoie un Future dont le résultat est le dictionnaire extrait"""
+        key = (hashlib.sha256(data).hexdigest(), self.version, file_name)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+        return self._executor.submit(self._process, key, data, file_name)
+    
+    def _process(self, key, data, file_name):
+        from doctr.io import DocumentFile
+        
+        with _PDFIUM_LOCK:
+            pages = DocumentFile.from_pdf(data)
+        # Seul l'OCR tourne en parallèle. Chaque worker emprunte un processeur : un modèle n'est jamais
+        # utilisé par deux threads à la fois
+        processor = self._processors.get()
+        try:
+            result = processor.process_payslip_pages(pages, file_name)
+        finally:
+            self._processors.put(processor)
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
 # Importer les modules locaux seulement quand nécessaire
 @st.cache_resource
-def load_processor():
-    """Charger le processeur avec cache"""
+def load_worker_pool():
+    """Charger le pool de workers avec cache (un seul, partagé par toutes les sessions)"""
     try:
         # Import ici pour éviter les erreurs de chargement
         import sys
@@ -37,43 +95,54 @@ def load_processor():
         sys.path.append('/Users/maximejulien/Documents/GitHub/doctr')
         
         from payslip_processor import PayslipProcessor
-        processor = PayslipProcessor()
-        return processor, None
+        return PayslipWorkerPool(PayslipProcessor, NUM_WORKERS), None
     except Exception as e:
         return None, str(e)
 
-def process_uploaded_file(uploaded_file, processor):
-    """Traiter un fichier uploadé"""
-    try:
-        # Créer un fichier temporaire
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_path = tmp_file.name
-        
-        # Traiter le fichier
-        result = processor.process_single_payslip(tmp_path)
-        
-        # Nettoyer le fichier temporaire
-        Path(tmp_path).unlink()
-        
-        return result, None
+def show_batch_progress(batch):
+    """Afficher l'avancement du lot en cours, fichier par fichier. Renvoie True tant qu'il reste du travail"""
+    jobs = batch['jobs']
     
-    except Exception as e:
-        return None, str(e)
+    if not all(future.done() for _, future in jobs):
+        if st.button("⏹️ Annuler le traitement"):
+            # Les fichiers en attente sont abandonnés, ceux en cours de traitement vont jusqu'au bout
+            for _, future in jobs:
+                future.cancel()
+    
+    statuses = []
+    for name, future in jobs:
+        if future.cancelled():
+            status, error = "⏹️ Annulé", ""
+        elif future.done():
+            error = str(future.exception() or "")
+            status = "❌ Erreur" if error else "✅ Traité"
+        elif future.running():
+            status, error = "⏳ En cours", ""
+        else:
+            status, error = "🕒 En attente", ""
+        statuses.append({'Fichier': name, 'Statut': status, 'Erreur': error})
+    
+    finished = sum(1 for _, future in jobs if future.done())
+    st.progress(finished / len(jobs))
+    st.caption(f"{finished}/{len(jobs)} fichier(s) terminé(s)")
+    st.dataframe(pd.DataFrame(statuses), use_container_width=True)
+    
+    return finished < len(jobs)
 
 def main():
     """Interface principale"""
     
-    # Charger le processeur
-    processor, error = load_processor()
+    # Charger le pool de workers
+    pool, error = load_worker_pool()
     
-    if processor is None:
+    if pool is None:
         st.error(f"❌ Erreur lors du chargement du processeur: {error}")
         st.info("💡 Assurez-vous que docTR est correctement installé")
         return
     
     # Configuration dans la barre latérale
     st.sidebar.success("✅ Processeur chargé avec succès!")
+    st.sidebar.caption(f"{NUM_WORKERS} worker(s) en parallèle (variable d'environnement PAYSLIP_NUM_WORKERS)")
     
     max_file_size = st.sidebar.slider(
         "Taille max fichier (MB)", 
@@ -113,7 +182,7 @@ def main():
         # Vérifier la taille des fichiers
         oversized_files = []
         for file in uploaded_files:
-            file_size_mb = len(file.getvalue()) / (1024 * 1024)
+            file_size_mb = file.size / (1024 * 1024)
             if file_size_mb > max_file_size:
                 oversized_files.append((file.name, file_size_mb))
         
@@ -123,32 +192,26 @@ def main():
                 st.write(f"  - {name}: {size:.1f}MB (max: {max_file_size}MB)")
             return
         
-        # Traiter les fichiers
+        # Traiter les fichiers en arrière-plan : l'interface reste utilisable pendant le traitement
         if st.button("🚀 Traiter les bulletins", type="primary"):
-            
-            # Barre de progression
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            results = []
-            
-            for i, uploaded_file in enumerate(uploaded_files):
-                status_text.text(f"Traitement de {uploaded_file.name}...")
-                progress_bar.progress((i + 1) / len(uploaded_files))
-                
-                # Traiter le fichier
-                result, error = process_uploaded_file(uploaded_file, processor)
-                
-                if result:
-                    results.append(result)
-                    st.success(f"✅ {uploaded_file.name} traité avec succès")
-                else:
-                    st.error(f"❌ Erreur avec {uploaded_file.name}: {error}")
-            
-            status_text.text("Traitement terminé!")
-            
-            if results:
-                display_results(results, show_raw_text)
+            # getvalue() partage le buffer de l'upload, sans copie
+            st.session_state.batch = {
+                'jobs': [(file.name, pool.submit(file.getvalue(), file.name)) for file in uploaded_files]
+            }
+    
+    running = False
+    batch = st.session_state.get('batch')
+    if batch:
+        st.subheader("⏳ Traitement")
+        running = show_batch_progress(batch)
+        
+        # Les résultats s'affichent au fur et à mesure, dans l'ordre des fichiers
+        results = [
+            future.result() for _, future in batch['jobs']
+            if future.done() and not future.cancelled() and future.exception() is None
+        ]
+        if results:
+            display_results(results, show_raw_text)
     
     # Section d'aide
     st.markdown("---")
@@ -165,6 +228,11 @@ def main():
         - Vérifiez que le PDF n'est pas protégé par mot de passe
         - Utilisez les scripts en ligne de commande pour les gros volumes
         """)
+    
+    if running:
+        # Rafraîchir l'affichage jusqu'à la fin du lot
+        time.sleep(1)
+        st.rerun()
 
 def display_results(results, show_raw_text=False):
     """Afficher les résultats"""
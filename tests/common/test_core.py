@@ -1,3 +1,9 @@
+import importlib
+import inspect
+import pkgutil
+import subprocess
+import sys
+
 import pytest
 
 import doctr
@@ -12,3 +18,52 @@ def test_requires_package():
     requires_package("numpy")  # available
     with pytest.raises(ImportError):  # not available
         requires_package("non_existent_package")
+
+
+def test_lazy_import():
+    # Architectures & datasets are only imported on first access
+    code = (
+        "import sys, doctr.models, doctr.datasets\n"
+        "print([m for m in sys.modules if m.startswith(('doctr.models.', 'doctr.datasets.'))])\n"
+        "from doctr.models import ocr_predictor\n"
+        "print(any(m.startswith('doctr.models.recognition.master.') for m in sys.modules))\n"
+        # The architecture takes precedence over its submodule, even when the latter is imported first
+        "import doctr.models.recognition.parseq.pytorch\n"
+        "print(callable(doctr.models.recognition.parseq))\n"
+        # Same for the predictor, once `.zoo` imported the subpackage
+        "from doctr.models import kie_predictor\n"
+        "print(callable(kie_predictor))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split("\n")
+    assert set(eval(out[0])) == {
+        "doctr.models.classification",
+        "doctr.models.detection",
+        "doctr.models.kie_predictor",
+        "doctr.models.recognition",
+        "doctr.models.recognition.master",
+        "doctr.models.recognition.parseq",
+    }
+    assert out[1] == "False"
+    assert out[2] == "True"
+    assert out[3] == "True"
+
+    with pytest.raises(AttributeError):
+        doctr.models.non_existent_arch
+    assert "db_resnet50" in dir(doctr.models)
+
+    # Each package exports what its submodules export
+    for package, internal in (
+        (doctr.models.classification, {"predictor", "zoo"}),
+        (doctr.models.detection, {"_utils", "core", "predictor", "zoo"}),
+        (doctr.models.recognition, {"core", "predictor", "utils", "zoo"}),
+        (doctr.datasets, {"datasets"}),
+    ):
+        for submodule in pkgutil.iter_modules(package.__path__):
+            if submodule.name in internal - {"zoo"}:
+                continue
+            module = importlib.import_module(f".{submodule.name}", package.__name__)
+            names = getattr(module, "__all__", None) or [
+                name for name, value in vars(module).items() if not name.startswith("_") and not inspect.ismodule(value)
+            ]
+            assert set(names) <= set(package.__all__), submodule.name
+            assert all(getattr(package, name) is getattr(module, name) for name in names)
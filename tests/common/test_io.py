@@ -1,7 +1,9 @@
+import logging
 from io import BytesIO
 from pathlib import Path
 
 import numpy as np
+import pypdfium2 as pdfium
 import pytest
 import requests
 
@@ -27,6 +29,12 @@ def test_read_pdf(mock_pdf):
         doc = io.read_pdf(f.read())
     _check_doc_content(doc, 2)
 
+    # In-memory buffers & binary streams
+    with open(mock_pdf, "rb") as f:
+        content = f.read()
+    for file in (bytearray(content), memoryview(content), BytesIO(content).getbuffer(), BytesIO(content)):
+        _check_doc_content(io.read_pdf(file), 2)
+
     # Wrong input type
     with pytest.raises(TypeError):
         _ = io.read_pdf(123)
@@ -97,3 +105,52 @@ def test_pdf(mock_pdf):
     # As images
     num_pages = 2
     _check_doc_content(pages, num_pages)
+
+
+def _mock_ocr_result(values):
+    pages = [
+        io.Page(
+            None,
+            [
+                io.Block([
+                    io.Line([io.Word(value, 0.9, ((0.1, 0.1), (0.4, 0.15)), 0.9, {"value": 0, "confidence": None})])
+                ])
+            ],
+            idx,
+            (1754, 1240),
+        )
+        for idx, value in enumerate(values)
+    ]
+    return io.Document(pages)
+
+
+def test_write_searchable_pdf(mock_pdf, tmp_path, caplog):
+    doc = _mock_ocr_result(["jedi", "father"])
+    out = BytesIO()
+    io.write_searchable_pdf(mock_pdf, doc, out)
+    # Same rendering, with a text layer
+    for src_page, page in zip(io.read_pdf(mock_pdf), io.read_pdf(out.getvalue())):
+        assert np.array_equal(src_page, page)
+    pdf = pdfium.PdfDocument(out.getvalue())
+    assert [pdf[idx].get_textpage().get_text_bounded().strip() for idx in range(2)] == ["jedi", "father"]
+    left, bottom, right, top = pdf[0].get_textpage().get_charbox(0)
+    width, height = pdf[0].get_size()
+    assert abs(left / width - 0.1) < 0.01 and abs(1 - top / height - 0.1) < 0.01
+
+    with pytest.raises(ValueError):
+        io.write_searchable_pdf(mock_pdf, _mock_ocr_result(["a", "b", "c"]), BytesIO())
+
+    # Words that the font can't encode are left out
+    out = BytesIO()
+    with caplog.at_level(logging.WARNING):
+        io.write_searchable_pdf(mock_pdf, _mock_ocr_result(["déjà", "父亲"]), out)
+    pdf = pdfium.PdfDocument(out.getvalue())
+    assert [pdf[idx].get_textpage().get_text_bounded().strip() for idx in range(2)] == ["déjà", ""]
+    assert "1 word(s) not written" in caplog.text
+
+    # Batch
+    outputs = [tmp_path / f"out_{idx}.pdf" for idx in range(3)]
+    io.write_searchable_pdfs([mock_pdf] * 3, [doc] * 3, outputs, num_workers=2)
+    assert all(
+        pdfium.PdfDocument(output)[1].get_textpage().get_text_bounded().strip() == "father" for output in outputs
+    )
@@ -1,10 +1,11 @@
-from xml.etree.ElementTree import ElementTree
+import io
+from xml.etree.ElementTree import ElementTree, fromstring
 
 import numpy as np
 import pytest
 
 from doctr.file_utils import CLASS_NAME
-from doctr.io import elements
+from doctr.io import elements, load_document, save_document, write_alto, write_hocr
 
 
 def _mock_words(size=(1.0, 1.0), offset=(0, 0), confidence=0.9, objectness_score=0.9):
@@ -307,6 +308,119 @@ def test_block():
     }
 
 
+def test_word_table():
+    geometries = np.array([[0.0, 0.0, 0.25, 0.25], [0.25, 0.25, 0.5, 0.5], [0.5, 0.5, 0.75, 0.75]], dtype=np.float32)
+    table = elements.WordTable.from_columns(
+        values=["hello", "world", "!"],
+        confidences=np.array([0.9, 0.8, 0.7]),
+        geometries=geometries,
+        objectness_scores=np.array([0.9, 0.9, 0.9]),
+        crop_orientations=[{"value": 0, "confidence": None}, {"value": 180, "confidence": 0.6}]
+        + [{"value": 0, "confidence": None}],
+        line_offsets=np.array([0, 2, 3]),
+        block_offsets=np.array([0, 2]),
+    )
+
+    # Attribute checks
+    assert len(table) == 3 and table.num_lines == 2 and table.num_blocks == 1
+    assert table.values == ["hello", "world", "!"]
+
+    # Elements
+    blocks = table.to_blocks()
+    assert len(blocks) == 1 and len(blocks[0].lines) == 2
+    assert [len(line.words) for line in blocks[0].lines] == [2, 1]
+    word = blocks[0].lines[0].words[1]
+    assert word.value == "world" and word.confidence == 0.8
+    assert word.geometry == ((0.25, 0.25), (0.5, 0.5))
+    assert word.crop_orientation == {"value": 180, "confidence": 0.6}
+    assert blocks[0].lines[0].words[0].crop_orientation == {"value": 0, "confidence": None}
+    assert blocks[0].render() == "hello world\n!"
+
+    # Lazily built by the page
+    page = elements.Page(np.zeros((300, 200, 3), dtype=np.uint8), table, 0, (300, 200))
+    assert page._blocks is None
+    assert page.export()["blocks"] == [block.export() for block in blocks]
+    # Once built, the elements are the source of the text & columns: editing them is reflected there
+    assert page.blocks is page.blocks
+    page.blocks[0].lines[0].words[1].value = "there"
+    assert page.render() == "hello there\n!"
+    assert page.word_table.values == ["hello", "there", "!"]
+    assert page.export_words()["value"].tolist() == ["hello", "there", "!"]
+    assert page.render_with_offsets()[0] == "hello there\n!"
+    assert elements.Document([page]).render() == "hello there\n!"
+
+
+def test_page_fast_exports():
+    blocks = _mock_blocks()
+    # Reference: the nested export of the elements
+    expected_words = [
+        word
+        for block in elements.Page(np.zeros((300, 200, 3), dtype=np.uint8), blocks, 0, (300, 200)).export()["blocks"]
+        for line in block["lines"]
+        for word in line["words"]
+    ]
+    for page in (
+        elements.Page(np.zeros((300, 200, 3), dtype=np.uint8), blocks, 0, (300, 200)),
+        elements.Page(np.zeros((300, 200, 3), dtype=np.uint8), elements.WordTable.from_blocks(blocks), 1, (300, 200)),
+    ):
+        # Render
+        assert page.render() == "hello world\nhello world\n\nhello world\nhello world"
+        assert page.render(block_break="|", line_break="/") == "hello world/hello world|hello world/hello world"
+        text, line_spans = page.render_with_offsets()
+        assert line_spans.shape == (4, 2)
+        assert [text[start:end] for start, end in line_spans.tolist()] == ["hello world"] * 4
+
+        # Flat export
+        words = page.export_words()
+        assert words["value"].tolist() == ["hello", "world"] * 4
+        assert words["line_idx"].tolist() == [0, 0, 1, 1, 2, 2, 3, 3]
+        assert words["block_idx"].tolist() == [0, 0, 0, 0, 1, 1, 1, 1]
+        assert all(len(words[key]) == 8 for key in ("xmin", "ymin", "xmax", "ymax", "confidence", "crop_angle"))
+        assert np.isnan(words["crop_confidence"]).all()
+        # Same values as the nested export
+        np.testing.assert_allclose(
+            np.stack([words[key] for key in ("xmin", "ymin", "xmax", "ymax")], axis=1),
+            [np.ravel(word["geometry"]) for word in expected_words],
+        )
+        for key in ("confidence", "objectness_score"):
+            np.testing.assert_allclose(words[key], [word[key] for word in expected_words])
+        assert words["crop_angle"].tolist() == [word["crop_orientation"]["value"] for word in expected_words]
+        # Elements were not built
+        assert page._blocks is None or page.page_idx == 0
+
+    doc = elements.Document([
+        elements.Page(np.zeros((300, 200, 3), dtype=np.uint8), blocks, idx, (300, 200)) for idx in range(2)
+    ])
+    words = doc.export_words()
+    assert words["page_idx"].tolist() == [0] * 8 + [1] * 8
+    page_text = doc.pages[0].render(block_break="\n")
+    assert doc.render(page_break="\n", block_break="\n") == f"{page_text}\n{page_text}"
+    assert doc.render(line_break=" ") == "\n\n\n\n".join([doc.pages[0].render(line_break=" ")] * 2)
+
+    # Rotated boxes are exported as the coordinates of their 4 points
+    polygons = np.random.rand(3, 4, 2)
+    rotated_page = elements.Page(
+        np.zeros((300, 200, 3), dtype=np.uint8),
+        elements.WordTable.from_columns(
+            values=["a", "b", "c"],
+            confidences=np.array([0.9, 0.8, 0.7]),
+            geometries=polygons,
+            objectness_scores=np.array([0.5, 0.6, 0.7]),
+            crop_orientations=[{"value": 0, "confidence": None}] * 3,
+            line_offsets=np.array([0, 2, 3]),
+            block_offsets=np.array([0, 2]),
+        ),
+        0,
+        (300, 200),
+    )
+    words = rotated_page.export_words()
+    assert "xmin" not in words
+    expected_polygons = [word.geometry for block in rotated_page.blocks for line in block.lines for word in line.words]
+    for pt_idx in range(4):
+        np.testing.assert_allclose(words[f"x{pt_idx + 1}"], [polygon[pt_idx][0] for polygon in expected_polygons])
+        np.testing.assert_allclose(words[f"y{pt_idx + 1}"], [polygon[pt_idx][1] for polygon in expected_polygons])
+
+
 def test_page():
     page = np.zeros((300, 200, 3), dtype=np.uint8)
     page_idx = 0
@@ -489,3 +603,49 @@ def test_kie_document():
     # Synthesize
     img_list = doc.synthesize()
     assert isinstance(img_list, list) and len(img_list) == len(pages)
+
+
+def test_document_serialization(tmp_path):
+    for doc in (elements.Document(_mock_pages()), elements.KIEDocument(_mock_kie_pages())):
+        path = tmp_path / "doc.doctr"
+        save_document(doc, path)
+        loaded = load_document(path)
+        assert type(loaded) is type(doc)
+        assert loaded.export() == doc.export()
+        assert all(page.page is None for page in loaded.pages)
+        # Single page, with its image
+        save_document(doc, path, include_images=True)
+        loaded = load_document(path, page_indices=[1])
+        assert len(loaded.pages) == 1 and loaded.pages[0].page_idx == 1
+        assert np.array_equal(loaded.pages[0].page, doc.pages[1].page)
+        assert loaded.pages[0].export() == doc.pages[1].export()
+
+    # Lazy pages: arrays are read-only views on the file
+    save_document(elements.Document(_mock_pages()), path)
+    page = load_document(path).pages[0]
+    assert page._blocks is None and not page.word_table.geometries.flags.writeable
+    assert page.render() == "hello world\nhello world\n\nhello world\nhello world"
+
+    path.write_bytes(b"not a document")
+    with pytest.raises(ValueError):
+        load_document(path)
+
+
+def test_xml_writers():
+    for page in _mock_pages() + _mock_kie_pages():
+        f = io.BytesIO()
+        write_hocr(page, f)
+        hocr = fromstring(f.getvalue())
+        # Same content as the element tree export
+        ref = fromstring(page.export_as_xml()[0])
+        assert [(e.get("class"), e.get("title"), (e.text or "").strip()) for e in hocr.iter() if e.get("class")] == [
+            (e.get("class"), e.get("title"), (e.text or "").strip()) for e in ref.iter() if e.get("class")
+        ]
+        assert all("  " not in e.get("title") for e in ref.iter() if e.get("title"))
+
+        f = io.BytesIO()
+        write_alto(page, f, file_name="page<1>.jpg")
+        alto = fromstring(f.getvalue())
+        strings = alto.findall(".//{http://www.loc.gov/standards/alto/ns-v4#}String")
+        assert [s.get("CONTENT") for s in strings] == ["hello", "world"] * (len(strings) // 2)
+        assert alto.find(".//{http://www.loc.gov/standards/alto/ns-v4#}fileName").text == "page<1>.jpg"
@@ -7,6 +7,7 @@ import requests
 
 from doctr.io import reader
 from doctr.models._utils import estimate_orientation, get_language, invert_data_structure
+from doctr.models.predictor.base import _OCRPredictor
 from doctr.utils import geometry
 
 
@@ -88,3 +89,32 @@ def test_convert_list_dict():
 
     assert converted_dic == tar_dict
     assert converted_list == dic
+
+
+@pytest.mark.parametrize("angle", [-4, 2, 3])
+def test_rotate_loc_preds(angle):
+    page = np.full((900, 700, 3), 255, dtype=np.uint8)
+    # A word tilted by the page angle, which becomes straight once the page is straightened
+    polygon = cv2.boxPoints(((300, 400), (200, 30), angle))
+    cv2.fillPoly(page, [polygon.astype(np.int32)], (255, 0, 0))
+    rotated_page = geometry.rotate_image(page, angle, expand=True)
+    straight_page, offsets = geometry.remove_image_padding(rotated_page, return_offsets=True)
+    h, w = straight_page.shape[:2]
+    ys, xs = np.where((straight_page[..., 0] > 200) & (straight_page[..., 1] < 50))
+    expected = np.array([xs.min() / w, ys.min() / h, (xs.max() + 1) / w, (ys.max() + 1) / h])
+
+    # Straight boxes
+    loc_preds = np.array([[*polygon.min(axis=0) / (700, 900), *polygon.max(axis=0) / (700, 900), 0.9]])
+    out = _OCRPredictor._rotate_loc_preds(
+        loc_preds, angle, page.shape[:2], rotated_page.shape[:2], offsets, straight_page.shape[:2]
+    )
+    assert out.shape == (1, 5) and out[0, 4] == 0.9
+    assert np.allclose(out[0, :4], expected, atol=2 / 700)
+
+    # Rotated boxes
+    loc_preds = np.concatenate((polygon / (700, 900), [[0, 0.9]]))[None]
+    out = _OCRPredictor._rotate_loc_preds(
+        loc_preds, angle, page.shape[:2], rotated_page.shape[:2], offsets, straight_page.shape[:2]
+    )
+    assert out.shape == (1, 5, 2) and out[0, 4, 1] == 0.9
+    assert np.allclose(np.concatenate((out[0, :4].min(axis=0), out[0, :4].max(axis=0))), expected, atol=2 / 700)
@@ -228,3 +228,35 @@ def test_sort_boxes(input_boxes, sorted_idxs):
 def test_resolve_lines(input_boxes, lines):
     doc_builder = builder.DocumentBuilder()
     assert doc_builder._resolve_lines(np.asarray(input_boxes)) == lines
+
+
+@pytest.mark.parametrize("rotated", [False, True])
+def test_resolve_blocks(rotated, monkeypatch):
+    from scipy.cluster.hierarchy import fclusterdata
+
+    # Blocks used to be the flat clusters of `fclusterdata`: the KD-tree resolution must yield the same ones
+    features = []
+    kdtree_cls = builder.cKDTree
+
+    def _kdtree(data):
+        features.append(data)
+        return kdtree_cls(data)
+
+    monkeypatch.setattr(builder, "cKDTree", _kdtree)
+    rng = np.random.default_rng(42)
+    doc_builder = builder.DocumentBuilder()
+    for _ in range(10):
+        corners = rng.random((200, 2)) * 0.9
+        if rotated:
+            boxes = np.stack([corners, corners + [0.05, 0.01], corners + [0.05, 0.03], corners + [0, 0.02]], axis=1)
+        else:
+            boxes = np.concatenate([corners, corners + [0.05, 0.02]], axis=1)
+        lines = doc_builder._resolve_lines(boxes)
+        blocks = doc_builder._resolve_blocks(boxes, lines)
+
+        clusters = fclusterdata(features[-1], t=0.1, depth=4, criterion="distance", metric="euclidean")
+        expected: dict[int, list[list[int]]] = {}
+        for line, cluster_idx in zip(lines, clusters):
+            expected.setdefault(cluster_idx, []).append(line)
+        assert len(expected) > 1
+        assert blocks == list(expected.values())
@@ -96,3 +96,29 @@ def test_fast_postprocessor():
     assert all(all(v.shape[1] == 5 and v.shape[2] == 2 for v in sample) for sample in r_out)
     # Relative coords
     assert all(all(np.all(np.logical_and(v[:4] >= 0, v[:4] <= 1)) for v in sample) for sample in out)
+
+
+@pytest.mark.parametrize("postprocessor", [DBPostProcessor(), LinkNetPostProcessor(), FASTPostProcessor()])
+def test_straight_bitmap_to_boxes(postprocessor):
+    pred = np.zeros((100, 120), dtype=np.float32)
+    # A ring with an island in its hole, and a rectangle
+    pred[10:60, 10:60] = 0.9
+    pred[20:50, 20:50] = 0
+    pred[30:40, 30:40] = 0.8
+    pred[70:80, 70:110] = 0.6
+    bitmap = (pred >= postprocessor.bin_thresh).astype(np.uint8)
+    out = postprocessor.bitmap_to_boxes(pred, bitmap)
+    # The island is discarded like with external contours
+    assert out.shape == (2, 5)
+    out = out[np.argsort(out[:, 0])]
+    # Reference: contour bounding rect, box objectness & polygon expansion
+    for (x, y, w, h), box in zip([(10, 10, 50, 50), (70, 70, 40, 10)], out):
+        points = np.array([[x, y], [x, y + h], [x + w, y + h], [x + w, y]])
+        score = postprocessor.box_score(pred, points, assume_straight_pages=True)
+        _x, _y, _w, _h = postprocessor.polygon_to_box(points)
+        expected = np.clip([_x / 120, _y / 100, (_x + _w) / 120, (_y + _h) / 100, score], 0, 1)
+        assert np.allclose(box, expected, atol=1e-6)
+    # Weak boxes are filtered out
+    pred[70:80, 70:110] = postprocessor.box_thresh / 2
+    assert postprocessor.bitmap_to_boxes(pred, bitmap).shape == (1, 5)
+    assert postprocessor.bitmap_to_boxes(np.zeros_like(pred), np.zeros_like(bitmap)).shape == (0, 5)
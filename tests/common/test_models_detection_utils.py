@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from doctr.models.detection._utils import _remove_padding
+from doctr.models.detection._utils import _get_tile_origins, _merge_tile_preds, _remove_padding
 
 
 @pytest.mark.parametrize("pages", [[np.zeros((1000, 1000))], [np.zeros((1000, 2000))], [np.zeros((2000, 1000))]])
@@ -46,3 +46,52 @@ def test_remove_padding(pages, preserve_aspect_ratio, symmetric_pad, assume_stra
     result = _remove_padding(pages, loc_preds, preserve_aspect_ratio, symmetric_pad, assume_straight_pages)
     for res, exp in zip(result, expected):
         assert np.allclose(res["words"], exp["words"])
+
+
+@pytest.mark.parametrize(
+    "size, tile_size, overlap, expected",
+    [
+        [1024, 1024, 200, [0]],
+        [1754, 1024, 200, [0, 730]],
+        [2048, 1024, 200, [0, 824, 1024]],
+    ],
+)
+def test_get_tile_origins(size, tile_size, overlap, expected):
+    assert _get_tile_origins(size, tile_size, overlap) == expected
+
+
+@pytest.mark.parametrize("assume_straight_pages", [True, False])
+def test_merge_tile_preds(assume_straight_pages):
+    # Page of 100 x 180 covered by two tiles of 100 x 100 overlapping by 20 pixels
+    origins = [(0, 0), (0, 80)]
+    # A word seen by both tiles, a word cut by the inner border of the first tile, and a word in the second tile
+    tile_boxes = [
+        np.array([[0.85, 0.1, 0.95, 0.2, 0.9], [0.92, 0.5, 1.0, 0.6, 0.8]]),
+        np.array([[0.05, 0.1, 0.15, 0.2, 0.7], [0.05, 0.5, 0.2, 0.6, 0.8], [0.5, 0.5, 0.6, 0.6, 0.6]]),
+    ]
+    if not assume_straight_pages:
+        tile_boxes = [
+            np.concatenate(
+                (
+                    np.stack([boxes[:, [0, 1]], boxes[:, [2, 1]], boxes[:, [2, 3]], boxes[:, [0, 3]]], axis=1),
+                    np.stack([np.zeros_like(boxes[:, 4]), boxes[:, 4]], axis=1)[:, None],
+                ),
+                axis=1,
+            )
+            for boxes in tile_boxes
+        ]
+    out = _merge_tile_preds(
+        [{"words": boxes} for boxes in tile_boxes], origins, (100, 100), (100, 180), (20, 20), assume_straight_pages
+    )
+    boxes = out["words"]
+    if not assume_straight_pages:
+        boxes = np.concatenate((boxes[:, :4].min(axis=1), boxes[:, :4].max(axis=1), boxes[:, 4, 1:]), axis=1)
+    boxes = boxes[np.argsort(boxes[:, 1] + boxes[:, 0])]
+    assert np.allclose(
+        boxes,
+        np.array([
+            [85 / 180, 0.1, 95 / 180, 0.2, 0.9],
+            [85 / 180, 0.5, 100 / 180, 0.6, 0.8],
+            [130 / 180, 0.5, 140 / 180, 0.6, 0.6],
+        ]),
+    )
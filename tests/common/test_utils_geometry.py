@@ -152,6 +152,11 @@ def test_remove_image_padding():
     cropped = geometry.remove_image_padding(img)
     assert np.all(cropped == img)
 
+    # Offsets of the kept region
+    cropped, offsets = geometry.remove_image_padding(padded, return_offsets=True)
+    assert np.all(cropped == img)
+    assert offsets == (10, 20)
+
 
 @pytest.mark.parametrize(
     "abs_geoms, img_size, rel_geoms",
@@ -53,10 +53,10 @@ def _test_classification(model, input_shape, output_size, batch_size=2):
 )
 def test_classification_architectures(arch_name, input_shape, output_size):
     # Model
-    model = classification.__dict__[arch_name](pretrained=True).eval()
+    model = getattr(classification, arch_name)(pretrained=True).eval()
     _test_classification(model, input_shape, output_size)
     # Check that you can pretrained everything up until the last layer
-    assert classification.__dict__[arch_name](pretrained=True, num_classes=10)
+    assert getattr(classification, arch_name)(pretrained=True, num_classes=10)
     # Check from pretrained is a class method
     assert hasattr(model, "from_pretrained")
 
@@ -70,7 +70,7 @@ def test_classification_architectures(arch_name, input_shape, output_size):
 )
 def test_classification_models(arch_name, input_shape):
     batch_size = 8
-    model = classification.__dict__[arch_name](pretrained=False, input_shape=input_shape).eval()
+    model = getattr(classification, arch_name)(pretrained=False, input_shape=input_shape).eval()
     assert isinstance(model, torch.nn.Module)
     input_tensor = torch.rand((batch_size, *input_shape))
 
@@ -240,7 +240,7 @@ def test_page_orientation_model(mock_payslip):
 def test_models_onnx_export(arch_name, input_shape, output_size):
     # Model
     batch_size = 2
-    model = classification.__dict__[arch_name](pretrained=True).eval()
+    model = getattr(classification, arch_name)(pretrained=True).eval()
     dummy_input = torch.rand((batch_size, *input_shape), dtype=torch.float32)
     pt_logits = model(dummy_input).detach().cpu().numpy()
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -38,7 +38,7 @@ def test_detection_models(arch_name, input_shape, output_size, out_prob, train_m
         model = reparameterize(detection.fast_tiny(pretrained=True).eval())
         train_mode = False  # Reparameterized model is not trainable
     else:
-        model = detection.__dict__[arch_name](pretrained=True)
+        model = getattr(detection, arch_name)(pretrained=True)
         model = model.train() if train_mode else model.eval()
     assert isinstance(model, torch.nn.Module)
     input_tensor = torch.rand((batch_size, *input_shape))
@@ -117,6 +117,28 @@ def test_detection_zoo(arch_name):
     assert all((seq_map >= 0).all() and (seq_map <= 1).all() for seq_map in seq_maps)
 
 
+@pytest.mark.parametrize("assume_straight_pages", [True, False])
+def test_detection_predictor_tiled(assume_straight_pages):
+    predictor = detection.zoo.detection_predictor(
+        "fast_tiny",
+        pretrained=False,
+        pretrained_backbone=False,
+        assume_straight_pages=assume_straight_pages,
+        tiled=True,
+    )
+    assert predictor.tiled
+    pages = [
+        (255 * np.random.rand(1200, 1100, 3)).astype(np.uint8),
+        (255 * np.random.rand(600, 800, 3)).astype(np.uint8),
+    ]
+    out, seg_maps = predictor(pages, return_maps=True)
+    assert len(out) == len(seg_maps) == 2
+    assert all(isinstance(boxes[CLASS_NAME], np.ndarray) and boxes[CLASS_NAME].shape[1] == 5 for boxes in out)
+    assert all(np.all((boxes[CLASS_NAME] >= 0) & (boxes[CLASS_NAME] <= 1)) for boxes in out)
+    # Segmentation maps are stitched back at the page resolution
+    assert [seg_map.shape[:2] for seg_map in seg_maps] == [page.shape[:2] for page in pages]
+
+
 def test_fast_reparameterization():
     dummy_input = torch.rand((1, 3, 1024, 1024), dtype=torch.float32)
     base_model = detection.fast_tiny(pretrained=True, exportable=True).eval()
@@ -168,7 +190,7 @@ def test_models_onnx_export(arch_name, input_shape, output_size):
     if arch_name == "fast_tiny_rep":
         model = reparameterize(detection.fast_tiny(pretrained=True, exportable=True).eval())
     else:
-        model = detection.__dict__[arch_name](pretrained=True, exportable=True).eval()
+        model = getattr(detection, arch_name)(pretrained=True, exportable=True).eval()
     dummy_input = torch.rand((batch_size, *input_shape), dtype=torch.float32)
     pt_logits = model(dummy_input)["logits"].detach().cpu().numpy()
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -211,7 +233,7 @@ def test_torch_compiled_models(arch_name, mock_payslip):
     out, seg_maps = predictor(doc, return_maps=True)
 
     # Compile the model
-    compiled_model = torch.compile(detection.__dict__[arch_name](pretrained=True).eval())
+    compiled_model = torch.compile(getattr(detection, arch_name)(pretrained=True).eval())
     assert isinstance(compiled_model, _CompiledModule)
     compiled_predictor = detection.zoo.detection_predictor(compiled_model)
     compiled_out, seg_maps = compiled_predictor(doc, return_maps=True)
@@ -53,7 +53,7 @@ def test_push_to_hf_hub():
 )
 def test_models_huggingface_hub(arch_name, task_name, dummy_model_id, tmpdir):
     with tempfile.TemporaryDirectory() as tmp_dir:
-        model = models.__dict__[task_name].__dict__[arch_name](pretrained=True).eval()
+        model = getattr(getattr(models, task_name), arch_name)(pretrained=True).eval()
 
         _save_model_and_config_for_hf_hub(model, arch=arch_name, task=task_name, save_dir=tmp_dir)
 
@@ -41,3 +41,36 @@ def test_preprocessor(batch_size, output_size, input_tensor, expected_batches, e
     assert all(b.shape[-2:] == output_size for b in out)
     assert all(torch.all(b == expected_value) for b in out)
     assert len(repr(processor).split("\n")) == 4
+
+
+@pytest.mark.parametrize(
+    "preserve_aspect_ratio, symmetric_pad",
+    [
+        [False, False],
+        [True, False],
+        [True, True],
+    ],
+)
+def test_preprocessor_batch_crops(preserve_aspect_ratio, symmetric_pad):
+    processor = PreProcessor(
+        (32, 128), 2, preserve_aspect_ratio=preserve_aspect_ratio, symmetric_pad=symmetric_pad, mean=(0, 0, 0)
+    )
+    # Textured crops (up & down scaling): constant ones are resized to the same values by any interpolation
+    rng = np.random.default_rng(0)
+    crops = [
+        rng.integers(0, 256, size, dtype=np.uint8) for size in ((16, 32, 3), (64, 64, 3), (40, 90, 3), (33, 250, 3))
+    ] + [np.full((8, 300, 3), 255, dtype=np.uint8)]
+    # 3D & dtype checks
+    with pytest.raises(AssertionError):
+        processor.batch_crops([np.full((1, 16, 32, 3), 255, dtype=np.uint8)])
+    with pytest.raises(TypeError):
+        processor.batch_crops([np.ones((16, 32, 3), dtype=np.float32)])
+    assert processor.batch_crops([]) == []
+
+    out = processor.batch_crops(crops)
+    ref = processor(crops)
+    assert len(out) == len(ref) == 3
+    for batch, ref_batch in zip(out, ref):
+        assert batch.dtype == torch.float32 and batch.shape == ref_batch.shape
+        # Same resampling as the reference pipeline
+        assert torch.equal(batch, ref_batch)
@@ -38,7 +38,7 @@ system_available_memory = int(psutil.virtual_memory().available / 1024**3)
 )
 def test_recognition_models(arch_name, input_shape, train_mode, mock_vocab):
     batch_size = 4
-    model = recognition.__dict__[arch_name](vocab=mock_vocab, pretrained=True, input_shape=input_shape)
+    model = getattr(recognition, arch_name)(vocab=mock_vocab, pretrained=True, input_shape=input_shape)
     model = model.train() if train_mode else model.eval()
     assert isinstance(model, torch.nn.Module)
     input_tensor = torch.rand((batch_size, *input_shape))
@@ -148,7 +148,7 @@ def test_recognition_zoo(arch_name, input_shape):
 def test_models_onnx_export(arch_name, input_shape):
     # Model
     batch_size = 2
-    model = recognition.__dict__[arch_name](pretrained=True, exportable=True).eval()
+    model = getattr(recognition, arch_name)(pretrained=True, exportable=True).eval()
     dummy_input = torch.rand((batch_size, *input_shape), dtype=torch.float32)
     pt_logits = model(dummy_input)["logits"].detach().cpu().numpy()
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -191,7 +191,7 @@ def test_torch_compiled_models(arch_name, mock_text_box):
     out = predictor(doc)
 
     # Compile the model
-    compiled_model = torch.compile(recognition.__dict__[arch_name](pretrained=True).eval())
+    compiled_model = torch.compile(getattr(recognition, arch_name)(pretrained=True).eval())
     assert isinstance(compiled_model, _CompiledModule)
     compiled_predictor = recognition.zoo.recognition_predictor(compiled_model)
     compiled_out = compiled_predictor(doc)
@@ -1,14 +1,18 @@
 import os
 
+import numpy as np
 import pytest
 import torch
 from torch import nn
 
+from doctr.models import ocr_predictor
 from doctr.models.utils import (
     _bf16_to_float32,
     _copy_tensor,
     conv_sequence_pt,
+    load_predictor,
     load_pretrained_params,
+    save_predictor,
     set_device_and_dtype,
 )
 
@@ -48,6 +52,67 @@ def test_load_pretrained_params(tmpdir_factory):
         load_pretrained_params(model, url, cache_dir=str(cache_dir), ignore_keys=["2.weight"])
 
 
+def _is_file_backed(tensor, path):
+    address = tensor.data_ptr()
+    with open("/proc/self/maps") as f:
+        for line in f:
+            start, end = (int(bound, 16) for bound in line.split()[0].split("-"))
+            if start <= address < end:
+                return line.rstrip().endswith(path)
+    return False
+
+
+@pytest.mark.parametrize("env", ["", "TRUE"])
+def test_load_pretrained_params_mmap(tmpdir_factory, monkeypatch, env):
+    monkeypatch.setenv("DOCTR_MMAP_WEIGHTS", env)
+    path = str(tmpdir_factory.mktemp("checkpoints").join("checkpoint.pt"))
+    src_model = nn.Sequential(nn.Linear(8, 8), nn.BatchNorm1d(8), nn.Linear(8, 4))
+    torch.save(src_model.state_dict(), path)
+
+    model = nn.Sequential(nn.Linear(8, 8), nn.BatchNorm1d(8), nn.Linear(8, 4))
+    load_pretrained_params(model, path, mmap=True)
+    for (name, tensor), src_tensor in zip(model.state_dict().items(), src_model.state_dict().values()):
+        assert torch.equal(tensor, src_tensor)
+        # Tensors are views on the checkpoint (scalar buffers aside, which may be copied)
+        assert tensor.ndim == 0 or _is_file_backed(tensor, path), name
+    assert all(param.requires_grad for param in model.parameters())
+    # Modifying the model doesn't modify the checkpoint
+    with torch.no_grad():
+        model[0].weight.add_(1)
+    assert torch.equal(torch.load(path)["0.weight"], src_model[0].weight)
+
+    # Ignored keys & default mode
+    model = nn.Sequential(nn.Linear(8, 8), nn.BatchNorm1d(8), nn.Linear(8, 4))
+    load_pretrained_params(model, path, ignore_keys=["2.weight", "2.bias"])
+    assert _is_file_backed(model[0].weight, path) == (env == "TRUE")
+    assert not _is_file_backed(model[2].weight, path)
+    assert torch.equal(model[0].weight, src_model[0].weight)
+    # Explicitly disabled
+    model = nn.Sequential(nn.Linear(8, 8), nn.BatchNorm1d(8), nn.Linear(8, 4))
+    load_pretrained_params(model, path, mmap=False)
+    assert not _is_file_backed(model[0].weight, path)
+
+
+def test_load_pretrained_params_without_mmap_support(tmpdir_factory, monkeypatch):
+    from doctr.models.utils import pytorch as utils_pt
+
+    path = str(tmpdir_factory.mktemp("checkpoints").join("checkpoint.pt"))
+    src_model = nn.Sequential(nn.Linear(8, 8), nn.Linear(8, 4))
+    torch.save(src_model.state_dict(), path)
+    # torch<2.1 accepts neither `mmap` nor `assign`
+    torch_load, load_state_dict = torch.load, nn.Module.load_state_dict
+    monkeypatch.setattr(utils_pt, "_MMAP_SUPPORTED", False)
+    monkeypatch.setattr(torch, "load", lambda f, map_location=None: torch_load(f, map_location))
+    monkeypatch.setattr(
+        nn.Module, "load_state_dict", lambda self, state_dict, strict=True: load_state_dict(self, state_dict, strict)
+    )
+    for mmap in (None, False, True):
+        model = nn.Sequential(nn.Linear(8, 8), nn.Linear(8, 4))
+        load_pretrained_params(model, path, mmap=mmap)
+        assert torch.equal(model[0].weight, src_model[0].weight)
+        assert not _is_file_backed(model[0].weight, path)
+
+
 def test_conv_sequence():
     assert len(conv_sequence_pt(3, 8, kernel_size=3)) == 1
     assert len(conv_sequence_pt(3, 8, True, kernel_size=3)) == 2
@@ -66,3 +131,31 @@ def test_set_device_and_dtype():
     model, batches = set_device_and_dtype(model, batches, device="cpu", dtype=torch.float16)
     assert model[0].weight.dtype == torch.float16
     assert batches[0].dtype == torch.float16
+
+
+def test_save_load_predictor(tmpdir_factory):
+    folder = tmpdir_factory.mktemp("snapshots")
+    path = str(folder.join("predictor.pt"))
+    predictor = ocr_predictor("fast_tiny", "crnn_mobilenet_v3_small", pretrained=False, pretrained_backbone=False)
+    save_predictor(predictor, path)
+    # No temporary file left behind
+    assert os.listdir(folder) == ["predictor.pt"]
+
+    loaded = load_predictor(path)
+    assert type(loaded) is type(predictor)
+    # Weights are memory-mapped & the configuration is kept
+    weight = next(loaded.det_predictor.model.parameters())
+    assert torch.equal(weight, next(predictor.det_predictor.model.parameters()))
+    assert loaded.det_predictor.pre_processor.resize.size == predictor.det_predictor.pre_processor.resize.size
+    assert loaded.reco_predictor.model.vocab == predictor.reco_predictor.model.vocab
+    pages = [np.random.randint(0, 255, (256, 256, 3), dtype=np.uint8)]
+    assert loaded(pages).export() == predictor(pages).export()
+
+    # Compiled models can't be pickled
+    predictor.det_predictor.model = torch.compile(predictor.det_predictor.model)
+    with pytest.raises(ValueError):
+        save_predictor(predictor, path)
+    # Not a snapshot
+    torch.save(predictor.reco_predictor.model.state_dict(), path)
+    with pytest.raises(ValueError):
+        load_predictor(path)
@@ -383,8 +383,8 @@ def test_zoo_models(det_arch, reco_arch):
     _test_predictor(predictor)
 
     # passing model instance directly
-    det_model = detection.__dict__[det_arch](pretrained=True)
-    reco_model = recognition.__dict__[reco_arch](pretrained=True)
+    det_model = getattr(detection, det_arch)(pretrained=True)
+    reco_model = getattr(recognition, reco_arch)(pretrained=True)
     predictor = models.ocr_predictor(det_model, reco_model)
     _test_predictor(predictor)
 
@@ -401,8 +401,8 @@ def test_zoo_models(det_arch, reco_arch):
     _test_kiepredictor(predictor)
 
     # passing model instance directly
-    det_model = detection.__dict__[det_arch](pretrained=True)
-    reco_model = recognition.__dict__[reco_arch](pretrained=True)
+    det_model = getattr(detection, det_arch)(pretrained=True)
+    reco_model = getattr(recognition, reco_arch)(pretrained=True)
     predictor = models.kie_predictor(det_model, reco_model)
     _test_kiepredictor(predictor)
 
@@ -429,8 +429,8 @@ def test_end_to_end_torch_compile(det_arch, reco_arch, mock_payslip):
     assert isinstance(out, Document)
 
     # Compile the models
-    detection_model = torch.compile(detection.__dict__[det_arch](pretrained=True).eval())
-    recognition_model = torch.compile(recognition.__dict__[reco_arch](pretrained=True).eval())
+    detection_model = torch.compile(getattr(detection, det_arch)(pretrained=True).eval())
+    recognition_model = torch.compile(getattr(recognition, reco_arch)(pretrained=True).eval())
     crop_orientation_model = torch.compile(mobilenet_v3_small_crop_orientation(pretrained=True).eval())
     page_orientation_model = torch.compile(mobilenet_v3_small_page_orientation(pretrained=True).eval())
 